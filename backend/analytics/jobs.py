@@ -0,0 +1,17 @@
+# backend/analytics/jobs.py
+"""Tâches de l'app exécutées par `run_workers` (voir jobs.queue)"""
+
+from datetime import datetime, timezone as dt_timezone
+
+from jobs.queue import job
+from analytics.rollups import refresh_rollups
+
+
+@job('analytics.refresh_rollups')
+def refresh_rollups_job(full=False, since=None):
+    # `since` : date ou horodatage ISO 8601 (le payload est stocké en JSON), UTC par défaut
+    if since is not None:
+        since = datetime.fromisoformat(since)
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=dt_timezone.utc)
+    refresh_rollups(full=full, since=since)
@@ -0,0 +1,36 @@
+# backend/analytics/management/commands/refresh_analytics.py
+
+import time
+from datetime import datetime, time as dt_time, timezone as dt_timezone
+
+from django.core.management.base import BaseCommand, CommandError
+from analytics.rollups import refresh_rollups
+
+class Command(BaseCommand):
+    help = (
+        "Met à jour les rollups journaliers par certification (sessions, scores, taux de réussite, "
+        "erreurs par compétence) en ne recalculant que les journées touchées depuis le dernier passage"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help="Recalcule toutes les journées")
+        parser.add_argument('--since', help="Recalcule les journées touchées depuis cette date (AAAA-MM-JJ)")
+
+    def handle(self, *args, **options):
+        since = None
+        if options['since']:
+            try:
+                since = datetime.combine(
+                    datetime.strptime(options['since'], '%Y-%m-%d').date(), dt_time.min, tzinfo=dt_timezone.utc
+                )
+            except ValueError:
+                raise CommandError("--since doit être au format AAAA-MM-JJ.")
+
+        self.stdout.write("🔄 Rafraîchissement des rollups analytiques...")
+        start = time.perf_counter()
+        days = refresh_rollups(full=options['full'], since=since)
+        elapsed = time.perf_counter() - start
+        if days:
+            self.stdout.write(f"✅ {len(days)} journée(s) recalculée(s) ({days[0]} → {days[-1]}) en {elapsed:.2f} s")
+        else:
+            self.stdout.write("✅ Aucune journée à recalculer.")
@@ -0,0 +1,109 @@
+# Generated by Django 5.1.6 on 2026-10-18 16:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("certifications", "0006_examsession_date_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AnalyticsRefreshState",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50, unique=True)),
+                ("refreshed_until", models.DateTimeField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name="CertificationDailyStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("sessions_started", models.PositiveIntegerField(default=0)),
+                ("sessions_completed", models.PositiveIntegerField(default=0)),
+                ("mean_score", models.FloatField(blank=True, null=True)),
+                ("median_score", models.FloatField(blank=True, null=True)),
+                ("passed_sessions", models.PositiveIntegerField(default=0)),
+                (
+                    "certification",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_stats",
+                        to="certifications.certification",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("certification", "day"),
+                        name="unique_certification_daily_stats",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="CompetencyDailyStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("errors", models.PositiveIntegerField(default=0)),
+                (
+                    "certification",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="competency_daily_stats",
+                        to="certifications.certification",
+                    ),
+                ),
+                (
+                    "competency",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_stats",
+                        to="certifications.competency",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("certification", "day", "competency"),
+                        name="unique_competency_daily_stats",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,56 @@
+from django.db import models
+
+from certifications.models import Certification, Competency
+
+class CertificationDailyStats(models.Model):
+    """Indicateurs d'une certification pour une journée (UTC), calculés par `refresh_analytics`"""
+    certification = models.ForeignKey(Certification, on_delete=models.CASCADE, related_name='daily_stats')
+    day = models.DateField()
+    sessions_started = models.PositiveIntegerField(default=0)
+    sessions_completed = models.PositiveIntegerField(default=0)
+    mean_score = models.FloatField(null=True, blank=True)
+    median_score = models.FloatField(null=True, blank=True)
+    passed_sessions = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['certification', 'day'], name='unique_certification_daily_stats'),
+        ]
+
+    def pass_rate(self):
+        return (self.passed_sessions / self.sessions_completed * 100) if self.sessions_completed > 0 else None
+
+    def __str__(self):
+        return f"{self.certification_id} - {self.day}"
+
+
+class CompetencyDailyStats(models.Model):
+    """Réponses et erreurs par compétence, pour les sessions d'une certification complétées dans la journée"""
+    certification = models.ForeignKey(Certification, on_delete=models.CASCADE, related_name='competency_daily_stats')
+    competency = models.ForeignKey(Competency, on_delete=models.CASCADE, related_name='daily_stats')
+    day = models.DateField()
+    attempts = models.PositiveIntegerField(default=0)
+    errors = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['certification', 'day', 'competency'],
+                name='unique_competency_daily_stats',
+            ),
+        ]
+
+    def error_rate(self):
+        return (self.errors / self.attempts * 100) if self.attempts > 0 else None
+
+    def __str__(self):
+        return f"{self.certification_id} - {self.competency_id} - {self.day}"
+
+
+class AnalyticsRefreshState(models.Model):
+    """Borne haute (horodatage) des données déjà intégrées aux rollups"""
+    name = models.CharField(max_length=50, unique=True)
+    refreshed_until = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.name} ({self.refreshed_until})"
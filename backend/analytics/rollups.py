@@ -0,0 +1,136 @@
+# backend/analytics/rollups.py
+"""
+Calcul incrémental des rollups journaliers : seules les journées touchées depuis
+le dernier rafraîchissement sont recalculées à partir des tables brutes.
+"""
+
+import statistics
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from certifications.models import ExamSession, UserQuestionResponse
+from .models import AnalyticsRefreshState, CertificationDailyStats, CompetencyDailyStats
+
+REFRESH_STATE_NAME = 'daily_rollups'
+# Recouvrement avec le passage précédent : couvre les transactions encore ouvertes à la borne
+REFRESH_OVERLAP = timedelta(minutes=5)
+
+
+def day_bounds(day):
+    """Intervalle [début, fin[ d'une journée UTC, pour des filtres indexables"""
+    start = datetime.combine(day, time.min, tzinfo=dt_timezone.utc)
+    return start, start + timedelta(days=1)
+
+
+def touched_days(since, until):
+    """Journées ayant reçu une session démarrée ou complétée dans ]since, until]"""
+    days = set()
+    for field in ('started_at', 'completed_at'):
+        days.update(
+            ExamSession.objects
+            .filter(**{f'{field}__gt': since, f'{field}__lte': until})
+            .annotate(day=TruncDate(field))
+            .values_list('day', flat=True)
+            .distinct()
+        )
+    return sorted(days)
+
+
+def all_days():
+    days = set()
+    for field in ('started_at', 'completed_at'):
+        days.update(
+            ExamSession.objects.filter(**{f'{field}__isnull': False})
+            .annotate(day=TruncDate(field))
+            .values_list('day', flat=True)
+            .distinct()
+        )
+    return sorted(days)
+
+
+def refresh_day(day):
+    """Recalcule intégralement les rollups d'une journée, toutes certifications confondues"""
+    start, end = day_bounds(day)
+    pass_score = getattr(settings, 'ANALYTICS_PASS_SCORE', 85)
+
+    stats = {}
+
+    def stats_for(certification_id):
+        if certification_id not in stats:
+            stats[certification_id] = CertificationDailyStats(certification_id=certification_id, day=day)
+        return stats[certification_id]
+
+    for row in (
+        ExamSession.objects.filter(started_at__gte=start, started_at__lt=end)
+        .values('certification_id').annotate(total=Count('id')).order_by()
+    ):
+        stats_for(row['certification_id']).sessions_started = row['total']
+
+    scores = {}
+    for certification_id, score in ExamSession.objects.filter(
+        completed_at__gte=start, completed_at__lt=end
+    ).values_list('certification_id', 'score'):
+        stats_for(certification_id).sessions_completed += 1
+        if score is not None:
+            scores.setdefault(certification_id, []).append(score)
+    for certification_id, values in scores.items():
+        entry = stats[certification_id]
+        entry.mean_score = round(statistics.fmean(values), 2)
+        entry.median_score = round(statistics.median(values), 2)
+        entry.passed_sessions = sum(1 for value in values if value >= pass_score)
+
+    competency_stats = [
+        CompetencyDailyStats(
+            certification_id=row['exam_session__certification_id'],
+            competency_id=row['question__competencies'],
+            day=day,
+            attempts=row['attempts'],
+            errors=row['errors'],
+        )
+        for row in (
+            UserQuestionResponse.objects
+            .filter(
+                exam_session__completed_at__gte=start,
+                exam_session__completed_at__lt=end,
+                question__competencies__isnull=False,
+            )
+            .values('exam_session__certification_id', 'question__competencies')
+            .annotate(attempts=Count('id'), errors=Count('id', filter=Q(is_correct=False)))
+            .order_by()
+        )
+    ]
+
+    # Transaction courte par journée : remplacement atomique des lignes du jour
+    with transaction.atomic():
+        CertificationDailyStats.objects.filter(day=day).delete()
+        CompetencyDailyStats.objects.filter(day=day).delete()
+        CertificationDailyStats.objects.bulk_create(stats.values())
+        CompetencyDailyStats.objects.bulk_create(competency_stats)
+
+
+def refresh_rollups(full=False, since=None):
+    """
+    Rafraîchit les rollups et retourne les journées recalculées.
+    Par défaut, part de la borne enregistrée lors du précédent passage.
+    """
+    until = timezone.now()
+    state = AnalyticsRefreshState.objects.filter(name=REFRESH_STATE_NAME).first()
+    if full or (since is None and state is None):
+        days = all_days()
+        CertificationDailyStats.objects.exclude(day__in=days).delete()
+        CompetencyDailyStats.objects.exclude(day__in=days).delete()
+    else:
+        days = touched_days(since or state.refreshed_until - REFRESH_OVERLAP, until)
+
+    for day in days:
+        refresh_day(day)
+
+    AnalyticsRefreshState.objects.update_or_create(
+        name=REFRESH_STATE_NAME, defaults={'refreshed_until': until}
+    )
+    return days
@@ -0,0 +1,31 @@
+from rest_framework import serializers
+
+class CertificationAnalyticsSummarySerializer(serializers.Serializer):
+    certification_id = serializers.IntegerField()
+    certification_name = serializers.CharField()
+    sessions_started = serializers.IntegerField()
+    sessions_completed = serializers.IntegerField()
+    mean_score = serializers.FloatField(allow_null=True)
+    pass_rate = serializers.FloatField(allow_null=True)
+
+class CertificationDailyStatsSerializer(serializers.Serializer):
+    day = serializers.DateField()
+    sessions_started = serializers.IntegerField()
+    sessions_completed = serializers.IntegerField()
+    mean_score = serializers.FloatField(allow_null=True)
+    median_score = serializers.FloatField(allow_null=True)
+    pass_rate = serializers.FloatField(allow_null=True)
+
+class CompetencyErrorRateSerializer(serializers.Serializer):
+    competency_id = serializers.IntegerField()
+    name = serializers.CharField()
+    attempts = serializers.IntegerField()
+    errors = serializers.IntegerField()
+    error_rate = serializers.FloatField(allow_null=True)
+
+class CertificationAnalyticsDetailSerializer(serializers.Serializer):
+    certification_id = serializers.IntegerField()
+    start = serializers.DateField()
+    end = serializers.DateField()
+    days = CertificationDailyStatsSerializer(many=True)
+    competencies = CompetencyErrorRateSerializer(many=True)
@@ -0,0 +1,168 @@
+from datetime import date, datetime, timezone as dt_timezone
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from certifications.models import (
+    Answer,
+    Certification,
+    CertificationCompetency,
+    Competency,
+    ExamSession,
+    Question,
+    UserQuestionResponse,
+)
+from analytics.models import AnalyticsRefreshState, CertificationDailyStats, CompetencyDailyStats
+from analytics.rollups import refresh_rollups
+
+User = get_user_model()
+
+DAY_1 = date(2026, 3, 2)
+DAY_2 = date(2026, 3, 3)
+
+
+def at(day, hour=10):
+    return datetime(day.year, day.month, day.day, hour, tzinfo=dt_timezone.utc)
+
+
+class AnalyticsFixtureMixin:
+    def create_fixture(self):
+        self.user = User.objects.create_user(username="user", email="user@example.com", password="userpass")
+        self.certification = Certification.objects.create(name="Cert Analytics")
+        self.competency = Competency.objects.create(name="Comp Analytics")
+        CertificationCompetency.objects.create(certification=self.certification, competency=self.competency)
+        self.question = Question.objects.create(text="Question analytics")
+        self.question.competencies.add(self.competency)
+        self.good = Answer.objects.create(question=self.question, text="Oui", is_correct=True)
+        self.bad = Answer.objects.create(question=self.question, text="Non")
+
+    def create_session(self, day, score=None, correct=None):
+        """Session démarrée `day` ; complétée le même jour si un score est fourni"""
+        session = ExamSession.objects.create(user=self.user, certification=self.certification)
+        ExamSession.objects.filter(pk=session.pk).update(
+            started_at=at(day),
+            completed_at=at(day, 11) if score is not None else None,
+            score=score,
+        )
+        if correct is not None:
+            UserQuestionResponse.objects.create(
+                exam_session=session,
+                question=self.question,
+                selected_answer=self.good if correct else self.bad,
+                correct_answer=self.good,
+                is_correct=correct,
+            )
+        return session
+
+
+class AnalyticsRollupTests(AnalyticsFixtureMixin, TestCase):
+    def setUp(self):
+        self.create_fixture()
+
+    def test_full_refresh_computes_daily_stats(self):
+        self.create_session(DAY_1, score=90.0, correct=True)
+        self.create_session(DAY_1, score=50.0, correct=False)
+        self.create_session(DAY_1, score=70.0, correct=False)
+        self.create_session(DAY_1)
+
+        days = refresh_rollups(full=True)
+
+        self.assertEqual(days, [DAY_1])
+        stats = CertificationDailyStats.objects.get(certification=self.certification, day=DAY_1)
+        self.assertEqual(stats.sessions_started, 4)
+        self.assertEqual(stats.sessions_completed, 3)
+        self.assertEqual(stats.mean_score, 70.0)
+        self.assertEqual(stats.median_score, 70.0)
+        self.assertEqual(stats.passed_sessions, 1)
+        competency_stats = CompetencyDailyStats.objects.get(competency=self.competency, day=DAY_1)
+        self.assertEqual((competency_stats.attempts, competency_stats.errors), (3, 2))
+
+    def test_incremental_refresh_only_recomputes_touched_days(self):
+        self.create_session(DAY_1, score=90.0)
+        refresh_rollups(full=True)
+        AnalyticsRefreshState.objects.update(refreshed_until=at(DAY_1, 12))
+
+        # Session arrivée après le passage précédent, sur une autre journée
+        self.create_session(DAY_2, score=40.0)
+        days = refresh_rollups()
+
+        self.assertEqual(days, [DAY_2])
+        self.assertEqual(CertificationDailyStats.objects.get(day=DAY_1).sessions_completed, 1)
+        self.assertEqual(CertificationDailyStats.objects.get(day=DAY_2).mean_score, 40.0)
+
+    def test_refresh_without_changes_recomputes_nothing(self):
+        self.create_session(DAY_1, score=90.0)
+        refresh_rollups(full=True)
+
+        self.assertEqual(refresh_rollups(), [])
+
+    def test_full_refresh_drops_days_without_sessions(self):
+        session = self.create_session(DAY_1, score=90.0)
+        refresh_rollups(full=True)
+        session.delete()
+
+        refresh_rollups(full=True)
+
+        self.assertFalse(CertificationDailyStats.objects.exists())
+
+    def test_command_reports_refreshed_days(self):
+        self.create_session(DAY_1, score=90.0)
+        self.create_session(DAY_2, score=90.0)
+        out = StringIO()
+
+        call_command('refresh_analytics', '--since', '2026-03-03', stdout=out)
+
+        self.assertIn("1 journée(s) recalculée(s)", out.getvalue())
+        self.assertEqual(list(CertificationDailyStats.objects.values_list('day', flat=True)), [DAY_2])
+
+
+class AnalyticsAPITests(AnalyticsFixtureMixin, APITestCase):
+    def setUp(self):
+        self.create_fixture()
+        self.admin = User.objects.create_superuser(username="admin", email="admin@example.com", password="adminpass")
+        self.create_session(DAY_1, score=90.0, correct=True)
+        self.create_session(DAY_1, score=50.0, correct=False)
+        self.create_session(DAY_2, score=100.0, correct=True)
+        refresh_rollups(full=True)
+        self.client.force_authenticate(user=self.admin)
+
+    def test_summary_aggregates_over_range(self):
+        with self.assertNumQueries(1):
+            response = self.client.get("/analytics/certifications/", {"start": "2026-03-01", "end": "2026-03-31"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [{
+            "certification_id": self.certification.pk,
+            "certification_name": "Cert Analytics",
+            "sessions_started": 3,
+            "sessions_completed": 3,
+            "mean_score": 80.0,
+            "pass_rate": 66.67,
+        }])
+
+    def test_daily_returns_series_and_competency_error_rates(self):
+        url = f"/analytics/certifications/{self.certification.pk}/daily/"
+        with self.assertNumQueries(3):
+            response = self.client.get(url, {"start": "2026-03-02", "end": "2026-03-02"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([day["day"] for day in response.data["days"]], ["2026-03-02"])
+        self.assertEqual(response.data["days"][0]["pass_rate"], 50.0)
+        self.assertEqual(response.data["competencies"][0]["error_rate"], 50.0)
+
+    def test_invalid_range_is_rejected(self):
+        response = self.client.get("/analytics/certifications/", {"start": "2026-03-31", "end": "2026-03-01"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_unknown_certification_returns_404(self):
+        response = self.client.get("/analytics/certifications/9999/daily/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_non_admin_is_forbidden(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get("/analytics/certifications/")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
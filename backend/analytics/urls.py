@@ -0,0 +1,8 @@
+from django.urls import path
+from .views import CertificationAnalyticsListView, CertificationAnalyticsDailyView
+
+urlpatterns = [
+    # Endpoints d'analytique (admin), servis depuis les rollups journaliers
+    path('certifications/', CertificationAnalyticsListView.as_view(), name='analytics-certifications'),
+    path('certifications/<int:certification_id>/daily/', CertificationAnalyticsDailyView.as_view(), name='analytics-certification-daily'),
+]
@@ -0,0 +1,125 @@
+from datetime import date, timedelta
+
+from django.db.models import F, FloatField, Q, Sum
+from django.db.models.functions import Cast
+from django.utils import timezone
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from certifications.models import Certification
+from .models import CertificationDailyStats, CompetencyDailyStats
+from .serializers import CertificationAnalyticsDetailSerializer, CertificationAnalyticsSummarySerializer
+
+DEFAULT_RANGE_DAYS = 30
+
+RANGE_PARAMETERS = [
+    OpenApiParameter('start', date, description="Premier jour inclus (AAAA-MM-JJ, défaut : il y a 30 jours)"),
+    OpenApiParameter('end', date, description="Dernier jour inclus (AAAA-MM-JJ, défaut : aujourd'hui)"),
+]
+
+
+def parse_range(request):
+    """Retourne (start, end) depuis les paramètres de requête, ou lève ValueError"""
+    end = request.query_params.get('end')
+    end = date.fromisoformat(end) if end else timezone.now().date()
+    start = request.query_params.get('start')
+    start = date.fromisoformat(start) if start else end - timedelta(days=DEFAULT_RANGE_DAYS - 1)
+    if start > end:
+        raise ValueError
+    return start, end
+
+
+def percentage(part, total):
+    return round(part / total * 100, 2) if total else None
+
+
+@extend_schema(parameters=RANGE_PARAMETERS, responses=CertificationAnalyticsSummarySerializer(many=True))
+class CertificationAnalyticsListView(APIView):
+    """Indicateurs par certification sur une période, lus uniquement dans les rollups journaliers (admin)"""
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            start, end = parse_range(request)
+        except ValueError:
+            return Response({"error": "Période invalide (start et end au format AAAA-MM-JJ, start <= end)."}, status=status.HTTP_400_BAD_REQUEST)
+
+        rows = (
+            CertificationDailyStats.objects
+            .filter(day__gte=start, day__lte=end)
+            .values('certification_id', 'certification__name')
+            .annotate(
+                started=Sum('sessions_started'),
+                completed=Sum('sessions_completed'),
+                passed=Sum('passed_sessions'),
+                # Moyenne pondérée des moyennes journalières
+                score_total=Sum(F('mean_score') * Cast('sessions_completed', FloatField()), filter=Q(mean_score__isnull=False)),
+                scored=Sum('sessions_completed', filter=Q(mean_score__isnull=False)),
+            )
+            .order_by('certification__name')
+        )
+        data = [
+            {
+                "certification_id": row['certification_id'],
+                "certification_name": row['certification__name'],
+                "sessions_started": row['started'],
+                "sessions_completed": row['completed'],
+                "mean_score": round(row['score_total'] / row['scored'], 2) if row['scored'] else None,
+                "pass_rate": percentage(row['passed'], row['completed']),
+            }
+            for row in rows
+        ]
+        return Response(CertificationAnalyticsSummarySerializer(data, many=True).data, status=status.HTTP_200_OK)
+
+
+@extend_schema(parameters=RANGE_PARAMETERS, responses=CertificationAnalyticsDetailSerializer)
+class CertificationAnalyticsDailyView(APIView):
+    """Série journalière d'une certification et taux d'erreur par compétence sur la période (admin)"""
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, certification_id, *args, **kwargs):
+        try:
+            start, end = parse_range(request)
+        except ValueError:
+            return Response({"error": "Période invalide (start et end au format AAAA-MM-JJ, start <= end)."}, status=status.HTTP_400_BAD_REQUEST)
+        if not Certification.objects.filter(pk=certification_id).exists():
+            return Response({"error": "Certification introuvable."}, status=status.HTTP_404_NOT_FOUND)
+
+        days = [
+            {
+                "day": entry.day,
+                "sessions_started": entry.sessions_started,
+                "sessions_completed": entry.sessions_completed,
+                "mean_score": entry.mean_score,
+                "median_score": entry.median_score,
+                "pass_rate": percentage(entry.passed_sessions, entry.sessions_completed),
+            }
+            for entry in CertificationDailyStats.objects.filter(
+                certification_id=certification_id, day__gte=start, day__lte=end
+            ).order_by('day')
+        ]
+        competencies = [
+            {
+                "competency_id": row['competency_id'],
+                "name": row['competency__name'],
+                "attempts": row['total_attempts'],
+                "errors": row['total_errors'],
+                "error_rate": percentage(row['total_errors'], row['total_attempts']),
+            }
+            for row in (
+                CompetencyDailyStats.objects
+                .filter(certification_id=certification_id, day__gte=start, day__lte=end)
+                .values('competency_id', 'competency__name')
+                .annotate(total_attempts=Sum('attempts'), total_errors=Sum('errors'))
+                .order_by('competency__name')
+            )
+        ]
+        # Les compétences les plus ratées en premier
+        competencies.sort(key=lambda row: row['error_rate'] or 0, reverse=True)
+
+        data = {"certification_id": certification_id, "start": start, "end": end, "days": days, "competencies": competencies}
+        return Response(CertificationAnalyticsDetailSerializer(data).data, status=status.HTTP_200_OK)
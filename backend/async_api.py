@@ -0,0 +1,65 @@
+"""
+Outils des vues async servies sous ASGI (backend/asgi_urls.py).
+
+Sous ASGI, une vue DRF synchrone traverse un thread (sync_to_async) à chaque requête.
+Les lectures chaudes ont une implémentation async : authentification JWT servie depuis
+le cache des jetons sans quitter la boucle d'événements, ORM async pour le reste.
+Les autres méthodes HTTP (écritures, OPTIONS) restent confiées à la vue DRF d'origine.
+"""
+
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from rest_framework.exceptions import APIException, NotAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from authentication.authentication import CachedJWTAuthentication
+
+_renderer = JSONRenderer()
+_authenticator = CachedJWTAuthentication()
+
+
+def json_response(data, status=200, headers=None):
+    """Réponse JSON rendue comme par DRF (même encodage des dates, décimaux…)"""
+    return HttpResponse(_renderer.render(data), status=status, content_type='application/json', headers=headers)
+
+
+def error_response(exc):
+    """Réponse d'erreur au format du gestionnaire d'exceptions DRF"""
+    data = exc.detail if isinstance(exc.detail, dict) else {"detail": exc.detail}
+    headers = None
+    if exc.status_code == 401:
+        headers = {'WWW-Authenticate': _authenticator.authenticate_header(None)}
+    return json_response(data, status=exc.status_code, headers=headers)
+
+
+def authenticated(view):
+    """Vue async réservée aux utilisateurs authentifiés par JWT (équivalent de IsAuthenticated)"""
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        try:
+            result = await _authenticator.aauthenticate(request)
+        except APIException as exc:
+            return error_response(exc)
+        if result is None:
+            return error_response(NotAuthenticated())
+        drf_request = Request(request)
+        # Comme DRF : l'utilisateur est aussi répercuté sur la requête Django (middleware Server-Timing)
+        drf_request.user, drf_request.auth = result
+        return await view(drf_request, *args, **kwargs)
+    return wrapper
+
+
+def read_async(get, fallback):
+    """Vue async : GET servi par `get`, les autres méthodes par la vue synchrone `fallback` (dans un thread)"""
+    fallback = sync_to_async(fallback)
+
+    async def view(request, *args, **kwargs):
+        if request.method == 'GET':
+            return await get(request, *args, **kwargs)
+        return await fallback(request, *args, **kwargs)
+
+    view.csrf_exempt = True  # Comme les vues DRF : authentification par jeton, pas par cookie
+    return view
@@ -5,3 +5,5 @@ class AuthenticationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'authentication'  # ✅ Doit être 'authentication', PAS 'auth'
 
+    def ready(self):
+        from . import checks, schema, signals  # noqa: F401  Vérifications, extension OpenAPI et receivers
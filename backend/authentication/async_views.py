@@ -0,0 +1,9 @@
+# backend/authentication/async_views.py
+"""Accueil pour ASGI (voir async_api) : même réponse que home_api, sans requête SQL si le jeton est en cache"""
+
+from async_api import authenticated, json_response
+
+
+@authenticated
+async def home(request):
+    return json_response({"message": "Bienvenue sur l'API !", "user": request.user.username})
@@ -0,0 +1,125 @@
+# backend/authentication/authentication.py
+"""
+Authentification JWT avec cache local des jetons déjà vérifiés.
+
+Un jeton d'accès est vérifié (signature HS256, expiration) et son utilisateur chargé
+une seule fois : les requêtes suivantes avec le même jeton retrouvent un instantané
+de l'utilisateur dans un LRU borné (JWT_AUTH_CACHE_SIZE entrées, JWT_AUTH_CACHE_TTL
+secondes, jamais au-delà de l'expiration du jeton). Aucune requête SQL, aucun calcul de signature.
+
+Le cache est propre au processus : les signaux de `authentication.signals` l'invalident
+à chaque modification ou suppression d'un utilisateur dans ce processus ; ailleurs,
+le TTL borne la durée pendant laquelle un changement (désactivation…) peut être ignoré.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+
+class TokenUserCache:
+    """LRU borné et à durée de vie limitée : empreinte du jeton -> (instantané utilisateur, jeton validé)"""
+
+    def __init__(self):
+        self.entries = OrderedDict()  # empreinte -> (expiration, user_id, valeurs, jeton validé)
+        self.digests_by_user = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def max_entries():
+        return getattr(settings, 'JWT_AUTH_CACHE_SIZE', 10000)
+
+    @staticmethod
+    def ttl():
+        return getattr(settings, 'JWT_AUTH_CACHE_TTL', 60)
+
+    def get(self, digest):
+        with self.lock:
+            entry = self.entries.get(digest)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                self._remove(digest)
+                return None
+            self.entries.move_to_end(digest)
+            return entry
+
+    def set(self, digest, user, validated_token):
+        if self.max_entries() <= 0:
+            return
+        expires_at = min(time.time() + self.ttl(), validated_token.get('exp', 0))
+        # Instantané : valeurs des champs concrets, réhydratées à chaque requête
+        values = tuple(getattr(user, field.attname) for field in user._meta.concrete_fields)
+        with self.lock:
+            if digest in self.entries:
+                self._remove(digest)
+            self.entries[digest] = (expires_at, user.pk, values, validated_token)
+            self.digests_by_user.setdefault(user.pk, set()).add(digest)
+            while len(self.entries) > self.max_entries():
+                self._remove(next(iter(self.entries)))
+
+    def invalidate_user(self, user_id):
+        with self.lock:
+            for digest in self.digests_by_user.pop(user_id, ()):
+                self.entries.pop(digest, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.digests_by_user.clear()
+
+    def _remove(self, digest):
+        _, user_id, _, _ = self.entries.pop(digest)
+        digests = self.digests_by_user.get(user_id)
+        if digests is not None:
+            digests.discard(digest)
+            if not digests:
+                del self.digests_by_user[user_id]
+
+
+token_user_cache = TokenUserCache()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication de simplejwt, avec les jetons déjà vérifiés servis depuis `token_user_cache`"""
+
+    def authenticate(self, request):
+        raw_token = self.raw_token(request)
+        if raw_token is None:
+            return None
+        return self.from_cache(raw_token) or self.authenticate_token(raw_token)
+
+    async def aauthenticate(self, request):
+        """Variante pour les vues async : un jeton en cache est servi sans quitter la boucle d'événements"""
+        raw_token = self.raw_token(request)
+        if raw_token is None:
+            return None
+        return self.from_cache(raw_token) or await sync_to_async(self.authenticate_token)(raw_token)
+
+    def raw_token(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        return self.get_raw_token(header)
+
+    def from_cache(self, raw_token):
+        entry = token_user_cache.get(hashlib.sha256(raw_token).hexdigest())
+        if entry is None:
+            return None
+        _, _, values, validated_token = entry
+        # Instance neuve à chaque requête : aucune modification ne fuit d'une requête à l'autre
+        user = self.user_model.from_db(
+            None, [field.attname for field in self.user_model._meta.concrete_fields], values
+        )
+        return user, validated_token
+
+    def authenticate_token(self, raw_token):
+        validated_token = self.get_validated_token(raw_token)
+        user = self.get_user(validated_token)
+        token_user_cache.set(hashlib.sha256(raw_token).hexdigest(), user, validated_token)
+        return user, validated_token
@@ -0,0 +1,21 @@
+# backend/authentication/checks.py
+
+from django.core import checks
+
+from shared_cache import is_shared_cache
+from .tokens import revocation_cache_alias
+
+
+@checks.register(checks.Tags.security, deploy=True)
+def check_revocation_cache(app_configs, **kwargs):
+    alias = revocation_cache_alias()
+    if is_shared_cache(alias):
+        return []
+    return [
+        checks.Warning(
+            f"JWT_REVOCATION_CACHE ('{alias}') est propre à chaque processus : l'état des chaînes de "
+            "refresh tokens n'est pas mis en cache, chaque rafraîchissement interroge BlacklistedToken.",
+            hint="Pointer JWT_REVOCATION_CACHE vers un cache partagé (Redis, memcached).",
+            id='authentication.W001',
+        )
+    ]
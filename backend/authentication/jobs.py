@@ -0,0 +1,42 @@
+# backend/authentication/jobs.py
+"""Tâches de l'app exécutées par `run_workers` (voir jobs.queue)"""
+
+from django.contrib.auth import get_user_model
+from django.core.mail import send_mail
+from django.db import transaction
+from django.utils.crypto import get_random_string
+from jobs.queue import job
+from authentication.purge import purge_expired_tokens
+
+PASSWORD_RESET_EMAIL = 'authentication.send_password_reset_email'
+
+User = get_user_model()
+
+
+@job(PASSWORD_RESET_EMAIL)
+def send_password_reset_email(user_id):
+    """
+    Génère, enregistre et envoie le nouveau mot de passe : la tâche ne porte que l'id de
+    l'utilisateur, aucun mot de passe n'est écrit dans la file (tâches en échec comprises).
+    L'email part dans la transaction du changement : s'il échoue, l'ancien mot de passe reste
+    valide et le nouvel essai en génère un autre.
+    """
+    user = User.objects.filter(pk=user_id).first()
+    if user is None:
+        return  # Utilisateur supprimé depuis la demande
+    new_password = get_random_string(length=12)
+    with transaction.atomic():
+        user.set_password(new_password)
+        user.save()
+        send_mail(
+            subject="Réinitialisation de votre mot de passe",
+            message=f"Bonjour {user.username}, votre nouveau mot de passe est : {new_password}",
+            from_email="no-reply@scrumforge.com",
+            recipient_list=[user.email],
+            fail_silently=False,
+        )
+
+
+@job('authentication.purge_expired_tokens')
+def purge_expired_tokens_job(batch_size=1000):
+    purge_expired_tokens(batch_size=batch_size)
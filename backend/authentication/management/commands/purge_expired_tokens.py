@@ -0,0 +1,42 @@
+# backend/authentication/management/commands/purge_expired_tokens.py
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from authentication.purge import purge_expired_tokens
+
+class Command(BaseCommand):
+    help = (
+        "Supprime par lots les refresh tokens expirés (OutstandingToken et BlacklistedToken), "
+        "une transaction courte par lot"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help="Jetons supprimés par transaction")
+        parser.add_argument('--pause', type=float, default=0.0, help="Pause entre deux lots (secondes)")
+        parser.add_argument(
+            '--interval', type=float, default=0,
+            help="Relance la purge toutes les N secondes (processus permanent) ; 0 : un seul passage",
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] <= 0:
+            raise CommandError("--batch-size doit être strictement positif.")
+        if options['pause'] < 0 or options['interval'] < 0:
+            raise CommandError("--pause et --interval doivent être positifs.")
+
+        while True:
+            self.purge(options['batch_size'], options['pause'])
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
+
+    def purge(self, batch_size, pause):
+        self.stdout.write("🧹 Purge des refresh tokens expirés...")
+        stats = purge_expired_tokens(batch_size=batch_size, pause=pause)
+        removed = stats["outstanding"] + stats["blacklisted"]
+        rate = removed / stats["seconds"] if stats["seconds"] else 0
+        self.stdout.write(
+            f"✅ {stats['outstanding']} jeton(s) et {stats['blacklisted']} entrée(s) de blacklist supprimés "
+            f"en {stats['seconds']:.2f} s ({rate:.0f} lignes/s)"
+        )
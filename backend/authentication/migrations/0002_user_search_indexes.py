@@ -0,0 +1,56 @@
+# Generated by Django 5.1.6 on 2026-10-18 16:17
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+# PostgreSQL uniquement : trigrammes pour la recherche par sous-chaîne (LIKE '%q%')
+# et text_pattern_ops pour le préfixe (LIKE 'q%') quelle que soit la collation.
+POSTGRES_SEARCH_INDEXES = [
+    ("user_username_trgm_idx", "gin (lower(username) gin_trgm_ops)"),
+    ("user_email_trgm_idx", "gin (lower(email) gin_trgm_ops)"),
+    ("user_username_prefix_idx", "btree (lower(username) text_pattern_ops)"),
+    ("user_email_prefix_idx", "btree (lower(email) text_pattern_ops)"),
+]
+
+
+def create_postgres_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, definition in POSTGRES_SEARCH_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON authentication_customuser USING {definition}"
+        )
+
+
+def drop_postgres_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _ in POSTGRES_SEARCH_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("authentication", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                django.db.models.functions.text.Lower("username"),
+                name="user_username_lower_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                django.db.models.functions.text.Lower("email"),
+                name="user_email_lower_idx",
+            ),
+        ),
+        migrations.RunPython(create_postgres_search_indexes, drop_postgres_search_indexes),
+    ]
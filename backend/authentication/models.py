@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Lower
 
 class CustomUser(AbstractUser):
     """
@@ -7,5 +8,12 @@ class CustomUser(AbstractUser):
     Nous conservons ici uniquement les champs essentiels.
     """
     email = models.EmailField(unique=True)
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Recherche admin par préfixe insensible à la casse (voir user_management/search.py)
+            models.Index(Lower('username'), name='user_username_lower_idx'),
+            models.Index(Lower('email'), name='user_email_lower_idx'),
+        ]
     
     # Vous pouvez ajouter d'autres champs ici plus tard si nécessaire.
@@ -0,0 +1,49 @@
+# backend/authentication/purge.py
+"""
+Purge par lots des refresh tokens expirés (OutstandingToken et leurs BlacklistedToken).
+
+Chaque rotation crée un OutstandingToken : sans purge, les tables de jetons grossissent
+sans limite. Un jeton expiré est rejeté avant toute vérification de blacklist, ses lignes
+ne servent donc plus à rien.
+
+Les lots sont parcourus dans l'ordre de la clé primaire (id > dernier id traité : pas de
+rebalayage, pas d'index nécessaire sur expires_at) et supprimés chacun dans une transaction
+courte. Seules des lignes expirées, que plus aucune connexion ne lit, sont verrouillées ;
+sous SQLite, le verrou d'écriture global est relâché entre deux lots (`pause` pour laisser
+passer les connexions en attente).
+"""
+
+import time
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+
+def purge_expired_tokens(batch_size=1000, pause=0.0, now=None):
+    """Supprime les jetons expirés à `now` ; retourne {"outstanding", "blacklisted", "seconds"}"""
+    now = now or timezone.now()
+    stats = {"outstanding": 0, "blacklisted": 0, "seconds": 0.0}
+    start = time.perf_counter()
+    last_id = 0
+    while True:
+        ids = list(
+            OutstandingToken.objects
+            .filter(id__gt=last_id, expires_at__lte=now)
+            .order_by('id')
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        with transaction.atomic():
+            stats["blacklisted"] += BlacklistedToken.objects.filter(token_id__in=ids).delete()[0]
+            # Blacklist déjà vidée : la cascade n'a plus rien à supprimer
+            deleted = OutstandingToken.objects.filter(id__in=ids).delete()[1]
+            stats["outstanding"] += deleted.get(OutstandingToken._meta.label, 0)
+        last_id = ids[-1]
+        if len(ids) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+    stats["seconds"] = time.perf_counter() - start
+    return stats
@@ -0,0 +1,8 @@
+# backend/authentication/schema.py
+
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+
+
+class CachedJWTScheme(SimpleJWTScheme):
+    """Documente CachedJWTAuthentication comme le schéma JWT standard (`jwtAuth`)"""
+    target_class = 'authentication.authentication.CachedJWTAuthentication'
@@ -2,10 +2,27 @@ from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.contrib.auth.password_validation import validate_password  # 🔹 Import du validateur Django
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.state import token_backend
+from .tokens import RevocableRefreshToken, record_rotation
 
 
 User = get_user_model()
 
+class RevocableTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Connexion : le refresh token ouvre une nouvelle chaîne de rotation"""
+    token_class = RevocableRefreshToken
+
+class RevocableTokenRefreshSerializer(TokenRefreshSerializer):
+    """Rafraîchissement : le jeton émis par la rotation devient le seul valide de sa chaîne"""
+    token_class = RevocableRefreshToken
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        if "refresh" in data:
+            record_rotation(token_backend.decode(data["refresh"], verify=False))
+        return data
+
 class HomeSerializer(serializers.Serializer):
     message = serializers.CharField()
     user = serializers.CharField()
@@ -19,7 +36,6 @@ class ResetPasswordSerializer(serializers.Serializer):
 class ResetPasswordResponseSerializer(serializers.Serializer):
     message = serializers.CharField()
     username = serializers.CharField()
-    new_password = serializers.CharField(required=False)  # Seulement si DEBUG=True
 
 class DashboardSerializer(serializers.Serializer):
     message = serializers.CharField()
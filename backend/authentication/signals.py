@@ -0,0 +1,31 @@
+# backend/authentication/signals.py
+
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.state import token_backend
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from .authentication import token_user_cache
+from .tokens import FAMILY_CLAIM, record_blacklisted
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL, dispatch_uid='authentication_token_cache_user_saved')
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL, dispatch_uid='authentication_token_cache_user_deleted')
+def invalidate_cached_tokens(sender, instance, **kwargs):
+    # Mise à jour, désactivation, changement de mot de passe ou suppression : instantanés périmés
+    token_user_cache.invalidate_user(instance.pk)
+
+
+@receiver(post_save, sender=BlacklistedToken, dispatch_uid='authentication_revocation_blacklisted')
+def propagate_blacklisted_token(sender, instance, created, **kwargs):
+    if not created:
+        return
+    outstanding = instance.token
+    payload = token_backend.decode(outstanding.token, verify=False)
+    # Premier jeton d'une chaîne (émis à la connexion) : la chaîne porte son jti
+    family = payload.get(FAMILY_CLAIM, outstanding.jti)
+    transaction.on_commit(partial(record_blacklisted, family, outstanding.jti, outstanding.expires_at.timestamp()))
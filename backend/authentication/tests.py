@@ -1,7 +1,26 @@
+from datetime import timedelta
+from io import StringIO
+import tempfile
+
 from django.contrib.auth import get_user_model
+from django.core import mail
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
 from rest_framework_simplejwt.tokens import RefreshToken
+from authentication.authentication import token_user_cache
+from authentication.checks import check_revocation_cache
+from authentication.tokens import FAMILY_CLAIM, RevocableRefreshToken, family_key
+from jobs.models import Job
+from jobs.queue import run_pending
 
 User = get_user_model()
 
@@ -143,3 +162,219 @@ class ResetPasswordTests(BaseAuthTestCase):
             format="json"
         )
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_reset_password_email_is_sent_by_worker(self):
+        response = self.client.post(self.RESET_PASSWORD_URL, {"email": "test@example.com"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(Job.objects.get().payload, {"user_id": self.user.id})
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password("password123"))
+
+        run_pending("test-worker")
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["test@example.com"])
+        self.assertFalse(Job.objects.exists())
+        new_password = mail.outbox[0].body.rsplit(" ", 1)[-1]
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password(new_password))
+
+    def test_reset_password_keeps_password_when_email_fails(self):
+        self.client.post(self.RESET_PASSWORD_URL, {"email": "test@example.com"}, format="json")
+        Job.objects.update(max_attempts=1)  # Échec définitif dès le premier essai
+        with self.settings(EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend", EMAIL_PORT=1):
+            with self.assertLogs("jobs", level="ERROR"):
+                run_pending("test-worker")
+        job = Job.objects.get()
+        self.assertEqual((job.status, job.payload), (Job.FAILED, {"user_id": self.user.id}))
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password("password123"))
+
+
+# --- Cache des jetons vérifiés ---
+class CachedJWTAuthenticationTests(BaseAuthTestCase):
+    def setUp(self):
+        super().setUp()
+        token_user_cache.clear()
+        self.HOME_URL = "/"
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.get_access_token(self.user)}")
+
+    def test_repeated_token_served_without_query(self):
+        self.client.get(self.HOME_URL)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.HOME_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["user"], "testuser")
+
+    def test_cache_invalidated_on_user_update(self):
+        self.client.get(self.HOME_URL)
+        response = self.client.patch("/user-management/users/self/", {"username": "renamed"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(self.HOME_URL)
+        self.assertEqual(response.data["user"], "renamed")
+
+    def test_cache_invalidated_on_user_deactivation(self):
+        self.client.get(self.HOME_URL)
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get(self.HOME_URL)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_cache_invalidated_on_user_delete(self):
+        self.client.get(self.HOME_URL)
+        admin_client = self.client_class()
+        admin_client.force_authenticate(user=self.admin)
+        admin_client.delete(f"/user-management/users/{self.user.id}/delete/")
+        response = self.client.get(self.HOME_URL)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(JWT_AUTH_CACHE_TTL=0)
+    def test_expired_entries_are_verified_again(self):
+        self.client.get(self.HOME_URL)
+        with self.assertNumQueries(1):
+            self.client.get(self.HOME_URL)
+
+    @override_settings(JWT_AUTH_CACHE_SIZE=1)
+    def test_cache_is_bounded(self):
+        self.client.get(self.HOME_URL)
+        admin_client = self.client_class()
+        admin_client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.get_access_token(self.admin)}")
+        admin_client.get(self.HOME_URL)
+        # Le premier jeton a été évincé par le second
+        with self.assertNumQueries(1):
+            self.client.get(self.HOME_URL)
+
+
+# --- Révocation des refresh tokens (état de chaîne en cache) ---
+class RefreshTokenRevocationTests(BaseAuthTestCase):
+    def setUp(self):
+        super().setUp()
+        # Cache fichier : partagé entre processus, comme Redis ou memcached en production
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        self.enterContext(override_settings(
+            CACHES={**settings.CACHES, 'revocation': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': directory}},
+            JWT_REVOCATION_CACHE='revocation',
+        ))
+        response = self.client.post(self.LOGIN_URL, {"username": "testuser", "password": "password123"}, format="json")
+        self.refresh = response.data["refresh"]
+
+    def rotate(self, refresh):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(self.TOKEN_REFRESH_URL, {"refresh": refresh}, format="json")
+
+    def test_rotation_skips_blacklist_lookup(self):
+        # Premier passage : chaîne inconnue du cache, vérifiée en base puis mémorisée
+        second = self.rotate(self.refresh).data["refresh"]
+        with CaptureQueriesContext(connection) as captured:
+            response = self.rotate(second)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lookups = [q["sql"] for q in captured if q["sql"].startswith("SELECT 1") and "blacklistedtoken" in q["sql"]]
+        self.assertEqual(lookups, [])
+
+    def test_rotated_token_rejected_without_query(self):
+        new_refresh = self.rotate(self.refresh).data["refresh"]
+        with self.assertNumQueries(0):
+            response = self.client.post(self.TOKEN_REFRESH_URL, {"refresh": self.refresh}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.rotate(new_refresh).status_code, status.HTTP_200_OK)
+
+    def test_logged_out_token_rejected_without_query(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.get_access_token(self.user)}")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.LOGOUT_URL, {"refresh": self.refresh}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_205_RESET_CONTENT)
+        with self.assertNumQueries(0):
+            response = self.client.post(self.TOKEN_REFRESH_URL, {"refresh": self.refresh}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_database_remains_the_reference_after_eviction(self):
+        self.rotate(self.refresh)
+        caches['revocation'].clear()
+        response = self.client.post(self.TOKEN_REFRESH_URL, {"refresh": self.refresh}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_blacklist_from_admin_is_propagated(self):
+        new_refresh = self.rotate(self.refresh).data["refresh"]
+        token = RevocableRefreshToken(new_refresh)
+        outstanding = OutstandingToken.objects.create(
+            user=self.user, jti=token["jti"], token=new_refresh, expires_at=timezone.now() + timedelta(days=1)
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            BlacklistedToken.objects.create(token=outstanding)
+        with self.assertNumQueries(0):
+            response = self.client.post(self.TOKEN_REFRESH_URL, {"refresh": new_refresh}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class RefreshTokenRevocationLocalCacheTests(BaseAuthTestCase):
+    """Deux workers, chacun avec son LocMemCache : l'état en cache de l'un ignore les rotations de l'autre"""
+
+    def setUp(self):
+        super().setUp()
+        self.enterContext(override_settings(CACHES={
+            **settings.CACHES,
+            'worker-a': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'worker-a'},
+            'worker-b': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'worker-b'},
+        }))
+        response = self.client.post(self.LOGIN_URL, {"username": "testuser", "password": "password123"}, format="json")
+        self.refresh = response.data["refresh"]
+
+    def refresh_on(self, worker, refresh):
+        with self.settings(JWT_REVOCATION_CACHE=worker), self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(self.TOKEN_REFRESH_URL, {"refresh": refresh}, format="json")
+
+    def test_rotation_on_one_worker_is_enforced_on_the_other(self):
+        with self.settings(JWT_REVOCATION_CACHE='worker-b'):
+            RevocableRefreshToken(self.refresh)  # Vérifié une première fois par le worker B
+        rotated = self.refresh_on('worker-a', self.refresh)
+        self.assertEqual(rotated.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.refresh_on('worker-a', self.refresh).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.refresh_on('worker-b', self.refresh).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.refresh_on('worker-b', rotated.data["refresh"]).status_code, status.HTTP_200_OK)
+
+    def test_local_cache_is_not_used(self):
+        self.refresh_on('worker-a', self.refresh)
+        self.assertIsNone(caches['worker-a'].get(family_key(RevocableRefreshToken(self.refresh, verify=False)[FAMILY_CLAIM])))
+
+    def test_deploy_check_warns_about_local_cache(self):
+        with self.settings(JWT_REVOCATION_CACHE='worker-a'):
+            self.assertEqual([error.id for error in check_revocation_cache(None)], ['authentication.W001'])
+
+
+# --- Purge des jetons expirés ---
+class PurgeExpiredTokensTests(BaseAuthTestCase):
+    def create_token(self, expires_in, blacklisted=False):
+        refresh = RevocableRefreshToken.for_user(self.user)
+        token = OutstandingToken.objects.get(jti=refresh["jti"])
+        token.expires_at = timezone.now() + expires_in
+        token.save(update_fields=["expires_at"])
+        if blacklisted:
+            BlacklistedToken.objects.create(token=token)
+        return token
+
+    def test_purges_only_expired_tokens_in_batches(self):
+        expired = [self.create_token(timedelta(days=-1), blacklisted=index % 2 == 0) for index in range(5)]
+        live = self.create_token(timedelta(days=1))
+        live_blacklisted = self.create_token(timedelta(days=1), blacklisted=True)
+
+        out = StringIO()
+        call_command("purge_expired_tokens", "--batch-size", "2", stdout=out)
+
+        self.assertFalse(OutstandingToken.objects.filter(pk__in=[token.pk for token in expired]).exists())
+        self.assertEqual(set(OutstandingToken.objects.values_list("pk", flat=True)), {live.pk, live_blacklisted.pk})
+        self.assertEqual(list(BlacklistedToken.objects.values_list("token_id", flat=True)), [live_blacklisted.pk])
+        self.assertIn("5 jeton(s) et 3 entrée(s) de blacklist supprimés", out.getvalue())
+        self.assertIn("lignes/s", out.getvalue())
+
+    def test_each_batch_runs_in_its_own_short_transaction(self):
+        for _ in range(4):
+            self.create_token(timedelta(days=-1))
+        with CaptureQueriesContext(connection) as captured:
+            call_command("purge_expired_tokens", "--batch-size", "2", stdout=StringIO())
+        savepoints = [q["sql"] for q in captured if q["sql"].startswith("SAVEPOINT")]
+        self.assertEqual(len(savepoints), 2)
+        self.assertEqual(OutstandingToken.objects.count(), 0)
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(CommandError):
+            call_command("purge_expired_tokens", "--batch-size", "0", stdout=StringIO())
@@ -0,0 +1,98 @@
+# backend/authentication/tokens.py
+"""
+Révocation des refresh tokens avec un état par chaîne de rotation, tenu dans le cache.
+
+Chaque refresh token porte une revendication `fam` : le jti du premier jeton de sa chaîne
+(connexion), conservée à chaque rotation. Le cache associe à chaque chaîne le jti de son
+jeton courant, ou REVOKED après une déconnexion. La question « ce jti est-il révoqué ? »
+se résout alors sans requête SQL :
+- jti courant de la chaîne : valide ;
+- autre jti (jeton remplacé par une rotation) ou REVOKED : révoqué ;
+- chaîne inconnue du cache (éviction, jeton émis avant ce mécanisme) : repli sur
+  la table BlacklistedToken, qui reste la référence, puis mémorisation.
+
+Le cache doit être partagé entre les processus (JWT_REVOCATION_CACHE : Redis ou memcached
+en production) : un cache local ignorerait les rotations et révocations faites par un autre
+processus. Avec un cache propre au processus (LocMemCache), il n'est pas utilisé : chaque
+vérification interroge BlacklistedToken (signalé par `manage.py check --deploy`).
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from shared_cache import is_shared_cache
+
+FAMILY_CLAIM = 'fam'
+REVOKED = 'revoked'
+
+
+def revocation_cache_alias():
+    return getattr(settings, 'JWT_REVOCATION_CACHE', 'default')
+
+
+def revocation_cache():
+    """Cache des états de chaîne, ou None s'il n'est pas partagé entre les workers (la base seule fait foi)"""
+    alias = revocation_cache_alias()
+    return caches[alias] if is_shared_cache(alias) else None
+
+
+def family_key(family):
+    return f"jwt:family:{family}"
+
+
+def remaining_lifetime(exp):
+    # Inutile de conserver l'état d'une chaîne au-delà de l'expiration de son jeton
+    return max(int(exp - time.time()), 1)
+
+
+class RevocableRefreshToken(RefreshToken):
+    """RefreshToken dont la vérification de blacklist passe d'abord par l'état de chaîne en cache"""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token[FAMILY_CLAIM] = token[api_settings.JTI_CLAIM]
+        return token
+
+    def check_blacklist(self):
+        family = self.payload.get(FAMILY_CLAIM)
+        cache = revocation_cache()
+        if family is None or cache is None:
+            return super().check_blacklist()
+
+        current = cache.get(family_key(family))
+        if current == self.payload[api_settings.JTI_CLAIM]:
+            return
+        if current is not None:
+            raise TokenError("Token is blacklisted")
+
+        super().check_blacklist()
+        # Non blacklisté en base : ce jeton devient le courant de sa chaîne (sauf écriture concurrente)
+        cache.add(
+            family_key(family), self.payload[api_settings.JTI_CLAIM], remaining_lifetime(self.payload['exp'])
+        )
+
+
+def record_rotation(payload):
+    """Le jeton `payload`, issu d'une rotation, devient le seul valide de sa chaîne"""
+    family = payload.get(FAMILY_CLAIM)
+    cache = revocation_cache()
+    if family is not None and cache is not None:
+        cache.set(family_key(family), payload[api_settings.JTI_CLAIM], remaining_lifetime(payload['exp']))
+
+
+def record_blacklisted(family, jti, exp):
+    """Répercute dans le cache l'ajout d'un jeton à la blacklist (déconnexion, rotation, admin)"""
+    cache = revocation_cache()
+    if cache is None:
+        return
+    key = family_key(family)
+    # Chaîne inconnue : REVOKED empêche une vérification concurrente de mémoriser le jeton comme valide.
+    # Jeton déjà remplacé par une rotation : le cache le rejette déjà.
+    if cache.get(key) in (None, jti):
+        cache.set(key, REVOKED, remaining_lifetime(exp))
@@ -1,16 +1,15 @@
 from authentication.serializers import HomeSerializer, LogoutSerializer, ResetPasswordSerializer, ResetPasswordResponseSerializer
-from django.conf import settings
 from django.contrib.auth import get_user_model, login
-from django.core.mail import send_mail
-from django.utils.crypto import get_random_string
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.tokens import RefreshToken
+from authentication.jobs import PASSWORD_RESET_EMAIL
+from authentication.tokens import RevocableRefreshToken
 from django.shortcuts import redirect
 from drf_spectacular.utils import extend_schema
+from jobs.queue import enqueue
 
 
 User = get_user_model()
@@ -43,7 +42,7 @@ class LogoutView(APIView):
             return Response({"error": "Le token de déconnexion est requis."}, status=status.HTTP_400_BAD_REQUEST)
         
         try:
-            token = RefreshToken(refresh_token)
+            token = RevocableRefreshToken(refresh_token)
             token.blacklist()
             return Response({"message": "Déconnexion réussie."}, status=status.HTTP_205_RESET_CONTENT)
         except Exception:
@@ -68,25 +67,13 @@ class ResetPasswordView(APIView):
         except User.DoesNotExist:
             return Response({"error": "Aucun utilisateur trouvé avec cet email."}, status=status.HTTP_404_NOT_FOUND)
 
-        new_password = get_random_string(length=12)
-        user.set_password(new_password)
-        user.save()
-
-        send_mail(
-            subject="Réinitialisation de votre mot de passe",
-            message=f"Bonjour {user.username}, votre nouveau mot de passe est : {new_password}",
-            from_email="no-reply@scrumforge.com",
-            recipient_list=[user.email],
-            fail_silently=False,
-        )
+        # Mot de passe généré, enregistré et envoyé par la tâche (run_workers) : seul l'id est mis en file
+        enqueue(PASSWORD_RESET_EMAIL, {"user_id": user.id})
 
         response_data = {
             "message": "Un nouveau mot de passe a été envoyé.",
             "username": user.username,
         }
-        if settings.DEBUG:
-            response_data["new_password"] = new_password
-
         return Response(response_data, status=status.HTTP_200_OK)
 
 def social_auth_redirect(request):
@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+# Lectures chaudes servies par des vues async (voir backend/asgi_urls.py)
+os.environ.setdefault('DJANGO_ROOT_URLCONF', 'backend.asgi_urls')
 
 application = get_asgi_application()
@@ -0,0 +1,32 @@
+"""
+URLs servies sous ASGI (backend/asgi.py) : celles de backend/urls.py, les lectures
+chaudes étant remplacées par leur implémentation async (voir async_api).
+"""
+
+from django.urls import path
+
+from async_api import read_async
+from authentication.async_views import home
+from authentication.views import home_api
+from backend.urls import urlpatterns as sync_urlpatterns
+from certifications.async_views import certification_list, competency_list
+from certifications.views import CertificationListCreateView, CompetencyListCreateView
+from dashboard.async_views import dashboard
+from dashboard.views import DashboardView
+
+urlpatterns = [
+    # Mêmes chemins et mêmes noms que les vues synchrones, résolus en priorité
+    path('', read_async(home, home_api), name='home_api'),
+    path(
+        'certifications/',
+        read_async(certification_list, CertificationListCreateView.as_view()),
+        name='certification-list-create',
+    ),
+    path(
+        'certifications/competencies/',
+        read_async(competency_list, CompetencyListCreateView.as_view()),
+        name='competency-list-create',
+    ),
+    path('dashboard/', read_async(dashboard, DashboardView.as_view()), name='dashboard'),
+    *sync_urlpatterns,
+]
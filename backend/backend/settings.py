@@ -56,6 +56,9 @@ INSTALLED_APPS = [
     'user_management',
     'certifications',
     'dashboard',
+    'analytics',
+    'jobs',
+    'benchmarks',
     'drf_spectacular',
     'drf_spectacular_sidecar',  # Pour les assets Swagger UI et Redoc
     'social_django',  # Ajout de l'app pour l'authentification sociale
@@ -63,6 +66,7 @@ INSTALLED_APPS = [
 
 
 MIDDLEWARE = [
+    'middleware.RequestTimingMiddleware',  # En premier : mesure l'ensemble de la requête
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -74,7 +78,8 @@ MIDDLEWARE = [
     'middleware.CustomExceptionMiddleware',  # Gestionnaire d’erreurs API
 ]
 
-ROOT_URLCONF = 'backend.urls'
+# backend/asgi.py sélectionne backend.asgi_urls (lectures chaudes en vues async)
+ROOT_URLCONF = os.getenv('DJANGO_ROOT_URLCONF', 'backend.urls')
 
 TEMPLATES = [
     {
@@ -105,18 +110,27 @@ DATABASES = {
     }
 }
 
+# Pragmas SQLite appliqués à chaque nouvelle connexion (OPTIONS['init_command']) : aucune connexion
+# n'est ouverte au chargement des settings. Surcharge : DJANGO_SQLITE_PRAGMAS="cache_size=-2000,mmap_size=0"
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',     # Lectures non bloquées par l'écriture en cours (mode conservé dans le fichier)
+    'synchronous': 'NORMAL',   # fsync aux checkpoints seulement : sans risque de corruption en WAL
+    'cache_size': -64000,      # Cache de pages par connexion, en Kio (64 Mo)
+    'mmap_size': 268435456,    # Lectures par mmap, jusqu'à 256 Mo
+    'temp_store': 'MEMORY',    # Tris et index temporaires en mémoire
+    'busy_timeout': 20000,     # Attente du verrou d'écriture (ms) avant "database is locked"
+}
+SQLITE_PRAGMAS.update(
+    (name.strip(), value.strip())
+    for name, _, value in (item.partition('=') for item in os.getenv('DJANGO_SQLITE_PRAGMAS', '').split(','))
+    if value.strip()
+)
+
 if DATABASES['default']['ENGINE'] == 'django.db.backends.sqlite3':
     DATABASES['default']['OPTIONS'] = {
-        'timeout': 20,  # Augmente le timeout pour éviter les conflits
+        'init_command': ';'.join(f'PRAGMA {name}={value}' for name, value in SQLITE_PRAGMAS.items()),
     }
 
-    # Active WAL pour de meilleures performances
-    import sqlite3
-    conn = sqlite3.connect(DATABASES['default']['NAME'])
-    conn.execute("PRAGMA journal_mode=WAL;")
-    conn.execute("PRAGMA synchronous=NORMAL;")
-    conn.close()
-
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -144,10 +158,14 @@ AUTHENTICATION_BACKENDS = (
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'authentication.authentication.CachedJWTAuthentication',
     ),
 }
 
+# Cache local des jetons d'accès vérifiés (voir authentication/authentication.py)
+JWT_AUTH_CACHE_SIZE = 10000
+JWT_AUTH_CACHE_TTL = 60  # secondes
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(days=1),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
@@ -155,8 +173,92 @@ SIMPLE_JWT = {
     'BLACKLIST_AFTER_ROTATION': True,
     'ALGORITHM': 'HS256',
     'SIGNING_KEY': SECRET_KEY,
+    # Révocation des refresh tokens via l'état de chaîne en cache (voir authentication/tokens.py)
+    'TOKEN_OBTAIN_SERIALIZER': 'authentication.serializers.RevocableTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'authentication.serializers.RevocableTokenRefreshSerializer',
+}
+
+# Cache de l'état de révocation des refresh tokens : doit être partagé entre les processus
+# (Redis, memcached) ; un cache local (LocMemCache) est ignoré, la base est alors interrogée à chaque fois
+JWT_REVOCATION_CACHE = 'default'
+
+# Instrumentation des requêtes (middleware.RequestTimingMiddleware) :
+# en-tête Server-Timing pour tous ('all'), les comptes staff uniquement ('staff') ou personne ('off')
+SERVER_TIMING = os.getenv('SERVER_TIMING', 'staff')
+
+# Lignes de log JSON du middleware (logger `request_timing`, niveau INFO) écrites sur la sortie standard
+# si REQUEST_TIMING_LOG=True ; désactivées par défaut pour ne pas noyer la sortie des tests et du runserver
+REQUEST_TIMING_LOG = os.getenv('REQUEST_TIMING_LOG', 'False') == 'True'
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'message': {'format': '{message}', 'style': '{'},
+    },
+    'handlers': {
+        'request_timing': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'message',
+        },
+    },
+    'loggers': {
+        'request_timing': {
+            'handlers': ['request_timing'],
+            'level': 'INFO' if REQUEST_TIMING_LOG else 'WARNING',
+            'propagate': False,
+        },
+    },
 }
 
+# Durée de vie (s) du cache du dashboard, invalidé à chaque session d'examen complétée ; utilisé seulement
+# si le cache par défaut est partagé entre les processus (un LocMemCache ne verrait pas les invalidations des autres workers)
+DASHBOARD_CACHE_TIMEOUT = 3600
+
+# Index de rang des classements : DatabaseRankIndex (COUNT indexé, sans état) ou CacheRankIndex
+# (arbre de Fenwick dans le cache LEADERBOARD_CACHE, O(log n)), qui requiert un cache partagé entre les processus
+LEADERBOARD_RANK_INDEX = 'dashboard.leaderboard.DatabaseRankIndex'
+LEADERBOARD_CACHE = 'leaderboard'
+LEADERBOARD_CACHE_TIMEOUT = 86400
+
+# L'arbre de rang occupe ~10 000 clés par certification : alias dédié (Redis ou memcached en production)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'leaderboard': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'leaderboard',
+        'OPTIONS': {'MAX_ENTRIES': 1_000_000},
+    },
+}
+
+# Durée maximale (s) pendant laquelle les validateurs HTTP du catalogue (ETag / Last-Modified) restent en cache ;
+# ce cache n'est utilisé que si le cache par défaut est partagé entre les processus (sinon CatalogVersion est relue)
+CATALOG_VALIDATORS_TIMEOUT = 300
+
+# Lectures du catalogue servies depuis un instantané JSON gardé en mémoire par chaque worker
+CATALOG_SNAPSHOT = True
+
+# Durée maximale (s) pendant laquelle la version de la banque de questions reste en cache :
+# délai avant qu'un worker recharge ses tableaux de tirage après un changement fait par un autre
+QUESTION_POOLS_VERSION_TIMEOUT = 60
+
+# Nombre de questions d'un examen lorsque le client ne le précise pas
+EXAM_QUESTION_COUNT = 20
+
+# Côtés (px) des variantes WebP / PNG générées pour chaque logo de certification
+CERTIFICATION_LOGO_SIZES = (64, 256)
+
+# Score (%) à partir duquel une session est comptée comme réussie dans les analytiques
+ANALYTICS_PASS_SCORE = 85
+
+# File de tâches (jobs) : essais par tâche, délai du premier nouvel essai (doublé ensuite)
+# et durée après laquelle une tâche réservée par un worker disparu est remise en file (secondes)
+JOBS_MAX_ATTEMPTS = 5
+JOBS_RETRY_DELAY = 30
+JOBS_LOCK_TIMEOUT = 600
+
 SPECTACULAR_SETTINGS = {
     'TITLE': 'ScrumForge API',
     'DESCRIPTION': 'Documentation des endpoints de l\'API ScrumForge',
@@ -164,6 +266,9 @@ SPECTACULAR_SETTINGS = {
     'SERVE_INCLUDE_SCHEMA': False,
 }
 
+# Schéma OpenAPI pré-généré servi par /api/schema/ (python manage.py spectacular --file schema.yml)
+OPENAPI_SCHEMA_FILE = BASE_DIR / 'schema.yml'
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
 
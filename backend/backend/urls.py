@@ -1,7 +1,8 @@
 from django.contrib import admin
 from django.urls import path, include
 from authentication.views import home_api  # Vue d'accueil si connecté
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
+from drf_spectacular.views import SpectacularSwaggerView, SpectacularRedocView
+from openapi import StaticSchemaView  # Schéma pré-généré (schema.yml)
 
 urlpatterns = [
     path('', home_api, name='home_api'),  # API qui remplace l'ancienne vue inutile
@@ -10,7 +11,8 @@ urlpatterns = [
     path('user-management/', include('user_management.urls')),
     path('certifications/', include('certifications.urls')),
     path('dashboard/', include('dashboard.urls')),
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
+    path('analytics/', include('analytics.urls')),
+    path('api/schema/', StaticSchemaView.as_view(), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
 
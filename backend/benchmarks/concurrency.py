@@ -0,0 +1,179 @@
+# backend/benchmarks/concurrency.py
+"""
+Benchmark de charge des lectures chaudes, à forte concurrence, selon trois chemins :
+- wsgi       : WSGIHandler appelé par un pool de N threads (vues DRF synchrones) ;
+- asgi-sync  : ASGIHandler et vues DRF synchrones (un passage par thread par requête) ;
+- asgi-async : ASGIHandler et vues async de backend/asgi_urls.py.
+
+Les handlers sont appelés dans le processus (sans serveur ni réseau) : seul le coût
+Django (middlewares, vue, ORM, sérialisation) est comparé. Lecture seule, sur la base courante.
+"""
+
+import asyncio
+import io
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.test.utils import override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from dashboard.models import CertificationProgress
+from .runner import percentile
+
+User = get_user_model()
+
+ENDPOINTS = {
+    'home_api': '/',
+    'certification-list-create': '/certifications/',
+    'competency-list-create': '/certifications/competencies/',
+    'dashboard': '/dashboard/',
+}
+
+MODES = {
+    'wsgi': 'backend.urls',
+    'asgi-sync': 'backend.urls',
+    'asgi-async': 'backend.asgi_urls',
+}
+
+HOST = 'testserver'
+
+
+def benchmark_user():
+    """Utilisateur ayant une progression (dashboard non vide) ou, à défaut, le premier utilisateur actif"""
+    user_id = CertificationProgress.objects.order_by('pk').values_list('user_id', flat=True).first()
+    if user_id is not None:
+        return User.objects.get(pk=user_id)
+    return User.objects.filter(is_active=True).order_by('pk').first()
+
+
+def wsgi_get(handler, path, authorization):
+    environ = {
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': path,
+        'QUERY_STRING': '',
+        'SERVER_NAME': HOST,
+        'SERVER_PORT': '80',
+        'SERVER_PROTOCOL': 'HTTP/1.1',
+        'HTTP_HOST': HOST,
+        'HTTP_AUTHORIZATION': authorization,
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': 'http',
+        'wsgi.input': io.BytesIO(),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+    status = []
+    body = handler(environ, lambda line, headers, exc_info=None: status.append(int(line.split()[0])))
+    try:
+        b''.join(body)
+    finally:
+        body.close()
+    return status[0]
+
+
+async def asgi_get(application, path, authorization):
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': b'',
+        'root_path': '',
+        'headers': [(b'host', HOST.encode()), (b'authorization', authorization.encode())],
+        'client': ('127.0.0.1', 0),
+        'server': (HOST, 80),
+    }
+    status = []
+    disconnected = asyncio.Event()
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        await disconnected.wait()  # Client toujours connecté jusqu'à la fin de la réponse
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        if message['type'] == 'http.response.start':
+            status.append(message['status'])
+
+    await application(scope, receive, send)
+    disconnected.set()
+    return status[0]
+
+
+def run_wsgi(path, authorization, concurrency, requests):
+    handler = WSGIHandler()
+
+    def timed(_):
+        start = time.perf_counter()
+        status = wsgi_get(handler, path, authorization)
+        return status, time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        start = time.perf_counter()
+        results = list(pool.map(timed, range(requests)))
+        return results, time.perf_counter() - start
+
+
+def run_asgi(path, authorization, concurrency, requests):
+    application = ASGIHandler()
+
+    async def load():
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def timed():
+            async with semaphore:
+                start = time.perf_counter()
+                status = await asgi_get(application, path, authorization)
+                return status, time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(timed() for _ in range(requests)))
+        return results, time.perf_counter() - start
+
+    return asyncio.run(load())
+
+
+def run_concurrency_benchmark(concurrency=50, requests=500, warmup=5, endpoints=None, modes=None):
+    """
+    Retourne {mode: {endpoint: {"requests_per_s", "p50_ms", "p95_ms", "errors"}}}.
+    `requests` requêtes par endpoint et par mode, au plus `concurrency` simultanées.
+    """
+    user = benchmark_user()
+    if user is None:
+        raise LookupError("Aucun utilisateur en base : lancez d'abord `python manage.py seed`.")
+    authorization = f"Bearer {AccessToken.for_user(user)}"
+    endpoints = {name: path for name, path in ENDPOINTS.items() if not endpoints or name in endpoints}
+
+    results = {}
+    for mode, urlconf in MODES.items():
+        if modes and mode not in modes:
+            continue
+        run = run_wsgi if mode == 'wsgi' else run_asgi
+        results[mode] = {}
+        with override_settings(ROOT_URLCONF=urlconf, ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, HOST]):
+            for name, path in endpoints.items():
+                if warmup:
+                    run(path, authorization, 1, warmup)  # Caches des jetons et du dashboard
+                timings, elapsed = run(path, authorization, concurrency, requests)
+                durations = [duration * 1000 for _, duration in timings]
+                results[mode][name] = {
+                    "requests_per_s": round(requests / elapsed, 1),
+                    "p50_ms": round(percentile(durations, 0.50), 2),
+                    "p95_ms": round(percentile(durations, 0.95), 2),
+                    "errors": sum(1 for status, _ in timings if status != 200),
+                }
+    return results
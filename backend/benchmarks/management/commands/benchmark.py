@@ -0,0 +1,79 @@
+# backend/benchmarks/management/commands/benchmark.py
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from benchmarks.runner import (
+    DEFAULT_BUDGETS_PATH,
+    budgets_from_results,
+    check_budgets,
+    load_budgets,
+    run_benchmarks,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Mesure latence (p50/p95) et nombre de requêtes SQL de chaque endpoint "
+        "sur la base courante et échoue si un budget est dépassé"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help="Itérations mesurées par endpoint (défaut : 20)")
+        parser.add_argument('--warmup', type=int, default=2, help="Itérations de chauffe non mesurées (défaut : 2)")
+        parser.add_argument('--budgets', default=str(DEFAULT_BUDGETS_PATH), help="Fichier JSON des budgets")
+        parser.add_argument('--only', nargs='*', help="Limite le benchmark à certains endpoints (noms d'URL)")
+        parser.add_argument('--output', help="Écrit les résultats bruts dans ce fichier JSON")
+        parser.add_argument(
+            '--write-budgets', action='store_true',
+            help="Réécrit le fichier de budgets à partir de cette mesure au lieu de le vérifier"
+        )
+        parser.add_argument(
+            '--headroom', type=float, default=2.0,
+            help="Marge appliquée au p95 mesuré avec --write-budgets (défaut : 2.0)"
+        )
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError("--iterations doit être supérieur à 0.")
+
+        self.stdout.write(f"⏱️ Benchmark des endpoints ({options['iterations']} itérations)...")
+        results = run_benchmarks(
+            iterations=options['iterations'],
+            warmup=max(options['warmup'], 0),
+            only=options['only'],
+        )
+
+        self.stdout.write(f"{'Endpoint':<34}{'HTTP':>6}{'p50 (ms)':>11}{'p95 (ms)':>11}{'SQL':>6}")
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name:<34}{result['status']:>6}{result['p50_ms']:>11.2f}{result['p95_ms']:>11.2f}{result['queries']:>6}"
+            )
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as fp:
+                json.dump(results, fp, indent=2)
+
+        if options['write_budgets']:
+            with open(options['budgets'], 'w', encoding='utf-8') as fp:
+                json.dump(budgets_from_results(results, options['headroom']), fp, indent=2)
+                fp.write("\n")
+            self.stdout.write(f"✅ Budgets écrits dans {options['budgets']}")
+            return
+
+        try:
+            budgets = load_budgets(options['budgets'])
+        except FileNotFoundError:
+            raise CommandError(f"Fichier de budgets introuvable : {options['budgets']}")
+
+        missing = [name for name in results if name not in budgets]
+        if missing:
+            self.stdout.write(f"⚠️ Endpoints sans budget : {', '.join(missing)}")
+
+        violations = check_budgets(results, budgets)
+        if violations:
+            for violation in violations:
+                self.stderr.write(f"❌ {violation}")
+            raise CommandError(f"{len(violations)} budget(s) dépassé(s).")
+        self.stdout.write("✅ Tous les budgets sont respectés.")
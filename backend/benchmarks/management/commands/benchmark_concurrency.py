@@ -0,0 +1,55 @@
+# backend/benchmarks/management/commands/benchmark_concurrency.py
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from benchmarks.concurrency import ENDPOINTS, MODES, run_concurrency_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare sous forte concurrence les lectures chaudes servies en WSGI, en ASGI avec les vues "
+        "synchrones et en ASGI avec les vues async (débit, p50/p95)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=50, help="Requêtes simultanées (défaut : 50)")
+        parser.add_argument('--requests', type=int, default=500, help="Requêtes par endpoint et par mode (défaut : 500)")
+        parser.add_argument('--warmup', type=int, default=5, help="Requêtes de chauffe non mesurées (défaut : 5)")
+        parser.add_argument('--only', nargs='*', choices=list(ENDPOINTS), help="Limite le benchmark à certains endpoints")
+        parser.add_argument('--modes', nargs='*', choices=list(MODES), help="Limite le benchmark à certains modes")
+        parser.add_argument('--output', help="Écrit les résultats bruts dans ce fichier JSON")
+
+    def handle(self, *args, **options):
+        if options['concurrency'] < 1 or options['requests'] < 1:
+            raise CommandError("--concurrency et --requests doivent être supérieurs à 0.")
+
+        self.stdout.write(
+            f"⏱️ Benchmark de concurrence ({options['requests']} requêtes, {options['concurrency']} simultanées)..."
+        )
+        try:
+            results = run_concurrency_benchmark(
+                concurrency=options['concurrency'],
+                requests=options['requests'],
+                warmup=max(options['warmup'], 0),
+                endpoints=options['only'],
+                modes=options['modes'],
+            )
+        except LookupError as exc:
+            raise CommandError(str(exc))
+
+        self.stdout.write(f"{'Endpoint':<30}{'Mode':<12}{'req/s':>10}{'p50 (ms)':>11}{'p95 (ms)':>11}{'Erreurs':>9}")
+        for name in ENDPOINTS:
+            for mode, by_endpoint in results.items():
+                if name not in by_endpoint:
+                    continue
+                result = by_endpoint[name]
+                self.stdout.write(
+                    f"{name:<30}{mode:<12}{result['requests_per_s']:>10.1f}"
+                    f"{result['p50_ms']:>11.2f}{result['p95_ms']:>11.2f}{result['errors']:>9}"
+                )
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as fp:
+                json.dump(results, fp, indent=2)
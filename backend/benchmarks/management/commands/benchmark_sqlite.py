@@ -0,0 +1,38 @@
+# backend/benchmarks/management/commands/benchmark_sqlite.py
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from benchmarks.sqlite import run_sqlite_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare les pragmas SQLite par défaut et SQLITE_PRAGMAS sur des soumissions d'examen "
+        "validées une à une (copies de la base courante)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--submissions', type=int, default=200, help="Soumissions par configuration (défaut : 200)")
+        parser.add_argument('--output', help="Écrit les résultats bruts dans ce fichier JSON")
+
+    def handle(self, *args, **options):
+        if options['submissions'] < 1:
+            raise CommandError("--submissions doit être supérieur à 0.")
+
+        self.stdout.write(f"⏱️ Benchmark des pragmas SQLite ({options['submissions']} soumissions d'examen)...")
+        try:
+            results = run_sqlite_benchmark(submissions=options['submissions'])
+        except LookupError as exc:
+            raise CommandError(str(exc))
+
+        self.stdout.write(f"{'Configuration':<16}{'soumissions/s':>15}{'p50 (ms)':>11}{'p95 (ms)':>11}")
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name:<16}{result['submissions_per_s']:>15.1f}{result['p50_ms']:>11.2f}{result['p95_ms']:>11.2f}"
+            )
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as fp:
+                json.dump(results, fp, indent=2)
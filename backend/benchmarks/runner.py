@@ -0,0 +1,124 @@
+# backend/benchmarks/runner.py
+"""
+Exécution des scénarios : latence p50/p95 et nombre de requêtes SQL par route,
+comparés aux budgets de benchmarks/budgets.json.
+"""
+
+import json
+import math
+import tempfile
+import time
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from certifications.catalog import invalidate_catalog_validators
+from certifications.snapshot import invalidate_catalog_snapshot
+from dashboard.leaderboard import reset_rank_indexes
+from dashboard.services import invalidate_dashboard
+from .scenarios import SCENARIOS, BenchmarkContext
+
+DEFAULT_BUDGETS_PATH = settings.BASE_DIR / 'benchmarks' / 'budgets.json'
+
+
+def percentile(values, fraction):
+    """Percentile par rang le plus proche (valeurs triées)"""
+    ordered = sorted(values)
+    index = max(math.ceil(fraction * len(ordered)) - 1, 0)
+    return ordered[index]
+
+
+class RollbackIteration(Exception):
+    """Force l'annulation de la transaction englobant le benchmark"""
+
+
+def run_benchmarks(iterations=20, warmup=2, only=None):
+    """
+    Exécute chaque scénario `warmup + iterations` fois et retourne
+    {nom: {"p50_ms", "p95_ms", "queries", "status"}}.
+    Tout le benchmark tourne dans une transaction annulée : la base n'est pas modifiée.
+    Les fichiers (logos) sont écrits dans un MEDIA_ROOT temporaire.
+    """
+    scenarios = [scenario for scenario in SCENARIOS if not only or scenario.name in only]
+    results = {}
+    client = Client()
+    media_root = tempfile.TemporaryDirectory(prefix='benchmark-media-')
+    test_settings = override_settings(
+        ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver'],
+        EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+        MEDIA_ROOT=media_root.name,
+    )
+    with media_root, test_settings:
+        try:
+            with transaction.atomic():
+                ctx = BenchmarkContext()
+                try:
+                    for scenario in scenarios:
+                        results[scenario.name] = _run_scenario(client, ctx, scenario, iterations, warmup)
+                finally:
+                    # Les identifiants annulés seront réattribués : pas de cache applicatif orphelin
+                    invalidate_dashboard(ctx.user.id, ctx.admin.id)
+                    reset_rank_indexes(ctx.certification.pk)
+                    invalidate_catalog_validators()
+                    invalidate_catalog_snapshot()
+                raise RollbackIteration
+        except RollbackIteration:
+            pass
+    return results
+
+
+def _run_scenario(client, ctx, scenario, iterations, warmup):
+    durations = []
+    queries = 0
+    status = None
+    for iteration in range(warmup + iterations):
+        with transaction.atomic():
+            path, data = scenario.prepare(ctx)
+            request = getattr(client, scenario.method)
+            kwargs = {'data': data, 'content_type': 'application/json'} if data is not None else {}
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                response = request(path, **kwargs, **ctx.auth_headers(scenario.role))
+                elapsed = time.perf_counter() - start
+            transaction.set_rollback(True)
+        if iteration >= warmup:
+            durations.append(elapsed * 1000)
+            queries = max(queries, len(captured))
+            status = response.status_code
+    return {
+        "p50_ms": round(percentile(durations, 0.50), 2),
+        "p95_ms": round(percentile(durations, 0.95), 2),
+        "queries": queries,
+        "status": status,
+    }
+
+
+def load_budgets(path):
+    with open(path, encoding='utf-8') as fp:
+        return json.load(fp)
+
+
+def check_budgets(results, budgets):
+    """Retourne la liste des dépassements de budget (messages lisibles)"""
+    violations = []
+    for name, result in results.items():
+        budget = budgets.get(name)
+        if budget is None:
+            continue
+        if result["status"] is not None and result["status"] >= 500:
+            violations.append(f"{name} : réponse HTTP {result['status']}")
+        if 'max_queries' in budget and result["queries"] > budget['max_queries']:
+            violations.append(f"{name} : {result['queries']} requêtes SQL (budget : {budget['max_queries']})")
+        if 'p95_ms' in budget and result["p95_ms"] > budget['p95_ms']:
+            violations.append(f"{name} : p95 {result['p95_ms']} ms (budget : {budget['p95_ms']} ms)")
+    return violations
+
+
+def budgets_from_results(results, headroom=2.0):
+    """Budgets dérivés d'une mesure de référence : requêtes exactes, latence avec marge"""
+    return {
+        name: {"max_queries": result["queries"], "p95_ms": math.ceil(result["p95_ms"] * headroom)}
+        for name, result in results.items()
+    }
@@ -0,0 +1,220 @@
+# backend/benchmarks/scenarios.py
+"""
+Scénarios de benchmark : un scénario par route exposée dans backend/urls.py
+(hors admin Django et redirections OAuth).
+"""
+
+from io import BytesIO
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.urls import reverse
+from PIL import Image
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from authentication.tokens import RevocableRefreshToken
+from certifications.logos import LOGO_DIRECTORY, ensure_variant, logo_stem, logo_storage, variant_sizes
+from certifications.models import (
+    Answer,
+    Certification,
+    CertificationCompetency,
+    Competency,
+    ExamSession,
+    Question,
+)
+
+User = get_user_model()
+
+PASSWORD = "Benchmark123!"
+
+# Routes volontairement non couvertes (interfaces HTML tierces)
+EXCLUDED_URL_NAMESPACES = ('admin', 'social')
+
+
+class BenchmarkContext:
+    """
+    Données nécessaires aux scénarios, créées dans la transaction du benchmark
+    (et donc annulées à la fin). Le jeu de données existant (seed --synthetic) est réutilisé.
+    """
+
+    def __init__(self):
+        self.admin = User.objects.create_superuser(
+            username="benchmark_admin", email="benchmark_admin@example.com", password=PASSWORD
+        )
+        self.user = User.objects.create_user(
+            username="benchmark_user", email="benchmark_user@example.com", password=PASSWORD
+        )
+        self.tokens = {
+            'admin': str(RefreshToken.for_user(self.admin).access_token),
+            'user': str(RefreshToken.for_user(self.user).access_token),
+        }
+
+        self.certification = Certification.objects.order_by('pk').first()
+        if self.certification is None:
+            self.certification = Certification.objects.create(name="Benchmark")
+        link = CertificationCompetency.objects.filter(certification=self.certification).order_by('pk').first()
+        if link is None:
+            competency = Competency.objects.order_by('pk').first() or Competency.objects.create(name="Benchmark")
+            link = CertificationCompetency.objects.create(certification=self.certification, competency=competency)
+        self.competency_ids = list(
+            CertificationCompetency.objects.filter(certification=self.certification).values_list('competency_id', flat=True)
+        )
+
+        question_ids = list(
+            Question.objects.filter(competencies__in=self.competency_ids)
+            .order_by('pk').values_list('pk', flat=True).distinct()[:20]
+        )
+        if not question_ids:
+            question = Question.objects.create(text="Question de benchmark")
+            question.competencies.add(link.competency_id)
+            Answer.objects.create(question=question, text="Bonne réponse", is_correct=True)
+            question_ids = [question.pk]
+        correct_answers = {}
+        for answer_id, question_id in Answer.objects.filter(
+            question_id__in=question_ids, is_correct=True
+        ).order_by('pk').values_list('id', 'question_id'):
+            correct_answers.setdefault(question_id, answer_id)
+        self.answer_sheet = [
+            {"question_id": question_id, "answer_id": answer_id} for question_id, answer_id in correct_answers.items()
+        ]
+        self.registrations = 0
+
+    def auth_headers(self, role):
+        if role is None:
+            return {}
+        return {'HTTP_AUTHORIZATION': f"Bearer {self.tokens[role]}"}
+
+
+class Scenario:
+    """
+    Une requête mesurée. `prepare(ctx)` est exécuté hors mesure et retourne
+    (chemin, corps de requête) ; l'état créé est annulé après chaque itération.
+    """
+
+    def __init__(self, name, method, prepare, role='user'):
+        self.name = name
+        self.method = method
+        self.prepare = prepare
+        self.role = role
+
+
+def _static(url_name):
+    return lambda ctx: (reverse(url_name), None)
+
+
+def _certification_detail(ctx):
+    return reverse('certification-detail', kwargs={'pk': ctx.certification.pk}), None
+
+
+def _competency_detail(ctx):
+    return reverse('competency-detail', kwargs={'pk': ctx.competency_ids[0]}), None
+
+
+def _certification_competencies(ctx):
+    url = reverse('certification-competency-update', kwargs={'certification_id': ctx.certification.pk})
+    return url, {"competency_ids": ctx.competency_ids}
+
+
+def _logo_variant(ctx):
+    """Variante déjà sur disque (cas courant) ; le logo est dédoublonné d'une itération à l'autre"""
+    buffer = BytesIO()
+    Image.new("RGB", (512, 512), color="navy").save(buffer, format="PNG")
+    logo_name = logo_storage().save(f"{LOGO_DIRECTORY}/benchmark.png", ContentFile(buffer.getvalue()))
+    size = variant_sizes()[0]
+    ensure_variant(logo_name, size, 'webp')
+    return reverse('certification-logo-variant', kwargs={'name': f"{logo_stem(logo_name)}-{size}.webp"}), None
+
+
+def _exam_start(ctx):
+    url = reverse('exam-session-start', kwargs={'certification_id': ctx.certification.pk})
+    return url, {"question_count": 20}
+
+
+def _exam_submit(ctx):
+    session = ExamSession.objects.create(user=ctx.user, certification=ctx.certification)
+    return reverse('exam-session-submit', kwargs={'session_id': session.pk}), {"answers": ctx.answer_sheet}
+
+
+def _leaderboard(ctx):
+    return reverse('dashboard-leaderboard', kwargs={'certification_id': ctx.certification.pk}), None
+
+
+def _analytics_daily(ctx):
+    return reverse('analytics-certification-daily', kwargs={'certification_id': ctx.certification.pk}), None
+
+
+def _user_search(ctx):
+    return reverse('user-search') + "?q=bench", None
+
+
+def _user_detail(ctx):
+    return reverse('user-detail', kwargs={'pk': ctx.user.pk}), None
+
+
+def _user_admin_update(ctx):
+    return reverse('user-admin-update', kwargs={'pk': ctx.user.pk}), None
+
+
+def _user_delete(ctx):
+    user = User.objects.create(username="benchmark_delete", email="benchmark_delete@example.com")
+    return reverse('user-delete', kwargs={'pk': user.pk}), None
+
+
+def _user_register(ctx):
+    ctx.registrations += 1
+    username = f"benchmark_register_{ctx.registrations}"
+    return reverse('user-register'), {"username": username, "email": f"{username}@example.com", "password": PASSWORD}
+
+
+def _token_obtain(ctx):
+    return reverse('token_obtain_pair'), {"username": ctx.user.username, "password": PASSWORD}
+
+
+def _session_refresh_token(ctx):
+    """Refresh token d'une session déjà vérifiée une fois : état de chaîne présent dans le cache"""
+    refresh = str(RevocableRefreshToken.for_user(ctx.user))
+    RevocableRefreshToken(refresh)
+    return refresh
+
+
+def _token_refresh(ctx):
+    return reverse('token_refresh'), {"refresh": _session_refresh_token(ctx)}
+
+
+def _logout(ctx):
+    return reverse('logout'), {"refresh": _session_refresh_token(ctx)}
+
+
+def _reset_password(ctx):
+    return reverse('reset-password'), {"email": ctx.user.email}
+
+
+SCENARIOS = [
+    Scenario('home_api', 'get', _static('home_api')),
+    Scenario('certification-list-create', 'get', _static('certification-list-create')),
+    Scenario('certification-detail', 'get', _certification_detail),
+    Scenario('certification-competency-update', 'put', _certification_competencies, role='admin'),
+    Scenario('competency-list-create', 'get', _static('competency-list-create')),
+    Scenario('competency-detail', 'get', _competency_detail),
+    Scenario('certification-logo-variant', 'get', _logo_variant, role=None),
+    Scenario('exam-session-start', 'post', _exam_start),
+    Scenario('exam-session-submit', 'post', _exam_submit),
+    Scenario('user-register', 'post', _user_register, role=None),
+    Scenario('user-list', 'get', _static('user-list'), role='admin'),
+    Scenario('user-search', 'get', _user_search, role='admin'),
+    Scenario('user-self-update', 'get', _static('user-self-update')),
+    Scenario('user-detail', 'get', _user_detail, role='admin'),
+    Scenario('user-admin-update', 'get', _user_admin_update, role='admin'),
+    Scenario('user-delete', 'delete', _user_delete, role='admin'),
+    Scenario('token_obtain_pair', 'post', _token_obtain, role=None),
+    Scenario('token_refresh', 'post', _token_refresh, role=None),
+    Scenario('logout', 'post', _logout),
+    Scenario('reset-password', 'post', _reset_password, role=None),
+    Scenario('dashboard', 'get', _static('dashboard')),
+    Scenario('dashboard-leaderboard', 'get', _leaderboard),
+    Scenario('analytics-certifications', 'get', _static('analytics-certifications'), role='admin'),
+    Scenario('analytics-certification-daily', 'get', _analytics_daily, role='admin'),
+    Scenario('schema', 'get', _static('schema')),
+    Scenario('swagger-ui', 'get', _static('swagger-ui'), role=None),
+    Scenario('redoc', 'get', _static('redoc'), role=None),
+]
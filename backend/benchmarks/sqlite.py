@@ -0,0 +1,114 @@
+# backend/benchmarks/sqlite.py
+"""
+Effet des pragmas SQLite sur une charge d'écriture : soumissions d'examen validées une à une
+(une transaction et un commit par requête, donc un fsync selon `synchronous`).
+
+Chaque configuration tourne sur sa propre copie de la base courante (API de sauvegarde
+SQLite), placée à côté d'elle pour mesurer le même disque : la base de développement n'est pas modifiée.
+"""
+
+import os
+import sqlite3
+import tempfile
+import time
+
+from django.conf import settings
+from django.db import connection
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from certifications.catalog import invalidate_catalog_validators
+from certifications.models import ExamSession
+from certifications.snapshot import invalidate_catalog_snapshot
+from dashboard.leaderboard import reset_rank_indexes
+from dashboard.services import invalidate_dashboard
+from .runner import percentile
+from .scenarios import BenchmarkContext
+
+# Comportement SQLite par défaut (journal supprimé à chaque commit, fsync complet)
+BASELINE_INIT_COMMAND = 'PRAGMA journal_mode=DELETE;PRAGMA synchronous=FULL;PRAGMA busy_timeout=20000'
+
+
+def pragma_configurations():
+    return {
+        'defaults': BASELINE_INIT_COMMAND,
+        'tuned': connection.settings_dict['OPTIONS'].get('init_command', ''),
+    }
+
+
+def copy_database(source, target):
+    origin, copy = sqlite3.connect(source), sqlite3.connect(target)
+    try:
+        origin.backup(copy)
+    finally:
+        origin.close()
+        copy.close()
+
+
+def measure_submissions(submissions):
+    ctx = BenchmarkContext()
+    client = Client()
+    session_ids = [
+        ExamSession.objects.create(user=ctx.user, certification=ctx.certification).pk for _ in range(submissions)
+    ]
+    durations = []
+    try:
+        start = time.perf_counter()
+        for session_id in session_ids:
+            began = time.perf_counter()
+            response = client.post(
+                reverse('exam-session-submit', kwargs={'session_id': session_id}),
+                data={"answers": ctx.answer_sheet},
+                content_type='application/json',
+                **ctx.auth_headers('user'),
+            )
+            durations.append((time.perf_counter() - began) * 1000)
+            if response.status_code != 200:
+                raise RuntimeError(f"Soumission refusée ({response.status_code}) : {response.content[:200]!r}")
+        elapsed = time.perf_counter() - start
+    finally:
+        # Identifiants propres à la copie : pas de cache applicatif orphelin
+        invalidate_dashboard(ctx.user.id, ctx.admin.id)
+        reset_rank_indexes(ctx.certification.pk)
+    return {
+        "submissions_per_s": round(submissions / elapsed, 1),
+        "p50_ms": round(percentile(durations, 0.50), 2),
+        "p95_ms": round(percentile(durations, 0.95), 2),
+    }
+
+
+def run_sqlite_benchmark(submissions=200, configurations=None):
+    """
+    Retourne {configuration: {"submissions_per_s", "p50_ms", "p95_ms"}}.
+    `configurations` : {nom: init_command} ; par défaut, pragmas SQLite par défaut et SQLITE_PRAGMAS.
+    """
+    if connection.vendor != 'sqlite' or connection.is_in_memory_db():
+        raise LookupError("Benchmark réservé à une base SQLite sur fichier.")
+    configurations = configurations or pragma_configurations()
+    original_name = connection.settings_dict['NAME']
+    original_options = connection.settings_dict['OPTIONS']
+    results = {}
+    connection.close()
+    test_settings = override_settings(
+        ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver'],
+        EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+    )
+    with tempfile.TemporaryDirectory(prefix='benchmark-sqlite-', dir=os.path.dirname(original_name)) as directory, test_settings:
+        try:
+            for name, init_command in configurations.items():
+                path = os.path.join(directory, f'{name}.sqlite3')
+                copy_database(original_name, path)
+                # Nouvelle connexion sur la copie, avec les pragmas de la configuration
+                connection.settings_dict['NAME'] = path
+                connection.settings_dict['OPTIONS'] = {**original_options, 'init_command': init_command}
+                try:
+                    results[name] = measure_submissions(submissions)
+                finally:
+                    connection.close()
+        finally:
+            connection.settings_dict['NAME'] = original_name
+            connection.settings_dict['OPTIONS'] = original_options
+            invalidate_catalog_validators()
+            invalidate_catalog_snapshot()
+    return results
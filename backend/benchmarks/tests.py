@@ -0,0 +1,86 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.urls import URLPattern, URLResolver, get_resolver
+
+from benchmarks.concurrency import ENDPOINTS, MODES, run_concurrency_benchmark
+from benchmarks.runner import check_budgets, run_benchmarks
+from benchmarks.scenarios import EXCLUDED_URL_NAMESPACES, SCENARIOS
+
+
+def iter_url_names(patterns, namespace=None):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_url_names(pattern.url_patterns, pattern.namespace or namespace)
+        elif isinstance(pattern, URLPattern) and pattern.name and namespace not in EXCLUDED_URL_NAMESPACES:
+            yield pattern.name
+
+
+class BenchmarkScenarioTests(TestCase):
+    def test_every_url_has_a_scenario(self):
+        url_names = set(iter_url_names(get_resolver().url_patterns))
+        scenario_names = {scenario.name for scenario in SCENARIOS}
+        self.assertEqual(url_names - scenario_names, set())
+
+    def test_run_benchmarks_measures_every_scenario(self):
+        results = run_benchmarks(iterations=1, warmup=0)
+        self.assertEqual(set(results), {scenario.name for scenario in SCENARIOS})
+        for name, result in results.items():
+            self.assertLess(result["status"], 400, name)
+            self.assertGreaterEqual(result["p95_ms"], result["p50_ms"])
+
+    def test_run_benchmarks_rolls_back_changes(self):
+        from certifications.models import ExamSession
+        run_benchmarks(iterations=1, warmup=0, only=['exam-session-submit'])
+        self.assertFalse(ExamSession.objects.exists())
+
+    def test_check_budgets_reports_regressions(self):
+        results = {"dashboard": {"p50_ms": 1.0, "p95_ms": 5.0, "queries": 4, "status": 200}}
+        self.assertEqual(check_budgets(results, {"dashboard": {"max_queries": 4, "p95_ms": 10}}), [])
+        self.assertEqual(len(check_budgets(results, {"dashboard": {"max_queries": 1, "p95_ms": 1}})), 2)
+
+    def test_benchmark_command_fails_on_budget_regression(self):
+        fd, path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(fd, 'w') as fp:
+            json.dump({"exam-session-submit": {"max_queries": 0}}, fp)
+        self.addCleanup(os.remove, path)
+        with self.assertRaises(CommandError):
+            call_command('benchmark', '--iterations', '1', '--only', 'exam-session-submit', '--budgets', path, stdout=StringIO(), stderr=StringIO())
+
+
+class ConcurrencyBenchmarkTests(TransactionTestCase):
+    def test_every_mode_serves_every_endpoint(self):
+        # Données validées : les handlers lisent la base depuis d'autres threads
+        get_user_model().objects.create_user(username="concurrency", password="password123")
+        results = run_concurrency_benchmark(concurrency=2, requests=4, warmup=1)
+        self.assertEqual(set(results), set(MODES))
+        for mode, by_endpoint in results.items():
+            self.assertEqual(set(by_endpoint), set(ENDPOINTS))
+            for name, result in by_endpoint.items():
+                self.assertEqual(result["errors"], 0, f"{mode} {name}")
+                self.assertGreater(result["requests_per_s"], 0)
+
+    def test_command_requires_a_user(self):
+        with self.assertRaises(CommandError):
+            call_command('benchmark_concurrency', '--requests', '1', stdout=StringIO())
+
+
+class SqlitePragmasTests(TestCase):
+    def test_pragmas_applied_to_each_connection(self):
+        # La connexion de test est elle aussi ouverte avec OPTIONS['init_command']
+        with connection.cursor() as cursor:
+            for name in ('cache_size', 'busy_timeout'):
+                cursor.execute(f'PRAGMA {name}')
+                self.assertEqual(cursor.fetchone()[0], settings.SQLITE_PRAGMAS[name], name)
+
+    def test_benchmark_requires_a_file_database(self):
+        with self.assertRaises(CommandError):
+            call_command('benchmark_sqlite', '--submissions', '1', stdout=StringIO())
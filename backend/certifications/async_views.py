@@ -0,0 +1,35 @@
+# backend/certifications/async_views.py
+"""Lectures du catalogue pour ASGI (voir async_api) : mêmes réponses que les vues DRF de views.py"""
+
+from async_api import authenticated, json_response
+from pagination import NameKeysetPagination
+from .catalog import acatalog_validators, not_modified_response, with_validators
+from .models import Certification, Competency
+from .serializers import CertificationSerializer, CompetencySerializer
+from .snapshot import acatalog_snapshot
+
+
+async def paginated_response(request, queryset, serializer_class, section):
+    # GET conditionnel et instantané du catalogue comme CatalogConditionalGetMixin
+    etag, last_modified = await acatalog_validators()
+    not_modified = not_modified_response(request, etag, last_modified)
+    if not_modified is not None:
+        return not_modified
+    snapshot = await acatalog_snapshot(request, etag)
+    response = snapshot and getattr(snapshot, section).response(request)
+    if response is not None:
+        return with_validators(response, etag, last_modified)
+    paginator = NameKeysetPagination()
+    page = await paginator.apaginate_queryset(queryset, request)
+    data = serializer_class(page, many=True, context={'request': request}).data
+    return with_validators(json_response(paginator.get_paginated_data(data)), etag, last_modified)
+
+
+@authenticated
+async def certification_list(request):
+    return await paginated_response(request, Certification.objects.with_competencies(), CertificationSerializer, 'certifications')
+
+
+@authenticated
+async def competency_list(request):
+    return await paginated_response(request, Competency.objects.all(), CompetencySerializer, 'competencies')
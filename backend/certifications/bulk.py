@@ -0,0 +1,41 @@
+# backend/certifications/bulk.py
+"""
+Outils d'insertion en masse partagés par les commandes de chargement
+(import de banque de questions, génération de jeux de données synthétiques).
+"""
+
+from django.core.management.color import no_style
+from django.db import connection
+
+
+def insert_rows(model, field_names, rows):
+    """
+    INSERT multi-lignes via executemany, sans instancier de modèles :
+    réservé aux tables dont les clés primaires générées ne sont pas relues.
+    Les valeurs doivent déjà être adaptées à la base (cf. connection.ops.adapt_*).
+    """
+    if not rows:
+        return
+    quote = connection.ops.quote_name
+    columns = ', '.join(quote(model._meta.get_field(name).column) for name in field_names)
+    placeholders = ', '.join(['%s'] * len(field_names))
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {quote(model._meta.db_table)} ({columns}) VALUES ({placeholders})",
+            rows,
+        )
+
+
+def next_id(model):
+    """Premier identifiant libre d'une table, pour les insertions à clés explicites"""
+    last_id = model.objects.order_by('-pk').values_list('pk', flat=True).first()
+    return (last_id or 0) + 1
+
+
+def reset_sequences(*models):
+    """Réaligne les séquences d'auto-incrément après des insertions à clés explicites (PostgreSQL)"""
+    statements = connection.ops.sequence_reset_sql(no_style(), models)
+    if statements:
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
@@ -0,0 +1,90 @@
+# backend/certifications/catalog.py
+"""
+Validateurs HTTP du catalogue (GET conditionnel) dérivés de CatalogVersion.
+
+Le couple (ETag, Last-Modified) est gardé dans le cache : une requête conditionnelle sur un
+catalogue inchangé reçoit un 304 sans requête SQL ni sérialisation. Chaque modification du
+catalogue incrémente la version (receivers de certifications.signals) et retire les validateurs
+du cache après commit ; une lecture concurrente ne peut y remettre une version périmée que
+pour CATALOG_VALIDATORS_TIMEOUT secondes au plus.
+
+Ce cache n'est utilisé que s'il est partagé entre les workers : un cache propre au processus
+ne verrait pas les invalidations des autres, qui serviraient l'ancien ETag (et l'instantané
+qu'il versionne, et des 304 sur des copies périmées). CatalogVersion est alors lue à chaque
+requête (une lecture par clé primaire).
+"""
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from shared_cache import is_shared_cache
+from .models import CatalogVersion
+
+CATALOG_VALIDATORS_KEY = 'catalog:validators'
+
+
+def validators_timeout():
+    return getattr(settings, 'CATALOG_VALIDATORS_TIMEOUT', 300)
+
+
+def load_validators():
+    state = CatalogVersion.objects.filter(pk=1).values_list('version', 'updated_at').first()
+    if state is None:
+        return None, None
+    version, updated_at = state
+    # L'horodatage distingue deux bases dont les compteurs se recouvrent (base recréée)
+    return f'W/"catalog-{version}-{int(updated_at.timestamp())}"', int(updated_at.timestamp())
+
+
+def catalog_validators():
+    """(ETag, Last-Modified en secondes) du catalogue, ou (None, None) avant toute modification"""
+    if not is_shared_cache(DEFAULT_CACHE_ALIAS):
+        return load_validators()
+    validators = cache.get(CATALOG_VALIDATORS_KEY)
+    if validators is None:
+        validators = load_validators()
+        # add : n'écrase pas les validateurs plus récents posés entre-temps
+        cache.add(CATALOG_VALIDATORS_KEY, validators, validators_timeout())
+    return validators
+
+
+async def acatalog_validators():
+    if not is_shared_cache(DEFAULT_CACHE_ALIAS):
+        return await sync_to_async(load_validators)()
+    validators = await cache.aget(CATALOG_VALIDATORS_KEY)
+    if validators is None:
+        validators = await sync_to_async(load_validators)()
+        await cache.aadd(CATALOG_VALIDATORS_KEY, validators, validators_timeout())
+    return validators
+
+
+def invalidate_catalog_validators():
+    cache.delete(CATALOG_VALIDATORS_KEY)
+
+
+def validator_headers(etag, last_modified):
+    if etag is None:
+        return {}
+    # Contenu réservé aux utilisateurs authentifiés, revalidé à chaque affichage
+    return {'ETag': etag, 'Last-Modified': http_date(last_modified), 'Cache-Control': 'private, no-cache'}
+
+
+def not_modified_response(request, etag, last_modified):
+    """Réponse 304 (ou 412) si les préconditions de la requête sont satisfaites, sinon None"""
+    if etag is None:
+        return None
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        for header, value in validator_headers(etag, last_modified).items():
+            response.headers[header] = value
+    return response
+
+
+def with_validators(response, etag, last_modified):
+    if 200 <= response.status_code < 300:
+        for header, value in validator_headers(etag, last_modified).items():
+            response.headers[header] = value
+    return response
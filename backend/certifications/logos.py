@@ -0,0 +1,114 @@
+# backend/certifications/logos.py
+"""
+Logos des certifications : originaux nommés par l'empreinte de leur contenu et variantes
+redimensionnées (WebP et PNG) servies avec un cache HTTP d'un an (immutable).
+
+- Un envoi identique à un logo existant réutilise son fichier (LogoStorage).
+- Les variantes sont générées à l'enregistrement du logo (certifications.signals), puis
+  gardées sur disque (certification_logos/variants/) ; une variante absente est
+  régénérée à la première demande (LogoVariantView).
+- Le nom d'une variante dérive de celui de l'original : un nouveau logo change toutes les URL.
+"""
+
+import hashlib
+import logging
+import posixpath
+import re
+import threading
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.urls import reverse
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+LOGO_DIRECTORY = 'certification_logos'
+VARIANT_DIRECTORY = f'{LOGO_DIRECTORY}/variants'
+VARIANT_FORMATS = {
+    'webp': ('WEBP', 'image/webp', {'quality': 85, 'method': 6}),
+    'png': ('PNG', 'image/png', {'optimize': True}),
+}
+VARIANT_NAME = re.compile(r'^(?P<stem>[\w-]+)-(?P<size>\d+)\.(?P<format>webp|png)$')
+
+_lock = threading.Lock()
+
+
+class LogoStorage(FileSystemStorage):
+    """Fichiers nommés par l'empreinte SHA-256 de leur contenu : un doublon n'est pas réécrit"""
+
+    def save(self, name, content, max_length=None):
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+        content.seek(0)
+        directory, filename = posixpath.split(name)
+        name = posixpath.join(directory, digest.hexdigest()[:32] + posixpath.splitext(filename)[1].lower())
+        if self.exists(name):
+            return name
+        return super().save(name, content, max_length)
+
+
+def logo_storage():
+    return LogoStorage()
+
+
+def variant_sizes():
+    """Côtés (px) des variantes carrées"""
+    return getattr(settings, 'CERTIFICATION_LOGO_SIZES', (64, 256))
+
+
+def logo_stem(logo_name):
+    return posixpath.splitext(posixpath.basename(logo_name))[0]
+
+
+def variant_path(stem, size, fmt):
+    return f'{VARIANT_DIRECTORY}/{stem}-{size}.{fmt}'
+
+
+def render_variant(source, size, fmt):
+    """Logo réduit pour tenir dans size × size (proportions conservées), encodé en `fmt`"""
+    pillow_format, _, options = VARIANT_FORMATS[fmt]
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((size, size), Image.Resampling.LANCZOS)
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA')
+        buffer = BytesIO()
+        image.save(buffer, format=pillow_format, **options)
+    return ContentFile(buffer.getvalue())
+
+
+def ensure_variant(logo_name, size, fmt):
+    """Chemin de la variante, générée depuis l'original si elle n'est pas encore sur disque"""
+    path = variant_path(logo_stem(logo_name), size, fmt)
+    if not default_storage.exists(path):
+        with _lock:
+            if not default_storage.exists(path):
+                with logo_storage().open(logo_name) as source:
+                    default_storage.save(path, render_variant(source, size, fmt))
+    return path
+
+
+def generate_variants(logo_name):
+    """Toutes les variantes d'un logo ; une image illisible est journalisée sans bloquer l'enregistrement"""
+    try:
+        for size in variant_sizes():
+            for fmt in VARIANT_FORMATS:
+                ensure_variant(logo_name, size, fmt)
+    except OSError:
+        logger.warning("Variantes du logo %s non générées", logo_name, exc_info=True)
+
+
+def variant_urls(logo_name, request=None):
+    """{côté: {format: URL}} des variantes d'un logo"""
+    stem = logo_stem(logo_name)
+    urls = {}
+    for size in variant_sizes():
+        urls[str(size)] = {}
+        for fmt in VARIANT_FORMATS:
+            url = reverse('certification-logo-variant', kwargs={'name': f'{stem}-{size}.{fmt}'})
+            urls[str(size)][fmt] = request.build_absolute_uri(url) if request is not None else url
+    return urls
@@ -0,0 +1,217 @@
+# backend/certifications/management/commands/import_questions.py
+
+import csv
+import json
+import time
+from itertools import islice
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from certifications.bulk import insert_rows
+from certifications.models import Answer, Competency, Question
+from certifications.signals import bump_catalog_version, refresh_question_pools
+
+CHUNK_SIZE = 64 * 1024
+LIST_SEPARATOR = '|'
+
+
+def iter_json_array(fp):
+    """
+    Parcourt un tableau JSON élément par élément sans charger le fichier entier :
+    seul le morceau de fichier en cours de décodage est conservé en mémoire.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    started = False
+    eof = False
+    while True:
+        # Saute les blancs et séparateurs déjà présents dans le tampon
+        while pos < len(buffer) and buffer[pos] in ' \t\r\n' + (',' if started else ''):
+            pos += 1
+        if pos < len(buffer):
+            if not started:
+                if buffer[pos] != '[':
+                    raise CommandError("Le fichier JSON doit contenir un tableau de questions.")
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == ']':
+                return
+            try:
+                item, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Objet incomplet : on lit la suite du fichier
+                if eof:
+                    raise CommandError("Fichier JSON tronqué ou invalide.")
+            else:
+                yield item
+                continue
+        if eof:
+            raise CommandError("Fichier JSON tronqué : ']' final manquant.")
+        chunk = fp.read(CHUNK_SIZE)
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+
+def iter_json_lines(fp):
+    """Un objet JSON par ligne (JSON Lines)"""
+    for number, line in enumerate(fp, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise CommandError(f"Ligne {number} : JSON invalide ({exc.msg}, colonne {exc.colno}).")
+
+
+def iter_csv_rows(fp, delimiter):
+    """
+    Colonnes attendues : text, explanation, competencies, answers, correct.
+    `competencies` et `answers` sont séparées par '|', `correct` contient les
+    positions (à partir de 1) des bonnes réponses, séparées par '|'.
+    """
+    for row in csv.DictReader(fp, delimiter=delimiter):
+        answers = [text.strip() for text in (row.get('answers') or '').split(LIST_SEPARATOR) if text.strip()]
+        correct = {int(pos) for pos in (row.get('correct') or '').split(LIST_SEPARATOR) if pos.strip().isdigit()}
+        yield {
+            "text": row.get('text'),
+            "explanation": row.get('explanation'),
+            "competencies": [name for name in (row.get('competencies') or '').split(LIST_SEPARATOR) if name.strip()],
+            "answers": [
+                {"text": text, "is_correct": position in correct}
+                for position, text in enumerate(answers, start=1)
+            ],
+        }
+
+
+class Command(BaseCommand):
+    help = (
+        "Importe une banque de questions (JSON, JSON Lines ou CSV) en flux, "
+        "par lots insérés en masse"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="Fichier à importer (.json, .jsonl ou .csv)")
+        parser.add_argument(
+            '--format', choices=['json', 'jsonl', 'csv'],
+            help="Format du fichier (déduit de l'extension par défaut)"
+        )
+        parser.add_argument('--batch-size', type=int, default=1000, help="Nombre de questions par lot (défaut : 1000)")
+        parser.add_argument('--delimiter', default=',', help="Séparateur de colonnes CSV (défaut : ',')")
+        parser.add_argument(
+            '--create-competencies', action='store_true',
+            help="Crée les compétences inconnues au lieu d'ignorer le tag"
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options['path'])
+        if not path.exists():
+            raise CommandError(f"Fichier introuvable : {path}")
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size doit être supérieur à 0.")
+        if not connection.features.can_return_rows_from_bulk_insert:
+            raise CommandError("La base de données doit renvoyer les clés primaires lors d'un bulk_create.")
+
+        file_format = options['format'] or path.suffix.lstrip('.').lower()
+        if file_format not in ('json', 'jsonl', 'csv'):
+            raise CommandError(f"Format non supporté : {file_format}")
+
+        self.create_competencies = options['create_competencies']
+        # Table de correspondance nom -> id chargée une seule fois
+        self.competency_ids = dict(Competency.objects.values_list('name', 'id'))
+        self.imported = 0
+        self.skipped = 0
+        self.ignored_tags = 0
+
+        self.stdout.write(f"🔄 Import de {path} ({file_format})...")
+        start = time.perf_counter()
+
+        with path.open(encoding='utf-8', newline='' if file_format == 'csv' else None) as fp:
+            if file_format == 'json':
+                records = iter_json_array(fp)
+            elif file_format == 'jsonl':
+                records = iter_json_lines(fp)
+            else:
+                records = iter_csv_rows(fp, options['delimiter'])
+
+            while True:
+                batch = list(islice(records, options['batch_size']))
+                if not batch:
+                    break
+                self.import_batch(batch)
+                if options['verbosity'] >= 2:
+                    self.stdout.write(f"  … {self.imported} questions importées")
+
+        elapsed = time.perf_counter() - start
+        rate = self.imported / elapsed if elapsed > 0 else 0
+        self.stdout.write(
+            f"✅ {self.imported} questions importées en {elapsed:.2f} s ({rate:.0f} questions/s)"
+        )
+        if self.skipped:
+            self.stdout.write(f"⚠️ {self.skipped} enregistrement(s) invalide(s) ignoré(s).")
+        if self.ignored_tags:
+            self.stdout.write(f"⚠️ {self.ignored_tags} tag(s) de compétence inconnu(s) ignoré(s).")
+
+    def clean_record(self, record):
+        """Retourne (texte, explication, réponses, noms de compétences) ou None si invalide"""
+        if not isinstance(record, dict):
+            return None
+        text = (record.get('text') or '').strip()
+        answers = [
+            ((answer.get('text') or '').strip(), bool(answer.get('is_correct')))
+            for answer in record.get('answers') or []
+            if isinstance(answer, dict)
+        ]
+        answers = [(answer_text, is_correct) for answer_text, is_correct in answers if answer_text]
+        if not text or not answers or not any(is_correct for _, is_correct in answers):
+            return None
+        names = {name.strip() for name in record.get('competencies') or [] if isinstance(name, str) and name.strip()}
+        return text, record.get('explanation') or None, answers, names
+
+    def resolve_competencies(self, names):
+        missing = names - self.competency_ids.keys()
+        if missing and self.create_competencies:
+            Competency.objects.bulk_create([Competency(name=name) for name in missing], ignore_conflicts=True)
+            bump_catalog_version(sender=Competency)  # bulk_create n'émet pas post_save
+            self.competency_ids.update(Competency.objects.filter(name__in=missing).values_list('name', 'id'))
+
+    def import_batch(self, batch):
+        records = []
+        for record in batch:
+            cleaned = self.clean_record(record)
+            if cleaned is None:
+                self.skipped += 1
+            else:
+                records.append(cleaned)
+        if not records:
+            return
+
+        with transaction.atomic():
+            self.resolve_competencies(set().union(*(names for _, _, _, names in records)))
+
+            questions = Question.objects.bulk_create([
+                Question(text=text, explanation=explanation) for text, explanation, _, _ in records
+            ])
+
+            # Réponses et liens question/compétence : seuls les ids des questions sont nécessaires,
+            # on évite donc l'instanciation de centaines de milliers d'objets modèles
+            answers = []
+            links = []
+            for question, (_, _, record_answers, names) in zip(questions, records):
+                answers.extend(
+                    (question.id, answer_text, is_correct) for answer_text, is_correct in record_answers
+                )
+                for name in names:
+                    if name in self.competency_ids:
+                        links.append((question.id, self.competency_ids[name]))
+                    else:
+                        self.ignored_tags += 1
+            insert_rows(Answer, ['question', 'text', 'is_correct'], answers)
+            insert_rows(Question.competencies.through, ['question', 'competency'], links)
+            refresh_question_pools(sender=Question)  # Insertion directe : pas de m2m_changed
+
+        self.imported += len(questions)
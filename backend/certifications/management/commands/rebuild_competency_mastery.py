@@ -0,0 +1,69 @@
+# backend/certifications/management/commands/rebuild_competency_mastery.py
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, Max, Q
+from django.db.models.functions import Coalesce
+from certifications.models import CompetencyMastery, Question, UserQuestionResponse
+
+class Command(BaseCommand):
+    help = "Reconstruit la table CompetencyMastery (agrégats par utilisateur et compétence) à partir de l'historique des réponses"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, help="Limite la reconstruction à un utilisateur (id)")
+        parser.add_argument('--batch-size', type=int, default=5000, help="Nombre de lignes par lot d'insertion (défaut : 5000)")
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size doit être supérieur à 0.")
+        self.stdout.write("🔄 Reconstruction des agrégats de maîtrise des compétences...")
+
+        responses = UserQuestionResponse.objects.filter(question__competencies__isnull=False)
+        masteries = CompetencyMastery.objects.all()
+        if options['user'] is not None:
+            responses = responses.filter(exam_session__user_id=options['user'])
+            masteries = masteries.filter(user_id=options['user'])
+
+        # Agrégation côté base, une ligne par (utilisateur, compétence)
+        rows = (
+            responses
+            .values('exam_session__user_id', 'question__competencies')
+            .annotate(
+                attempts=Count('id'),
+                correct_answers=Count('id', filter=Q(is_correct=True)),
+                last_seen_at=Max(Coalesce('exam_session__completed_at', 'exam_session__started_at')),
+            )
+            .order_by()
+        )
+
+        created = 0
+        with transaction.atomic():
+            masteries.delete()
+            # Agrégats reconstruits selon les liens actuels : le crédit de chaque réponse aussi, pour
+            # que ses suppressions et corrections retirent exactement ce qui est recompté ici
+            credited = UserQuestionResponse.objects.all()
+            if options['user'] is not None:
+                credited = credited.filter(exam_session__user_id=options['user'])
+            competencies_by_question = {}
+            for question_id, competency_id in Question.competencies.through.objects.values_list('question_id', 'competency_id'):
+                competencies_by_question.setdefault(question_id, []).append(competency_id)
+            credited.exclude(question_id__in=competencies_by_question).update(credited_competency_ids=[])
+            for question_id, competency_ids in competencies_by_question.items():
+                credited.filter(question_id=question_id).update(credited_competency_ids=sorted(competency_ids))
+            batch = []
+            for row in rows.iterator(chunk_size=options['batch_size']):
+                batch.append(CompetencyMastery(
+                    user_id=row['exam_session__user_id'],
+                    competency_id=row['question__competencies'],
+                    attempts=row['attempts'],
+                    correct_answers=row['correct_answers'],
+                    last_seen_at=row['last_seen_at'],
+                ))
+                if len(batch) >= options['batch_size']:
+                    CompetencyMastery.objects.bulk_create(batch)
+                    created += len(batch)
+                    batch = []
+            CompetencyMastery.objects.bulk_create(batch)
+            created += len(batch)
+
+        self.stdout.write(f"✅ {created} agrégat(s) de maîtrise reconstruit(s) !")
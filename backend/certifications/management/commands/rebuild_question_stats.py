@@ -0,0 +1,33 @@
+# backend/certifications/management/commands/rebuild_question_stats.py
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from certifications.models import Question, UserQuestionResponse
+
+class Command(BaseCommand):
+    help = "Reconstruit les compteurs total_attempts / correct_attempts des questions à partir de l'historique des réponses"
+
+    def handle(self, *args, **kwargs):
+        self.stdout.write("🔄 Reconstruction des compteurs de questions...")
+
+        # Une seule requête UPDATE ... SET col = (SELECT COUNT(...)) exécutée côté base
+        responses = (
+            UserQuestionResponse.objects
+            .filter(question=OuterRef('pk'))
+            .order_by()
+            .values('question')
+        )
+        total_subquery = responses.annotate(total=Count('id')).values('total')
+        correct_subquery = responses.annotate(
+            correct=Count('id', filter=Q(is_correct=True))
+        ).values('correct')
+
+        with transaction.atomic():
+            updated = Question.objects.update(
+                total_attempts=Coalesce(Subquery(total_subquery, output_field=IntegerField()), Value(0)),
+                correct_attempts=Coalesce(Subquery(correct_subquery, output_field=IntegerField()), Value(0)),
+            )
+
+        self.stdout.write(f"✅ Compteurs reconstruits pour {updated} question(s) !")
@@ -1,19 +1,58 @@
 # backend/certifications/management/commands/seed.py
 
 import os
+import random
+import time
+from datetime import timedelta
+
 import django
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth import get_user_model
-from certifications.models import Certification, Competency, CertificationCompetency
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.db.models import Count
+from django.utils import timezone
+from certifications.bulk import insert_rows, next_id, reset_sequences
+from certifications.models import (
+    Certification,
+    Competency,
+    CertificationCompetency,
+    Question,
+    Answer,
+    ExamSession,
+    UserQuestionResponse,
+)
+from certifications.signals import refresh_question_pools
 
 class Command(BaseCommand):
     help = "Seed the database with initial data including certifications and their competencies"
 
-    def handle(self, *args, **kwargs):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--synthetic', action='store_true',
+            help="Génère en plus un jeu de données volumineux et reproductible (benchmarks, tests de charge)"
+        )
+        parser.add_argument('--users', type=int, default=1000, help="Nombre d'utilisateurs synthétiques (défaut : 1000)")
+        parser.add_argument('--sessions', type=int, default=10000, help="Nombre de sessions d'examen à générer (défaut : 10000)")
+        parser.add_argument(
+            '--responses-per-session', type=int, default=20,
+            help="Nombre de réponses par session (défaut : 20)"
+        )
+        parser.add_argument(
+            '--questions-per-competency', type=int, default=50,
+            help="Nombre minimal de questions par compétence (défaut : 50)"
+        )
+        parser.add_argument('--days', type=int, default=365, help="Étalement des sessions dans le passé, en jours (défaut : 365)")
+        parser.add_argument('--random-seed', type=int, default=42, help="Graine du générateur aléatoire (défaut : 42)")
+        parser.add_argument('--batch-size', type=int, default=20000, help="Nombre de lignes par lot d'insertion (défaut : 20000)")
+
+    def handle(self, *args, **options):
         self.stdout.write("🌱 Démarrage du seed...")
         self.apply_migrations()
         self.create_superuser()
         self.create_certifications_and_competencies()
+        if options['synthetic']:
+            self.generate_synthetic_dataset(options)
         self.stdout.write("🌱 Seed terminé avec succès !")
 
     def apply_migrations(self):
@@ -360,3 +399,186 @@ class Command(BaseCommand):
                     self.stdout.write(f"✅ Association entre '{cert.name}' et '{comp.name}' créée !")
                 else:
                     self.stdout.write(f"⚠️ Association entre '{cert.name}' et '{comp.name}' existe déjà.")
+
+
+    # ==========================
+    # 🧪 Jeu de données synthétique
+    # ==========================
+    def generate_synthetic_dataset(self, options):
+        """
+        Génère utilisateurs, questions, sessions et réponses par lots d'INSERT à clés explicites.
+        Le tirage est piloté par un RNG seedé : à état initial identique, le jeu produit est identique.
+        """
+        for name in ('users', 'sessions', 'responses_per_session', 'questions_per_competency', 'days'):
+            if options[name] < 0:
+                raise CommandError(f"--{name.replace('_', '-')} doit être positif ou nul.")
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size doit être supérieur à 0.")
+
+        self.random_seed = options['random_seed']
+        self.batch_size = options['batch_size']
+        start = time.perf_counter()
+
+        self.generate_synthetic_users(options['users'])
+        self.generate_synthetic_questions(options['questions_per_competency'])
+        self.generate_synthetic_sessions(options['sessions'], options['responses_per_session'], options['days'])
+
+        from django.core.management import call_command
+        call_command('rebuild_question_stats', stdout=self.stdout)
+        call_command('rebuild_competency_mastery', stdout=self.stdout)
+        call_command('rebuild_dashboard_progress', stdout=self.stdout)
+        call_command('refresh_analytics', full=True, stdout=self.stdout)
+
+        self.stdout.write(f"✅ Jeu de données synthétique généré en {time.perf_counter() - start:.1f} s")
+
+    def phase_rng(self, phase):
+        """Flux aléatoire propre à chaque phase : sauter une phase ne décale pas les suivantes"""
+        return random.Random(f"{self.random_seed}:{phase}")
+
+    def write_batches(self, model, field_names, rows):
+        """Insère les lignes produites par un générateur, par lots, une transaction par lot"""
+        batch = []
+        total = 0
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                with transaction.atomic():
+                    insert_rows(model, field_names, batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            with transaction.atomic():
+                insert_rows(model, field_names, batch)
+            total += len(batch)
+        return total
+
+    def generate_synthetic_users(self, count):
+        User = get_user_model()
+        existing = set(User.objects.filter(username__startswith="synthetic_").values_list('username', flat=True))
+        # Un seul hachage (coûteux) partagé par tous les comptes synthétiques
+        password = make_password("Synthetic123!")
+        joined = connection.ops.adapt_datetimefield_value(timezone.now())
+        first_id = next_id(User)
+        missing = [f"synthetic_{i:07d}" for i in range(count) if f"synthetic_{i:07d}" not in existing]
+        created = self.write_batches(
+            User,
+            ['id', 'password', 'is_superuser', 'username', 'first_name', 'last_name',
+             'email', 'is_staff', 'is_active', 'date_joined'],
+            (
+                (first_id + offset, password, False, username, '', '', f"{username}@example.com", False, True, joined)
+                for offset, username in enumerate(missing)
+            ),
+        )
+        reset_sequences(User)
+        self.stdout.write(f"✅ {created} utilisateurs synthétiques créés ({len(existing)} existants)")
+        self.synthetic_user_ids = list(
+            User.objects.filter(username__startswith="synthetic_").order_by('username').values_list('id', flat=True)
+        )
+
+    def generate_synthetic_questions(self, per_competency):
+        counts = dict(
+            Competency.objects.annotate(total=Count('questions')).values_list('id', 'total')
+        )
+        rng = self.phase_rng('questions')
+        question_id = next_id(Question)
+        answer_id = next_id(Answer)
+        questions, answers, links = [], [], []
+        for competency_id, total in sorted(counts.items()):
+            for i in range(total, per_competency):
+                questions.append((question_id, f"Question synthétique {competency_id}-{i}", None, 0, 0))
+                links.append((question_id, competency_id))
+                correct_position = rng.randrange(4)
+                for position in range(4):
+                    answers.append((answer_id, question_id, f"Réponse {position + 1}", position == correct_position))
+                    answer_id += 1
+                question_id += 1
+
+        self.write_batches(Question, ['id', 'text', 'explanation', 'total_attempts', 'correct_attempts'], questions)
+        self.write_batches(Answer, ['id', 'question', 'text', 'is_correct'], answers)
+        self.write_batches(Question.competencies.through, ['question', 'competency'], links)
+        reset_sequences(Question, Answer)
+        refresh_question_pools(sender=Question)  # Insertion directe : pas de m2m_changed
+        self.stdout.write(f"✅ {len(questions)} questions synthétiques créées")
+
+    def load_question_pool(self):
+        """Pour chaque certification : liste de (question_id, bonne réponse, mauvaises réponses)"""
+        correct = {}
+        wrong = {}
+        for answer_id, question_id, is_correct in Answer.objects.order_by('id').values_list('id', 'question_id', 'is_correct'):
+            if is_correct:
+                correct.setdefault(question_id, answer_id)
+            else:
+                wrong.setdefault(question_id, []).append(answer_id)
+
+        questions_by_competency = {}
+        for question_id, competency_id in Question.competencies.through.objects.order_by('id').values_list('question_id', 'competency_id'):
+            if question_id in correct:
+                questions_by_competency.setdefault(competency_id, []).append(question_id)
+
+        pool = {}
+        for certification_id, competency_id in CertificationCompetency.objects.order_by('id').values_list('certification_id', 'competency_id'):
+            question_ids = pool.setdefault(certification_id, {})
+            for question_id in questions_by_competency.get(competency_id, []):
+                question_ids[question_id] = (question_id, correct[question_id], wrong.get(question_id, []))
+        return {certification_id: list(questions.values()) for certification_id, questions in pool.items() if questions}
+
+    def generate_synthetic_sessions(self, count, responses_per_session, days):
+        rng = self.phase_rng('sessions')
+        pool = self.load_question_pool()
+        if count and (not pool or not self.synthetic_user_ids):
+            raise CommandError("Aucune certification avec questions ou aucun utilisateur synthétique disponible.")
+        certification_ids = sorted(pool)
+        # Niveau propre à chaque utilisateur : probabilité de répondre juste
+        skills = {user_id: rng.uniform(0.3, 0.95) for user_id in self.synthetic_user_ids}
+        now = timezone.now().replace(minute=0, second=0, microsecond=0)
+        adapt = connection.ops.adapt_datetimefield_value
+        # Crédit des maîtrises fixé par rebuild_competency_mastery, lancée après la génération
+        no_credit = connection.ops.adapt_json_value([], None)
+
+        session_id = next_id(ExamSession)
+        response_id = next_id(UserQuestionResponse)
+        session_fields = ['id', 'user', 'certification', 'started_at', 'completed_at', 'score']
+        response_fields = ['id', 'exam_session', 'question', 'selected_answer', 'correct_answer',
+                           'is_correct', 'times_asked', 'correct_attempts', 'credited_competency_ids']
+        sessions, responses = [], []
+        total_responses = 0
+        start = time.perf_counter()
+
+        for _ in range(count):
+            user_id = rng.choice(self.synthetic_user_ids)
+            certification_id = rng.choice(certification_ids)
+            questions = pool[certification_id]
+            picked = rng.sample(questions, min(responses_per_session, len(questions)))
+            started_at = now - timedelta(minutes=rng.randrange(days * 24 * 60 or 1))
+            correct_count = 0
+            for question_id, correct_answer_id, wrong_answer_ids in picked:
+                is_correct = not wrong_answer_ids or rng.random() < skills[user_id]
+                selected = correct_answer_id if is_correct else rng.choice(wrong_answer_ids)
+                correct_count += is_correct
+                responses.append((response_id, session_id, question_id, selected, correct_answer_id,
+                                  is_correct, 1, int(is_correct), no_credit))
+                response_id += 1
+            score = round(correct_count / len(picked) * 100, 2) if picked else None
+            completed_at = started_at + timedelta(minutes=rng.randint(10, 90))
+            sessions.append((session_id, user_id, certification_id, adapt(started_at), adapt(completed_at), score))
+            session_id += 1
+
+            if len(responses) >= self.batch_size or len(sessions) >= self.batch_size:
+                with transaction.atomic():
+                    insert_rows(ExamSession, session_fields, sessions)
+                    insert_rows(UserQuestionResponse, response_fields, responses)
+                total_responses += len(responses)
+                sessions, responses = [], []
+
+        if sessions:
+            with transaction.atomic():
+                insert_rows(ExamSession, session_fields, sessions)
+                insert_rows(UserQuestionResponse, response_fields, responses)
+            total_responses += len(responses)
+        reset_sequences(ExamSession, UserQuestionResponse)
+
+        elapsed = time.perf_counter() - start
+        rate = total_responses / elapsed if elapsed > 0 else 0
+        self.stdout.write(
+            f"✅ {count} sessions et {total_responses} réponses générées en {elapsed:.1f} s ({rate:.0f} réponses/s)"
+        )
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-18 15:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("certifications", "0002_certification_logo"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="question",
+            name="correct_attempts",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="question",
+            name="total_attempts",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.6 on 2026-10-18 15:36
+
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def remove_duplicate_associations(apps, schema_editor):
+    CertificationCompetency = apps.get_model("certifications", "CertificationCompetency")
+    keep_ids = (
+        CertificationCompetency.objects.values("certification", "competency")
+        .annotate(keep_id=Min("id"))
+        .values("keep_id")
+    )
+    CertificationCompetency.objects.exclude(id__in=keep_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("certifications", "0003_question_attempt_counters"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_associations, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="certificationcompetency",
+            constraint=models.UniqueConstraint(
+                fields=("certification", "competency"),
+                name="unique_certification_competency",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-18 16:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("certifications", "0005_competency_mastery"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="examsession",
+            name="completed_at",
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="examsession",
+            name="started_at",
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:05
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def create_catalog_version(apps, schema_editor):
+    # Catalogue existant : validateurs disponibles dès la mise en production
+    apps.get_model("certifications", "CatalogVersion").objects.get_or_create(pk=1, defaults={"version": 1})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("certifications", "0006_examsession_date_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CatalogVersion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("version", models.PositiveBigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.RunPython(create_catalog_version, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:20
+
+import certifications.logos
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("certifications", "0007_catalog_version"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="certification",
+            name="logo",
+            field=models.ImageField(
+                blank=True,
+                null=True,
+                storage=certifications.logos.logo_storage,
+                upload_to="certification_logos/",
+            ),
+        ),
+    ]
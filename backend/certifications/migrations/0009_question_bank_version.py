@@ -0,0 +1,38 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:25
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("certifications", "0008_certification_logo_storage"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QuestionBankVersion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("version", models.PositiveBigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.AddField(
+            model_name="examsession",
+            name="question_ids",
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+    ]
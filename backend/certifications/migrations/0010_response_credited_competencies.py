@@ -0,0 +1,30 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:55
+
+from django.db import migrations, models
+
+
+def credit_current_competencies(apps, schema_editor):
+    # Réponses existantes : créditées (CompetencyMastery) selon les liens actuels de leur question
+    Question = apps.get_model("certifications", "Question")
+    UserQuestionResponse = apps.get_model("certifications", "UserQuestionResponse")
+    competencies_by_question = {}
+    for question_id, competency_id in Question.competencies.through.objects.values_list("question_id", "competency_id"):
+        competencies_by_question.setdefault(question_id, []).append(competency_id)
+    for question_id, competency_ids in competencies_by_question.items():
+        UserQuestionResponse.objects.filter(question_id=question_id).update(credited_competency_ids=sorted(competency_ids))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("certifications", "0009_question_bank_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="userquestionresponse",
+            name="credited_competency_ids",
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.RunPython(credit_current_competencies, migrations.RunPython.noop),
+    ]
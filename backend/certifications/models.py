@@ -1,19 +1,77 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Prefetch
 from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from .logos import logo_storage
 
 User = get_user_model()
 
 from django.db import models
 
+class CertificationQuerySet(models.QuerySet):
+    def with_competencies(self):
+        """Précharge les associations et leurs compétences en une seule requête supplémentaire"""
+        return self.prefetch_related(
+            Prefetch(
+                'certificationcompetency_set',
+                queryset=CertificationCompetency.objects.select_related('competency'),
+            )
+        )
+
 class Certification(models.Model):
     name = models.CharField(max_length=255, unique=True)
     description = models.TextField(blank=True, null=True)
-    logo = models.ImageField(upload_to='certification_logos/', null=True, blank=True)  # Nouveau champ logo
+    # Nommé par l'empreinte du contenu, variantes dans certification_logos/variants/ (voir logos.py)
+    logo = models.ImageField(upload_to='certification_logos/', storage=logo_storage, null=True, blank=True)
+
+    objects = CertificationQuerySet.as_manager()
     
     def __str__(self):
         return self.name
 
 
+class VersionCounter(models.Model):
+    """Compteur de version à une seule ligne (pk = 1), incrémenté dans la transaction de chaque modification"""
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def bump(cls):
+        now = timezone.now()
+        if not cls.objects.filter(pk=1).update(version=F('version') + 1, updated_at=now):
+            cls.objects.get_or_create(pk=1, defaults={'version': 1, 'updated_at': now})
+
+    @classmethod
+    def current(cls):
+        """(version, updated_at) ; l'horodatage distingue deux incréments dont l'un a été annulé"""
+        return cls.objects.filter(pk=1).values_list('version', 'updated_at').first() or (0, None)
+
+
+class CatalogVersion(VersionCounter):
+    """
+    Version du catalogue (certifications, compétences et leurs associations), incrémentée
+    dans la transaction de chaque modification, suppressions comprises : source des validateurs
+    HTTP (ETag / Last-Modified) des vues du catalogue.
+    """
+
+    def __str__(self):
+        return f"Catalogue v{self.version} ({self.updated_at})"
+
+
+class QuestionBankVersion(VersionCounter):
+    """
+    Version de la banque de questions (questions et leurs liens aux compétences) : source de la
+    version des tableaux de tirage gardés en mémoire par chaque worker (certifications/sampling.py).
+    """
+
+    def __str__(self):
+        return f"Banque de questions v{self.version} ({self.updated_at})"
+
+
 class Competency(models.Model):
     name = models.CharField(max_length=255, unique=True)
     description = models.TextField(blank=True, null=True)
@@ -26,17 +84,58 @@ class CertificationCompetency(models.Model):
     competency = models.ForeignKey(Competency, on_delete=models.CASCADE)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['certification', 'competency'],
+                name='unique_certification_competency',
+            ),
+        ]
+
 class Question(models.Model):
     text = models.TextField()
     competencies = models.ManyToManyField(Competency, related_name='questions')
     explanation = models.TextField(blank=True, null=True)
-    
+    # Compteurs dénormalisés, maintenus à chaque réponse enregistrée
+    # (reconstruits par la commande `rebuild_question_stats`)
+    total_attempts = models.PositiveIntegerField(default=0)
+    correct_attempts = models.PositiveIntegerField(default=0)
+
+    @staticmethod
+    def attempt_increments(responses, sign=1, increments=None):
+        """{question_id: (tentatives, bonnes réponses)} apportés par `responses` (sign=-1 : retirés)"""
+        increments = {} if increments is None else increments
+        for response in responses:
+            total, correct = increments.get(response.question_id, (0, 0))
+            increments[response.question_id] = (total + sign, correct + sign * int(response.is_correct))
+        return increments
+
+    @classmethod
+    def record_attempts(cls, responses, sign=1):
+        """
+        Incrémente atomiquement les compteurs des questions concernées par `responses`
+        (sign=-1 : les décrémente, pour des réponses supprimées).
+        """
+        cls.apply_attempt_increments(cls.attempt_increments(responses, sign))
+
+    @classmethod
+    def apply_attempt_increments(cls, increments):
+        """Les questions partageant le même incrément sont mises à jour en un seul UPDATE"""
+        question_ids_by_increment = {}
+        for question_id, increment in increments.items():
+            if increment != (0, 0):
+                question_ids_by_increment.setdefault(increment, []).append(question_id)
+
+        for (total, correct), question_ids in question_ids_by_increment.items():
+            cls.objects.filter(pk__in=question_ids).update(
+                total_attempts=F('total_attempts') + total,
+                correct_attempts=F('correct_attempts') + correct,
+            )
+
     def difficulty(self):
-        total_attempts = self.userquestionresponse_set.count()
-        correct_attempts = self.userquestionresponse_set.filter(is_correct=True).count()
-        if total_attempts == 0:
+        if self.total_attempts == 0:
             return "Unknown"
-        success_rate = correct_attempts / total_attempts
+        success_rate = self.correct_attempts / self.total_attempts
         if success_rate > 0.7:
             return "Easy"
         elif success_rate > 0.4:
@@ -57,9 +156,12 @@ class Answer(models.Model):
 class ExamSession(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     certification = models.ForeignKey(Certification, on_delete=models.CASCADE)
-    started_at = models.DateTimeField(auto_now_add=True)
-    completed_at = models.DateTimeField(null=True, blank=True)
+    started_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    completed_at = models.DateTimeField(null=True, blank=True, db_index=True)
     score = models.FloatField(null=True, blank=True)
+    # Ids des questions tirées au démarrage (ExamSessionStartView) : la soumission doit y répondre exactement.
+    # None pour une session créée autrement (la soumission est alors limitée aux questions de la certification)
+    question_ids = models.JSONField(null=True, blank=True, editable=False)
     
     def __str__(self):
         return f"{self.user.username} - {self.certification.name} ({self.score if self.score is not None else 'In progress'})"
@@ -72,16 +174,115 @@ class UserQuestionResponse(models.Model):
     is_correct = models.BooleanField()
     times_asked = models.IntegerField(default=0)
     correct_attempts = models.IntegerField(default=0)
-    
+    # Compétences créditées dans CompetencyMastery à l'enregistrement : une suppression ou une
+    # correction retire exactement ce crédit, même si la question a été réétiquetée depuis
+    credited_competency_ids = models.JSONField(default=list, blank=True, editable=False)
+
+    @staticmethod
+    def credit_competencies(responses):
+        """Fixe les compétences créditées (liens actuels des questions), en une requête, avant l'écriture"""
+        competencies_by_question = {}
+        for question_id, competency_id in Question.competencies.through.objects.filter(
+            question_id__in={response.question_id for response in responses}
+        ).values_list('question_id', 'competency_id'):
+            competencies_by_question.setdefault(question_id, []).append(competency_id)
+        for response in responses:
+            response.credited_competency_ids = sorted(competencies_by_question.get(response.question_id, []))
+
     def save(self, *args, **kwargs):
-        if not self.pk:  # Seulement lors de la première sauvegarde
-            self.times_asked += 1
-            if self.is_correct:
-                self.correct_attempts += 1
-        super().save(*args, **kwargs)
+        previous = None
+        if self.pk:
+            previous = (
+                UserQuestionResponse.objects.filter(pk=self.pk)
+                .select_related('exam_session')
+                .only('question_id', 'is_correct', 'credited_competency_ids', 'exam_session__user_id')
+                .first()
+            )
+        if previous is not None:
+            if (previous.question_id, previous.is_correct, previous.exam_session_id) == (
+                self.question_id, self.is_correct, self.exam_session_id
+            ):
+                super().save(*args, **kwargs)
+                return
+            # Réponse corrigée : l'ancienne version est retirée des compteurs, la nouvelle ajoutée
+            self.correct_attempts += int(self.is_correct) - int(previous.is_correct)
+            UserQuestionResponse.credit_competencies([self])
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+                Question.apply_attempt_increments(
+                    Question.attempt_increments([self], increments=Question.attempt_increments([previous], sign=-1))
+                )
+                CompetencyMastery.record_responses(previous.exam_session.user_id, [previous], sign=-1)
+                CompetencyMastery.record_responses(self.exam_session.user_id, [self])
+            return
+        # Seulement lors de la première sauvegarde
+        self.times_asked += 1
+        if self.is_correct:
+            self.correct_attempts += 1
+        UserQuestionResponse.credit_competencies([self])
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            Question.record_attempts([self])
+            CompetencyMastery.record_responses(self.exam_session.user_id, [self], timezone.now())
     
     def success_rate(self):
         return (self.correct_attempts / self.times_asked * 100) if self.times_asked > 0 else 0
     
     def __str__(self):
         return f"{self.exam_session.user.username} - Q: {self.question.text[:30]} ({'Correct' if self.is_correct else 'Incorrect'})"
+
+
+class CompetencyMastery(models.Model):
+    """
+    Agrégat par (utilisateur, compétence) maintenu à chaque réponse enregistrée
+    (reconstruit par la commande `rebuild_competency_mastery`).
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='competency_masteries')
+    competency = models.ForeignKey(Competency, on_delete=models.CASCADE, related_name='masteries')
+    attempts = models.PositiveIntegerField(default=0)
+    correct_answers = models.PositiveIntegerField(default=0)
+    last_seen_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'competency'], name='unique_user_competency_mastery'),
+        ]
+
+    @classmethod
+    def record_responses(cls, user_id, responses, seen_at=None, sign=1):
+        """
+        Incrémente les agrégats de l'utilisateur pour chaque compétence créditée par les réponses
+        (credited_competency_ids ; sign=-1 : les décrémente, pour des réponses supprimées ou
+        corrigées) : un INSERT pour les lignes manquantes, puis un UPDATE par incrément distinct.
+        `seen_at` à None : last_seen_at inchangé.
+        """
+        increments = {}
+        for response in responses:
+            for competency_id in response.credited_competency_ids:
+                attempts, correct = increments.get(competency_id, (0, 0))
+                increments[competency_id] = (attempts + sign, correct + sign * int(response.is_correct))
+        if not increments:
+            return
+
+        if sign > 0:
+            cls.objects.bulk_create(
+                [cls(user_id=user_id, competency_id=competency_id) for competency_id in increments],
+                ignore_conflicts=True,
+            )
+        # Décrément : pas de ligne créée (celles d'un utilisateur supprimé disparaissent en cascade)
+        changes = {'last_seen_at': seen_at} if seen_at is not None else {}
+        competency_ids_by_increment = {}
+        for competency_id, increment in increments.items():
+            competency_ids_by_increment.setdefault(increment, []).append(competency_id)
+        for (attempts, correct), competency_ids in competency_ids_by_increment.items():
+            cls.objects.filter(user_id=user_id, competency_id__in=competency_ids).update(
+                attempts=F('attempts') + attempts,
+                correct_answers=F('correct_answers') + correct,
+                **changes,
+            )
+
+    def success_rate(self):
+        return (self.correct_answers / self.attempts * 100) if self.attempts > 0 else 0
+
+    def __str__(self):
+        return f"{self.user_id} - {self.competency_id} ({self.correct_answers}/{self.attempts})"
@@ -0,0 +1,123 @@
+# backend/certifications/sampling.py
+"""
+Tirage aléatoire des questions d'un examen, sans ORDER BY RANDOM() (qui trie toute la banque).
+
+Chaque worker garde en mémoire, par compétence, le tableau des ids de ses questions
+(array compact, chargé en une requête). Le tirage se fait sur ces tableaux avec un générateur
+initialisé par une graine, puis seules les questions tirées sont lues (un in_bulk) :
+démarrer un examen coûte O(N) pour N questions, quelle que soit la taille de la banque.
+
+Les tableaux sont versionnés par QuestionBankVersion, incrémentée en base par les receivers
+de certifications.signals (dans la transaction du changement) quand une question, une
+compétence ou leurs liens changent. La version lue est gardée en cache au plus
+QUESTION_POOLS_VERSION_TIMEOUT secondes : délai maximal avant qu'un worker voie un changement
+fait par un autre. Une éviction du cache coûte une relecture de la version, pas des tableaux.
+"""
+
+import random
+import threading
+from array import array
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
+
+from .models import Answer, CertificationCompetency, Question, QuestionBankVersion
+
+QUESTION_POOLS_VERSION_KEY = 'questions:pools-version'
+
+_lock = threading.Lock()
+_pools = (None, {})  # (version, {competency_id: array des ids de questions})
+
+
+def pools_version():
+    version = cache.get(QUESTION_POOLS_VERSION_KEY)
+    if version is None:
+        version = QuestionBankVersion.current()
+        # add : n'écrase pas une version plus récente posée entre-temps
+        cache.add(QUESTION_POOLS_VERSION_KEY, version, getattr(settings, 'QUESTION_POOLS_VERSION_TIMEOUT', 60))
+    return version
+
+
+def load_pools():
+    """{competency_id: array('q')} des questions de chaque compétence, triées par id"""
+    pools = {}
+    links = (
+        Question.competencies.through.objects
+        .order_by('competency_id', 'question_id')
+        .values_list('competency_id', 'question_id')
+    )
+    for competency_id, question_id in links.iterator(chunk_size=10000):
+        pool = pools.get(competency_id)
+        if pool is None:
+            pool = pools[competency_id] = array('q')
+        pool.append(question_id)
+    return pools
+
+
+def question_pools():
+    global _pools
+    version = pools_version()
+    if _pools[0] != version:
+        with _lock:  # Un seul chargement par worker
+            if _pools[0] != version:
+                _pools = (version, load_pools())
+    return _pools[1]
+
+
+def invalidate_question_pools():
+    cache.delete(QUESTION_POOLS_VERSION_KEY)
+
+
+def random_order(pool, rng):
+    """
+    Ids de `pool` dans un ordre aléatoire, produits à la demande : tirages avec rejet tant que
+    moins de la moitié du tableau est prise, puis mélange du reste (au plus deux fois ce qui a été tiré).
+    """
+    drawn = set()
+    while len(drawn) < len(pool) // 2:
+        index = rng.randrange(len(pool))
+        if index not in drawn:
+            drawn.add(index)
+            yield pool[index]
+    rest = [question_id for index, question_id in enumerate(pool) if index not in drawn]
+    rng.shuffle(rest)
+    yield from rest
+
+
+def sample_question_ids(competency_ids, count, seed=None):
+    """
+    `count` ids de questions distinctes au plus, répartis à tour de rôle entre les compétences
+    (une compétence épuisée laisse sa part aux autres). Même graine et même banque : même tirage.
+    """
+    rng = random.Random(seed)
+    pools = question_pools()
+    orders = [random_order(pools[competency_id], rng) for competency_id in sorted(set(competency_ids)) if competency_id in pools]
+    rng.shuffle(orders)  # Les parts en plus vont à des compétences au hasard
+    chosen, seen = [], set()
+    while orders and len(chosen) < count:
+        for order in list(orders):
+            # Une question liée à plusieurs compétences n'est posée qu'une fois
+            question_id = next((question_id for question_id in order if question_id not in seen), None)
+            if question_id is None:
+                orders.remove(order)
+                continue
+            seen.add(question_id)
+            chosen.append(question_id)
+            if len(chosen) == count:
+                break
+    rng.shuffle(chosen)
+    return chosen
+
+
+def sample_questions(certification_id, count, seed=None):
+    """Questions (réponses préchargées) tirées parmi les compétences de la certification, dans l'ordre du tirage"""
+    competency_ids = CertificationCompetency.objects.filter(
+        certification_id=certification_id
+    ).values_list('competency_id', flat=True)
+    question_ids = sample_question_ids(list(competency_ids), count, seed)
+    questions = Question.objects.prefetch_related(
+        Prefetch('answers', queryset=Answer.objects.order_by('id'))
+    ).in_bulk(question_ids)
+    # Une question supprimée depuis le chargement des tableaux est simplement omise
+    return [questions[question_id] for question_id in question_ids if question_id in questions]
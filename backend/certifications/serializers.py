@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from .logos import variant_urls
 from .models import Certification, Competency
 
 class CompetencySerializer(serializers.ModelSerializer):
@@ -10,15 +11,25 @@ class CompetencySerializer(serializers.ModelSerializer):
 
 class CertificationSerializer(serializers.ModelSerializer):
     competencies = serializers.SerializerMethodField()
+    logo_variants = serializers.SerializerMethodField()
 
     class Meta:
         model = Certification
-        fields = ['id', 'name', 'description', 'logo', 'competencies']
+        fields = ['id', 'name', 'description', 'logo', 'logo_variants', 'competencies']
+
+    def get_logo_variants(self, obj) -> dict | None:
+        # {côté: {"webp": URL, "png": URL}} ; URL immuables, voir certifications/logos.py
+        if not obj.logo:
+            return None
+        return variant_urls(obj.logo.name, self.context.get('request'))
 
     def get_competencies(self, obj) -> list:
-        # Récupère les compétences via la relation CertificationCompetency
-        competency_list = [cc.competency for cc in obj.certificationcompetency_set.all()]
-        return CompetencySerializer(competency_list, many=True).data
+        # Lecture à plat depuis le cache de prefetch (cf. Certification.objects.with_competencies()),
+        # sans instancier un CompetencySerializer par certification
+        return [
+            {"id": cc.competency.id, "name": cc.competency.name, "description": cc.competency.description}
+            for cc in obj.certificationcompetency_set.all()
+        ]
 
 # backend/certifications/serializers.py (ou dans un module dédié)
 from rest_framework import serializers
@@ -30,3 +41,51 @@ class CertificationCompetencyUpdateSerializer(serializers.Serializer):
         help_text="Liste des IDs des compétences à associer"
     )
 
+
+
+class ExamStartSerializer(serializers.Serializer):
+    question_count = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=200,
+        help_text="Nombre de questions tirées (défaut : EXAM_QUESTION_COUNT)"
+    )
+
+class ExamAnswerChoiceSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    text = serializers.CharField()
+
+class ExamQuestionSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    text = serializers.CharField()
+    # Sans is_correct : la correction est faite à la soumission
+    answers = ExamAnswerChoiceSerializer(many=True)
+
+class ExamStartResponseSerializer(serializers.Serializer):
+    session_id = serializers.IntegerField()
+    started_at = serializers.DateTimeField()
+    questions = ExamQuestionSerializer(many=True)
+
+class ExamAnswerSerializer(serializers.Serializer):
+    question_id = serializers.IntegerField()
+    answer_id = serializers.IntegerField()
+
+class ExamSubmissionSerializer(serializers.Serializer):
+    answers = ExamAnswerSerializer(
+        many=True,
+        allow_empty=False,
+        help_text="Feuille de réponses complète : une réponse choisie par question"
+    )
+
+    def validate_answers(self, value):
+        question_ids = [item["question_id"] for item in value]
+        if len(question_ids) != len(set(question_ids)):
+            raise serializers.ValidationError("Chaque question ne peut recevoir qu'une seule réponse.")
+        return value
+
+class ExamSubmissionResponseSerializer(serializers.Serializer):
+    session_id = serializers.IntegerField()
+    score = serializers.FloatField()
+    correct_answers = serializers.IntegerField()
+    total_questions = serializers.IntegerField()
+    completed_at = serializers.DateTimeField()
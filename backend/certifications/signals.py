@@ -0,0 +1,120 @@
+# backend/certifications/signals.py
+
+import threading
+import weakref
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import Signal
+
+from .catalog import invalidate_catalog_validators
+from .logos import generate_variants
+from .models import (
+    CatalogVersion, Certification, CertificationCompetency, Competency, CompetencyMastery, ExamSession, Question,
+    QuestionBankVersion, UserQuestionResponse,
+)
+from .sampling import invalidate_question_pools
+from .snapshot import invalidate_catalog_snapshot
+
+# Envoyé dans la transaction de soumission, une fois la session notée.
+# Arguments : session (ExamSession complétée), responses (liste de UserQuestionResponse)
+exam_session_completed = Signal()
+
+# Envoyé quand des réponses enregistrées hors soumission sont ajoutées, corrigées ou supprimées.
+# Arguments : user_id (auteur des réponses, dont les agrégats de maîtrise ont changé)
+responses_changed = Signal()
+
+_deletion = threading.local()  # Origine de la dernière suppression du catalogue (référence faible)
+
+
+def bump_catalog_version(sender, **kwargs):
+    """
+    Toute écriture du catalogue change ses validateurs HTTP et vide l'instantané du worker
+    (les bulk_create appellent ce receiver eux-mêmes)
+    """
+    CatalogVersion.bump()
+    # Vidé tout de suite (y compris si la transaction est annulée) puis après commit, contre
+    # une recompilation concurrente qui aurait lu les données d'avant
+    invalidate_catalog_snapshot()
+    transaction.on_commit(invalidate_catalog_validators)
+    transaction.on_commit(invalidate_catalog_snapshot)
+
+
+def bump_catalog_version_on_delete(sender, origin=None, **kwargs):
+    """
+    Une seule incrémentation par suppression : post_delete est émis pour chaque ligne supprimée
+    (QuerySet.delete(), cascades), toutes avec la même origine
+    """
+    previous = getattr(_deletion, 'origin', None)
+    if origin is not None and previous is not None and previous() is origin and catalog_version_bumped_in_block():
+        return
+    _deletion.origin = weakref.ref(origin) if origin is not None else None
+    bump_catalog_version(sender, **kwargs)
+
+
+def catalog_version_bumped_in_block():
+    """
+    Vrai si la version a déjà été incrémentée dans le bloc atomique courant : son invalidation
+    après commit y est en attente (Django retire ces callbacks avec un savepoint annulé)
+    """
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        return False
+    savepoint_ids = set(connection.savepoint_ids)
+    return any(
+        callback is invalidate_catalog_validators and callback_savepoint_ids == savepoint_ids
+        for callback_savepoint_ids, callback, *_ in connection.run_on_commit
+    )
+
+
+for model in (Certification, Competency, CertificationCompetency):
+    post_save.connect(bump_catalog_version, sender=model, dispatch_uid=f'catalog_version_save_{model.__name__}')
+    post_delete.connect(bump_catalog_version_on_delete, sender=model, dispatch_uid=f'catalog_version_delete_{model.__name__}')
+
+
+def refresh_question_pools(sender, action=None, **kwargs):
+    """
+    Questions ou liens question / compétence modifiés : nouvelle version de la banque, tableaux
+    de tirage rechargés par chaque worker (les insertions directes appellent ce receiver elles-mêmes)
+    """
+    if action is not None and not action.startswith('post_'):
+        return
+    QuestionBankVersion.bump()
+    # Version en cache : retirée tout de suite, puis après commit
+    invalidate_question_pools()
+    transaction.on_commit(invalidate_question_pools)
+
+
+m2m_changed.connect(refresh_question_pools, sender=Question.competencies.through, dispatch_uid='question_pools_links')
+for model in (Question, Competency):
+    post_delete.connect(refresh_question_pools, sender=model, dispatch_uid=f'question_pools_delete_{model.__name__}')
+
+
+def generate_logo_variants(sender, instance, **kwargs):
+    """Variantes du logo générées dès son enregistrement (déjà sur disque : rien n'est refait)"""
+    if instance.logo:
+        generate_variants(instance.logo.name)
+
+
+post_save.connect(generate_logo_variants, sender=Certification, dispatch_uid='certification_logo_variants')
+
+
+def forget_deleted_response(sender, instance, **kwargs):
+    """
+    Réponse supprimée, directement ou en cascade (session, utilisateur, certification) : retirée
+    des compteurs de sa question et des agrégats de maîtrise de son auteur.
+    pre_delete : session et liens question / compétence sont encore en base, dans la transaction de la suppression.
+    """
+    Question.record_attempts([instance], sign=-1)
+    user_id = ExamSession.objects.filter(pk=instance.exam_session_id).values_list('user_id', flat=True).first()
+    CompetencyMastery.record_responses(user_id, [instance], sign=-1)
+    responses_changed.send(sender=UserQuestionResponse, user_id=user_id)
+
+
+def announce_saved_response(sender, instance, **kwargs):
+    """Réponse enregistrée ou corrigée une à une (les compteurs sont mis à jour par save())"""
+    responses_changed.send(sender=UserQuestionResponse, user_id=instance.exam_session.user_id)
+
+
+pre_delete.connect(forget_deleted_response, sender=UserQuestionResponse, dispatch_uid='response_counters_delete')
+post_save.connect(announce_saved_response, sender=UserQuestionResponse, dispatch_uid='response_changes_save')
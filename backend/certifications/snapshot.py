@@ -0,0 +1,117 @@
+# backend/certifications/snapshot.py
+"""
+Instantané du catalogue gardé en mémoire par chaque worker (processus).
+
+Tout le graphe certifications / compétences est sérialisé une fois en JSON (un blob par
+élément, trié par nom) : les GET du catalogue renvoient ensuite ces octets directement,
+sans ORM ni sérialiseur. L'instantané est versionné par l'ETag du catalogue
+(certifications.catalog) : il est recompilé dès que les validateurs changent, et vidé par les
+receivers de certifications.signals à chaque écriture de Certification, Competency ou
+CertificationCompetency.
+
+Les URL des logos sont absolues : un instantané par URL de base (schéma + hôte).
+Désactivable avec CATALOG_SNAPSHOT = False.
+"""
+
+import threading
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from rest_framework.renderers import JSONRenderer
+
+from pagination import NameKeysetPagination
+from .models import Certification, Competency
+from .serializers import CertificationSerializer, CompetencySerializer
+
+# Au-delà, les instantanés sont tous recompilés (hôtes limités par ALLOWED_HOSTS)
+MAX_SNAPSHOTS = 8
+
+_renderer = JSONRenderer()
+_lock = threading.Lock()
+_snapshots = {}  # {URL de base: CatalogSnapshot}
+
+
+def render(data):
+    return b'null' if data is None else _renderer.render(data)  # JSONRenderer rend None en corps vide
+
+
+class SnapshotSection:
+    """Éléments d'une ressource du catalogue, triés par nom, chacun déjà rendu en JSON"""
+
+    def __init__(self, model, data):
+        self.model = model
+        self.items = [{'name': item['name'], 'json': render(item)} for item in data]
+        self.positions = {item['name']: index for index, item in enumerate(self.items)}
+        self.by_id = {item['id']: entry['json'] for item, entry in zip(data, self.items)}
+
+    def list_body(self, request):
+        """Page demandée, octet pour octet comme la vue DRF ; None si le curseur n'est pas dans l'instantané"""
+        paginator = NameKeysetPagination()
+        try:
+            page = paginator.paginate_sequence(self.items, self.positions, request)
+        except KeyError:
+            return None
+        return b''.join([
+            b'{"next":', render(paginator.get_next_link()),
+            b',"previous":', render(paginator.get_previous_link()),
+            b',"results":[', b','.join(item['json'] for item in page), b']}',
+        ])
+
+    def detail_body(self, pk):
+        body = self.by_id.get(pk)
+        if body is None:
+            # Même réponse que get_object_or_404
+            raise Http404(f"No {self.model._meta.object_name} matches the given query.")
+        return body
+
+    def response(self, request, pk=None):
+        body = self.list_body(request) if pk is None else self.detail_body(pk)
+        return None if body is None else HttpResponse(body, content_type='application/json')
+
+
+class CatalogSnapshot:
+    def __init__(self, etag, certifications, competencies):
+        self.etag = etag
+        self.certifications = SnapshotSection(Certification, certifications)
+        self.competencies = SnapshotSection(Competency, competencies)
+
+
+def compile_snapshot(request, etag):
+    """Sérialise tout le catalogue (3 requêtes) ; `etag` : validateurs lus avant les données"""
+    certifications = CertificationSerializer(
+        Certification.objects.with_competencies().order_by('name'), many=True, context={'request': request}
+    ).data
+    competencies = CompetencySerializer(Competency.objects.order_by('name'), many=True).data
+    return CatalogSnapshot(etag, certifications, competencies)
+
+
+def fresh_snapshot(request, etag):
+    snapshot = _snapshots.get(request.build_absolute_uri('/'))
+    return snapshot if snapshot is not None and snapshot.etag == etag else None
+
+
+def catalog_snapshot(request, etag):
+    """Instantané correspondant à `etag` (validateurs courants), compilé au besoin ; None si indisponible"""
+    if etag is None or not getattr(settings, 'CATALOG_SNAPSHOT', True):
+        return None
+    snapshot = fresh_snapshot(request, etag)
+    if snapshot is None:
+        with _lock:  # Une seule compilation par worker
+            snapshot = fresh_snapshot(request, etag)
+            if snapshot is None:
+                snapshot = compile_snapshot(request, etag)
+                if len(_snapshots) >= MAX_SNAPSHOTS:
+                    _snapshots.clear()
+                _snapshots[request.build_absolute_uri('/')] = snapshot
+    return snapshot
+
+
+async def acatalog_snapshot(request, etag):
+    if etag is None or not getattr(settings, 'CATALOG_SNAPSHOT', True):
+        return None
+    return fresh_snapshot(request, etag) or await sync_to_async(catalog_snapshot)(request, etag)
+
+
+def invalidate_catalog_snapshot():
+    _snapshots.clear()
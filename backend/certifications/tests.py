@@ -1,10 +1,26 @@
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
-from certifications.models import Certification, Competency, CertificationCompetency
+from certifications.sampling import QUESTION_POOLS_VERSION_KEY, sample_question_ids
+from certifications.snapshot import invalidate_catalog_snapshot
+from certifications.models import (
+    Certification, Competency, CertificationCompetency,
+    Question, Answer, ExamSession, UserQuestionResponse, CompetencyMastery, QuestionBankVersion, CatalogVersion,
+)
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.core.files.uploadedfile import SimpleUploadedFile
-from io import BytesIO
+from io import BytesIO, StringIO
+import json
+import os
+import shutil
+import tempfile
 from PIL import Image
 
 User = get_user_model()
@@ -57,14 +73,14 @@ class CertificationAPITests(APITestCase):
         self.client.force_authenticate(user=self.admin)
         response = self.client.get(self.cert_list_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertGreaterEqual(len(response.data), 1)
+        self.assertGreaterEqual(len(response.json()['results']), 1)
 
     def test_list_certifications_valid_with_existing(self):
         Certification.objects.create(name="Cert Existante", description="Déjà présente")
         self.client.force_authenticate(user=self.admin)
         response = self.client.get(self.cert_list_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn("Cert Existante", [cert['name'] for cert in response.data])
+        self.assertIn("Cert Existante", [cert['name'] for cert in response.json()['results']])
 
     def test_list_certifications_invalid_method_fail(self):
         self.client.force_authenticate(user=self.admin)
@@ -77,7 +93,7 @@ class CertificationAPITests(APITestCase):
         url = f"/certifications/{cert.id}/"
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['name'], "Cert Detail")
+        self.assertEqual(response.json()['name'], "Cert Detail")
 
     def test_certification_detail_valid_includes_competencies(self):
         cert = Certification.objects.create(name="Cert Avec Comp", description="Test comp")
@@ -88,7 +104,7 @@ class CertificationAPITests(APITestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Vérifier que la liste des compétences n'est pas vide
-        self.assertGreater(len(response.data.get('competencies', [])), 0)
+        self.assertGreater(len(response.json().get('competencies', [])), 0)
 
     def test_certification_detail_nonexistent_fail(self):
         self.client.force_authenticate(user=self.admin)
@@ -166,6 +182,47 @@ class CertificationAPITests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertFalse(cert.certificationcompetency_set.exists())
 
+    def test_update_certification_competencies_admin_valid_diff(self):
+        cert = Certification.objects.create(name="Cert Assoc Diff", description="Test différentiel")
+        kept = CertificationCompetency.objects.create(certification=cert, competency=self.competency)
+        removed_comp = Competency.objects.create(name="Comp Retirée")
+        CertificationCompetency.objects.create(certification=cert, competency=removed_comp)
+        added_comp = Competency.objects.create(name="Comp Ajoutée")
+        url = f"/certifications/{cert.id}/competencies/"
+        self.client.force_authenticate(user=self.admin)
+        data = {"competency_ids": [self.competency.id, added_comp.id, 9999]}
+        response = self.client.put(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(cert.certificationcompetency_set.values_list('competency_id', flat=True)),
+            {self.competency.id, added_comp.id}
+        )
+        # L'association conservée n'est pas réécrite
+        self.assertEqual(CertificationCompetency.objects.get(id=kept.id).updated_at, kept.updated_at)
+
+    def test_update_certification_competencies_admin_valid_unchanged_no_write(self):
+        cert = Certification.objects.create(name="Cert Assoc Inchangée", description="Aucun changement")
+        CertificationCompetency.objects.create(certification=cert, competency=self.competency)
+        url = f"/certifications/{cert.id}/competencies/"
+        self.client.force_authenticate(user=self.admin)
+        # certification, savepoint, compétences valides, associations existantes, release
+        with self.assertNumQueries(5):
+            response = self.client.put(url, {"competency_ids": [self.competency.id]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_update_certification_competencies_removal_query_count(self):
+        cert = Certification.objects.create(name="Cert Assoc Retraits", description="Retrait en masse")
+        competencies = [Competency.objects.create(name=f"Comp Retrait {i}") for i in range(50)]
+        url = f"/certifications/{cert.id}/competencies/"
+        self.client.force_authenticate(user=self.admin)
+        self.client.put(url, {"competency_ids": [competency.id for competency in competencies]}, format='json')
+        # certification, savepoint, associations existantes, associations retirées (receivers post_delete),
+        # un seul DELETE et une seule incrémentation de la version du catalogue, release
+        with self.assertNumQueries(7):
+            response = self.client.put(url, {"competency_ids": []}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(cert.certificationcompetency_set.exists())
+
     def test_update_certification_competencies_non_admin_fail(self):
         cert = Certification.objects.create(name="Cert Assoc NonAdmin", description="Test non admin")
         url = f"/certifications/{cert.id}/competencies/"
@@ -174,6 +231,49 @@ class CertificationAPITests(APITestCase):
         response = self.client.put(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
+    @override_settings(CATALOG_SNAPSHOT=False)  # Chemin ORM (API navigable, curseur hors instantané)
+    def test_list_certifications_query_count_is_constant(self):
+        for i in range(5):
+            cert = Certification.objects.create(name=f"Cert Catalogue {i}")
+            for j in range(3):
+                comp = Competency.objects.create(name=f"Comp Catalogue {i}-{j}")
+                CertificationCompetency.objects.create(certification=cert, competency=comp)
+        self.client.force_authenticate(user=self.admin)
+        # Version du catalogue (cache local : lue en base), certifications, associations + compétences
+        with self.assertNumQueries(3):
+            response = self.client.get(self.cert_list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results'][0]['competencies']), 3)
+        self.assertEqual(set(response.data['results'][0]['competencies'][0]), {'id', 'name', 'description'})
+
+    @override_settings(CATALOG_SNAPSHOT=False)  # Chemin ORM (API navigable, curseur hors instantané)
+    def test_list_certifications_paginated_by_cursor(self):
+        for i in range(5):
+            cert = Certification.objects.create(name=f"Cert Page {i}")
+            comp = Competency.objects.create(name=f"Comp Page {i}")
+            CertificationCompetency.objects.create(certification=cert, competency=comp)
+        self.client.force_authenticate(user=self.admin)
+        names = []
+        url = f"{self.cert_list_url}?page_size=2"
+        while url:
+            # Version du catalogue, page filtrée sur le curseur + compétences de la page uniquement
+            with self.assertNumQueries(3):
+                response = self.client.get(url)
+            names += [cert['name'] for cert in response.data['results']]
+            url = response.data['next']
+        self.assertEqual(names, list(Certification.objects.order_by('name').values_list('name', flat=True)))
+
+    @override_settings(CATALOG_SNAPSHOT=False)  # Chemin ORM (API navigable, curseur hors instantané)
+    def test_certification_detail_query_count_is_constant(self):
+        cert = Certification.objects.create(name="Cert Détail Requêtes")
+        for j in range(4):
+            comp = Competency.objects.create(name=f"Comp Détail {j}")
+            CertificationCompetency.objects.create(certification=cert, competency=comp)
+        self.client.force_authenticate(user=self.admin)
+        with self.assertNumQueries(3):
+            response = self.client.get(f"/certifications/{cert.id}/")
+        self.assertEqual(len(response.data['competencies']), 4)
+
     # ------------ Tests complémentaires pour utilisateurs non authentifiés ------------
     def test_list_certifications_non_authenticated_fail(self):
         # Pas de force_authenticate() => utilisateur non authentifié
@@ -219,13 +319,13 @@ class CompetencyAPITests(APITestCase):
         self.client.force_authenticate(user=self.admin)
         response = self.client.get(self.comp_list_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertGreaterEqual(len(response.data), 1)
+        self.assertGreaterEqual(len(response.json()['results']), 1)
 
     def test_list_competencies_valid_with_existing(self):
         Competency.objects.create(name="Comp Existante", description="Déjà présente")
         self.client.force_authenticate(user=self.admin)
         response = self.client.get(self.comp_list_url)
-        names = [comp['name'] for comp in response.data]
+        names = [comp['name'] for comp in response.json()['results']]
         self.assertIn("Comp Existante", names)
 
     def test_list_competencies_invalid_method_fail(self):
@@ -240,7 +340,7 @@ class CompetencyAPITests(APITestCase):
         self.client.force_authenticate(user=self.admin)
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['name'], "Comp Detail")
+        self.assertEqual(response.json()['name'], "Comp Detail")
 
     def test_competency_detail_valid_again(self):
         comp = Competency.objects.create(name="Comp Detail 2", description="Autre détail")
@@ -317,3 +417,739 @@ class CompetencyAPITests(APITestCase):
         url = f"/certifications/competencies/{comp.id}/"
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+def use_shared_cache(test):
+    # Cache fichier : partagé entre processus, comme Redis ou memcached en production
+    directory = test.enterContext(tempfile.TemporaryDirectory())
+    test.enterContext(override_settings(CACHES={
+        **settings.CACHES, 'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': directory},
+    }))
+
+
+class CatalogConditionalGetTests(APITestCase):
+    def setUp(self):
+        use_shared_cache(self)
+        cache.clear()
+        self.admin = User.objects.create_superuser(username='admin3', email='admin3@example.com', password='adminpass')
+        self.user = User.objects.create_user(username='user3', email='user3@example.com', password='userpass')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.certification = Certification.objects.create(name="Cert ETag", description="Catalogue")
+            self.competency = Competency.objects.create(name="Comp ETag")
+        self.client.force_authenticate(user=self.user)
+
+    def revalidate(self, url, response):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+    def test_unchanged_catalog_returns_304_without_query(self):
+        for url in ['/certifications/', f'/certifications/{self.certification.pk}/',
+                    '/certifications/competencies/', f'/certifications/competencies/{self.competency.pk}/']:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertIn("Last-Modified", response)
+                with self.assertNumQueries(0):
+                    not_modified = self.revalidate(url, response)
+                self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+                self.assertEqual(not_modified["ETag"], response["ETag"])
+
+    def test_local_cache_revalidates_against_database(self):
+        # Cache propre au worker : un catalogue modifié par un autre worker n'est pas revalidé en 304
+        with override_settings(CACHES={**settings.CACHES, 'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}):
+            response = self.client.get('/certifications/')
+            with self.assertNumQueries(1):
+                self.assertEqual(self.revalidate('/certifications/', response).status_code, status.HTTP_304_NOT_MODIFIED)
+            CatalogVersion.bump()
+            changed = self.revalidate('/certifications/', response)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(changed["ETag"], response["ETag"])
+
+    def test_if_modified_since(self):
+        response = self.client.get('/certifications/')
+        not_modified = self.client.get('/certifications/', HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_catalog_changes_invalidate_validators(self):
+        url = '/certifications/'
+        changes = [
+            lambda: Certification.objects.filter(pk=self.certification.pk).first().save(),
+            lambda: self.client.put(
+                f'/certifications/{self.certification.pk}/competencies/', {"competency_ids": [self.competency.pk]}, format='json'
+            ),
+            lambda: Competency.objects.get(pk=self.competency.pk).delete(),
+        ]
+        for change in changes:
+            response = self.client.get(url)
+            self.client.force_authenticate(user=self.admin)
+            with self.captureOnCommitCallbacks(execute=True):
+                change()
+            self.client.force_authenticate(user=self.user)
+            revalidated = self.revalidate(url, response)
+            self.assertEqual(revalidated.status_code, status.HTTP_200_OK)
+            self.assertNotEqual(revalidated["ETag"], response["ETag"])
+
+    def test_permissions_checked_before_304(self):
+        response = self.client.get('/certifications/')
+        self.client.force_authenticate(user=None)
+        self.assertEqual(self.revalidate('/certifications/', response).status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class CatalogSnapshotTests(APITestCase):
+    def setUp(self):
+        use_shared_cache(self)
+        cache.clear()
+        invalidate_catalog_snapshot()
+        self.admin = User.objects.create_superuser(username='admin6', email='admin6@example.com', password='adminpass')
+        self.user = User.objects.create_user(username='user6', email='user6@example.com', password='userpass')
+        with self.captureOnCommitCallbacks(execute=True):
+            competencies = [Competency.objects.create(name=f"Comp Instantané {i}") for i in range(3)]
+            for i in range(4):
+                cert = Certification.objects.create(name=f"Cert Instantané {i}", description="Catalogue")
+                for competency in competencies[:i]:
+                    CertificationCompetency.objects.create(certification=cert, competency=competency)
+        self.certification = cert
+        self.client.force_authenticate(user=self.user)
+
+    def orm_get(self, url):
+        with override_settings(CATALOG_SNAPSHOT=False):
+            return self.client.get(url)
+
+    def test_snapshot_compiled_once_then_served_without_query(self):
+        # Version du catalogue, puis certifications, compétences préchargées et compétences
+        with self.assertNumQueries(4):
+            self.client.get('/certifications/')
+        for url in ['/certifications/', f'/certifications/{self.certification.pk}/', '/certifications/competencies/']:
+            with self.subTest(url=url), self.assertNumQueries(0):
+                self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+    def test_responses_match_serializers(self):
+        urls = [
+            '/certifications/', '/certifications/competencies/', '/certifications/competencies/?page_size=2',
+            f'/certifications/{self.certification.pk}/', '/certifications/999999/', '/certifications/competencies/999999/',
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                expected = self.orm_get(url)
+                self.assertEqual(response.status_code, expected.status_code)
+                self.assertEqual(response.content, expected.content)
+                self.assertEqual(response["Content-Type"], expected["Content-Type"])
+
+    def test_cursor_links_match_serializers(self):
+        url, pages = '/certifications/?page_size=1', []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.content, self.orm_get(url).content)
+            pages.append(response.json())
+            url = response.json()['next']
+        self.assertEqual([page['results'][0]['name'] for page in pages], [f"Cert Instantané {i}" for i in range(4)])
+        previous = self.client.get(pages[-1]['previous'])
+        self.assertEqual(previous.content, self.orm_get(pages[-1]['previous']).content)
+
+    def test_catalog_writes_invalidate_snapshot(self):
+        self.client.get('/certifications/')
+        competency = Competency.objects.get(name="Comp Instantané 0")
+        with self.captureOnCommitCallbacks(execute=True):
+            competency.name = "Comp Renommée"
+            competency.save()
+        names = [comp['name'] for comp in self.client.get(f'/certifications/{self.certification.pk}/').json()['competencies']]
+        self.assertIn("Comp Renommée", names)
+
+    def test_browsable_api_uses_serializers(self):
+        self.client.get('/certifications/')
+        response = self.client.get('/certifications/', HTTP_ACCEPT='text/html')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('text/html', response["Content-Type"])
+
+
+class CertificationLogoTests(APITestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        self.enterContext(self.settings(MEDIA_ROOT=media_root))
+        self.media_root = media_root
+        self.admin = User.objects.create_superuser(username='admin8', email='admin8@example.com', password='adminpass')
+        self.client.force_authenticate(user=self.admin)
+
+    def upload(self, name, filename="logo.png"):
+        buffer = BytesIO()
+        Image.new("RGBA", (300, 200), color=(0, 0, 128, 255)).save(buffer, format="PNG")
+        logo = SimpleUploadedFile(filename, buffer.getvalue(), content_type="image/png")
+        response = self.client.post('/certifications/', {"name": name, "logo": logo}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return Certification.objects.get(pk=response.data["id"]), response.data
+
+    def test_identical_uploads_share_one_file(self):
+        first, _ = self.upload("Cert Logo 1")
+        second, _ = self.upload("Cert Logo 2", filename="copie.PNG")
+        self.assertEqual(first.logo.name, second.logo.name)
+        self.assertRegex(first.logo.name, r'^certification_logos/[0-9a-f]{32}\.png$')
+        self.assertEqual(len(os.listdir(os.path.join(self.media_root, 'certification_logos'))), 2)  # Logo + variants/
+
+    def test_variants_generated_and_exposed(self):
+        certification, data = self.upload("Cert Logo Variantes")
+        self.assertEqual(set(data["logo_variants"]), {"64", "256"})
+        self.assertEqual(set(data["logo_variants"]["64"]), {"webp", "png"})
+        response = self.client.get(data["logo_variants"]["64"]["webp"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "image/webp")
+        self.assertEqual(response["Cache-Control"], "public, max-age=31536000, immutable")
+        with Image.open(BytesIO(b''.join(response.streaming_content))) as image:
+            self.assertEqual((image.format, image.size), ("WEBP", (64, 43)))
+
+    def test_missing_variant_regenerated_on_request(self):
+        certification, data = self.upload("Cert Logo Régénéré")
+        variants = os.path.join(self.media_root, 'certification_logos', 'variants')
+        for filename in os.listdir(variants):
+            os.remove(os.path.join(variants, filename))
+        self.client.force_authenticate(user=None)  # Vue publique (balises <img>)
+        response = self.client.get(data["logo_variants"]["256"]["png"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        b''.join(response.streaming_content)
+        self.assertEqual(os.listdir(variants), [os.path.basename(data["logo_variants"]["256"]["png"])])
+
+    def test_unknown_variant_fail(self):
+        certification, data = self.upload("Cert Logo Inconnu")
+        stem = os.path.splitext(os.path.basename(certification.logo.name))[0]
+        for name in ["inconnu-64.webp", f"{stem}-100.webp", f"{stem}-64.gif"]:
+            with self.subTest(name=name):
+                self.assertEqual(self.client.get(f"/certifications/logos/{name}").status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_certification_without_logo_has_no_variants(self):
+        response = self.client.post('/certifications/', {"name": "Cert Sans Logo"}, format='json')
+        self.assertIsNone(response.data["logo_variants"])
+
+
+class QuestionDifficultyTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='user3', email='user3@example.com', password='userpass')
+        self.certification = Certification.objects.create(name="Cert Difficulté")
+        self.session = ExamSession.objects.create(user=self.user, certification=self.certification)
+        self.question = Question.objects.create(text="Qui est responsable du Product Backlog ?")
+        self.good = Answer.objects.create(question=self.question, text="Le Product Owner", is_correct=True)
+        self.bad = Answer.objects.create(question=self.question, text="Le Scrum Master")
+
+    def answer(self, selected):
+        return UserQuestionResponse.objects.create(
+            exam_session=self.session,
+            question=self.question,
+            selected_answer=selected,
+            correct_answer=self.good,
+            is_correct=selected.is_correct,
+        )
+
+    def test_difficulty_unknown_without_attempts(self):
+        self.assertEqual(self.question.difficulty(), "Unknown")
+
+    def test_counters_updated_on_response_creation(self):
+        self.answer(self.good)
+        self.answer(self.bad)
+        self.answer(self.bad)
+        self.question.refresh_from_db()
+        self.assertEqual(self.question.total_attempts, 3)
+        self.assertEqual(self.question.correct_attempts, 1)
+        self.assertEqual(self.question.difficulty(), "Hard")
+
+    def test_difficulty_does_not_query_responses(self):
+        self.answer(self.good)
+        self.question.refresh_from_db()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.question.difficulty(), "Easy")
+
+    def test_rebuild_question_stats_command(self):
+        self.answer(self.good)
+        self.answer(self.bad)
+        Question.objects.update(total_attempts=0, correct_attempts=0)
+        call_command('rebuild_question_stats', stdout=StringIO())
+        self.question.refresh_from_db()
+        self.assertEqual(self.question.total_attempts, 2)
+        self.assertEqual(self.question.correct_attempts, 1)
+        self.assertEqual(self.question.difficulty(), "Medium")
+
+    def test_counters_decremented_on_response_deletion(self):
+        response = self.answer(self.good)
+        self.answer(self.bad)
+        response.delete()
+        self.question.refresh_from_db()
+        self.assertEqual((self.question.total_attempts, self.question.correct_attempts), (1, 0))
+
+    def test_counters_decremented_on_session_cascade(self):
+        self.answer(self.good)
+        self.answer(self.bad)
+        self.session.delete()
+        self.question.refresh_from_db()
+        self.assertEqual((self.question.total_attempts, self.question.correct_attempts), (0, 0))
+
+    def test_counters_follow_corrected_response(self):
+        response = self.answer(self.bad)
+        response.selected_answer, response.is_correct = self.good, True
+        response.save()
+        self.question.refresh_from_db()
+        self.assertEqual((self.question.total_attempts, self.question.correct_attempts), (1, 1))
+        response.save()  # Sans changement : compteurs inchangés
+        self.question.refresh_from_db()
+        self.assertEqual((self.question.total_attempts, self.question.correct_attempts), (1, 1))
+
+
+class ExamSubmissionAPITests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='user4', email='user4@example.com', password='userpass')
+        self.other = User.objects.create_user(username='user5', email='user5@example.com', password='userpass')
+        self.certification = Certification.objects.create(name="Cert Examen")
+        self.session = ExamSession.objects.create(user=self.user, certification=self.certification)
+        self.competency = Competency.objects.create(name="Comp Certification Examen")
+        CertificationCompetency.objects.create(certification=self.certification, competency=self.competency)
+        self.questions = []
+        for i in range(4):
+            question = Question.objects.create(text=f"Question {i}")
+            question.competencies.add(self.competency)
+            good = Answer.objects.create(question=question, text="Bonne réponse", is_correct=True)
+            bad = Answer.objects.create(question=question, text="Mauvaise réponse")
+            self.questions.append((question, good, bad))
+        self.url = f"/certifications/sessions/{self.session.id}/submit/"
+
+    def answer_sheet(self, correct_count):
+        return {"answers": [
+            {"question_id": question.id, "answer_id": (good if i < correct_count else bad).id}
+            for i, (question, good, bad) in enumerate(self.questions)
+        ]}
+
+    def test_submit_exam_valid(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(self.url, self.answer_sheet(3), format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['score'], 75.0)
+        self.assertEqual(response.data['correct_answers'], 3)
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.score, 75.0)
+        self.assertIsNotNone(self.session.completed_at)
+        self.assertEqual(self.session.question_responses.count(), 4)
+        question, _, _ = self.questions[0]
+        question.refresh_from_db()
+        self.assertEqual((question.total_attempts, question.correct_attempts), (1, 1))
+
+    def test_submit_exam_query_count_is_constant(self):
+        for i in range(20):
+            question = Question.objects.create(text=f"Question supplémentaire {i}")
+            question.competencies.add(self.competency)
+            good = Answer.objects.create(question=question, text="Bonne réponse", is_correct=True)
+            bad = Answer.objects.create(question=question, text="Mauvaise réponse")
+            self.questions.append((question, good, bad))
+        self.client.force_authenticate(user=self.user)
+        # savepoint, session, questions de la certification, réponses, bulk insert, session,
+        # compteurs (x2), compétences des questions, maîtrise (insert, update), progression
+        # du dashboard (lecture puis création : 5 requêtes la première fois, 2 ensuite), release
+        with self.assertNumQueries(18):
+            response = self.client.post(self.url, self.answer_sheet(10), format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_submit_exam_updates_competency_mastery(self):
+        competency = Competency.objects.create(name="Comp Examen")
+        for question, _, _ in self.questions:
+            question.competencies.add(competency)
+        self.client.force_authenticate(user=self.user)
+        self.client.post(self.url, self.answer_sheet(3), format='json')
+        mastery = CompetencyMastery.objects.get(user=self.user, competency=competency)
+        self.assertEqual((mastery.attempts, mastery.correct_answers), (4, 3))
+        self.assertEqual(mastery.success_rate(), 75.0)
+        self.assertIsNotNone(mastery.last_seen_at)
+
+    def test_submit_exam_answer_from_other_question_fail(self):
+        self.client.force_authenticate(user=self.user)
+        data = self.answer_sheet(4)
+        data["answers"][0]["answer_id"] = self.questions[1][1].id
+        response = self.client.post(self.url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['question_ids'], [self.questions[0][0].id])
+        self.assertFalse(UserQuestionResponse.objects.exists())
+
+    def test_submit_exam_question_from_other_certification_fail(self):
+        other_certification = Certification.objects.create(name="Cert Autre")
+        other_competency = Competency.objects.create(name="Comp Autre")
+        CertificationCompetency.objects.create(certification=other_certification, competency=other_competency)
+        question = Question.objects.create(text="Question d'une autre certification")
+        question.competencies.add(other_competency)
+        good = Answer.objects.create(question=question, text="Bonne réponse", is_correct=True)
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(self.url, {"answers": [{"question_id": question.id, "answer_id": good.id}]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['question_ids'], [question.id])
+        self.session.refresh_from_db()
+        self.assertIsNone(self.session.completed_at)
+
+    def test_submit_exam_duplicate_question_fail(self):
+        self.client.force_authenticate(user=self.user)
+        data = self.answer_sheet(4)
+        data["answers"].append(data["answers"][0])
+        response = self.client.post(self.url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_submit_exam_already_completed_fail(self):
+        self.client.force_authenticate(user=self.user)
+        self.client.post(self.url, self.answer_sheet(4), format='json')
+        response = self.client.post(self.url, self.answer_sheet(4), format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.session.question_responses.count(), 4)
+
+    def test_submit_exam_other_user_session_fail(self):
+        self.client.force_authenticate(user=self.other)
+        response = self.client.post(self.url, self.answer_sheet(4), format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_submit_exam_non_authenticated_fail(self):
+        response = self.client.post(self.url, self.answer_sheet(4), format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ImportQuestionsCommandTests(TestCase):
+    def setUp(self):
+        self.competency = Competency.objects.create(name="Empirisme")
+        self.records = [
+            {
+                "text": f"Question importée {i}",
+                "explanation": "Explication",
+                "competencies": ["Empirisme"],
+                "answers": [
+                    {"text": "Bonne réponse", "is_correct": True},
+                    {"text": "Mauvaise réponse", "is_correct": False},
+                ],
+            }
+            for i in range(5)
+        ]
+
+    def write_file(self, suffix, content):
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(fd, 'w', encoding='utf-8') as fp:
+            fp.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def run_import(self, path, *args):
+        out = StringIO()
+        call_command('import_questions', path, *args, stdout=out)
+        return out.getvalue()
+
+    def test_import_json_array_in_batches(self):
+        path = self.write_file('.json', json.dumps(self.records, indent=2))
+        output = self.run_import(path, '--batch-size', '2')
+        self.assertIn("5 questions importées", output)
+        self.assertEqual(Question.objects.count(), 5)
+        self.assertEqual(Answer.objects.count(), 10)
+        self.assertEqual(self.competency.questions.count(), 5)
+        self.assertEqual(Answer.objects.filter(is_correct=True).count(), 5)
+
+    def test_import_json_lines(self):
+        path = self.write_file('.jsonl', "\n".join(json.dumps(record) for record in self.records))
+        self.run_import(path)
+        self.assertEqual(Question.objects.count(), 5)
+
+    def test_import_csv(self):
+        content = (
+            "text,explanation,competencies,answers,correct\n"
+            "Combien de rôles Scrum ?,Trois responsabilités,Empirisme|Inconnue,Deux|Trois|Quatre,2\n"
+        )
+        path = self.write_file('.csv', content)
+        output = self.run_import(path)
+        question = Question.objects.get()
+        self.assertEqual(question.answers.get(is_correct=True).text, "Trois")
+        self.assertEqual(list(question.competencies.all()), [self.competency])
+        self.assertIn("1 tag(s) de compétence inconnu(s)", output)
+
+    def test_import_creates_missing_competencies(self):
+        self.records[0]["competencies"] = ["Nouvelle compétence"]
+        path = self.write_file('.json', json.dumps(self.records))
+        self.run_import(path, '--create-competencies')
+        self.assertTrue(Competency.objects.filter(name="Nouvelle compétence", questions__isnull=False).exists())
+
+    def test_import_skips_invalid_records(self):
+        self.records.append({"text": "Sans bonne réponse", "answers": [{"text": "Non", "is_correct": False}]})
+        path = self.write_file('.json', json.dumps(self.records))
+        output = self.run_import(path)
+        self.assertEqual(Question.objects.count(), 5)
+        self.assertIn("1 enregistrement(s) invalide(s)", output)
+
+    def test_import_truncated_json_fail(self):
+        path = self.write_file('.json', json.dumps(self.records)[:-1])
+        with self.assertRaises(CommandError):
+            self.run_import(path)
+
+    def test_import_malformed_json_line_fail(self):
+        lines = [json.dumps(record) for record in self.records]
+        lines.insert(2, '{"text": "Tronquée", ')
+        path = self.write_file('.jsonl', "\n".join(lines))
+        with self.assertRaisesMessage(CommandError, "Ligne 3 : JSON invalide"):
+            self.run_import(path)
+
+
+class SyntheticDatasetTests(TestCase):
+    def setUp(self):
+        certification = Certification.objects.create(name="Cert Synthétique")
+        for i in range(2):
+            competency = Competency.objects.create(name=f"Comp Synthétique {i}")
+            CertificationCompetency.objects.create(certification=certification, competency=competency)
+
+    def generate(self, **overrides):
+        from certifications.management.commands.seed import Command as SeedCommand
+        options = {
+            'users': 5, 'sessions': 12, 'responses_per_session': 4, 'questions_per_competency': 3,
+            'days': 30, 'random_seed': 7, 'batch_size': 10,
+        }
+        options.update(overrides)
+        SeedCommand(stdout=StringIO()).generate_synthetic_dataset(options)
+
+    def test_generate_synthetic_dataset_volumes(self):
+        self.generate()
+        self.assertEqual(User.objects.filter(username__startswith="synthetic_").count(), 5)
+        self.assertEqual(Question.objects.count(), 6)
+        self.assertEqual(Answer.objects.count(), 24)
+        self.assertEqual(ExamSession.objects.filter(completed_at__isnull=False).count(), 12)
+        self.assertEqual(UserQuestionResponse.objects.count(), 48)
+        self.assertEqual(
+            sum(Question.objects.values_list('total_attempts', flat=True)),
+            UserQuestionResponse.objects.count()
+        )
+        # Les séquences restent utilisables après les insertions à clés explicites
+        self.assertTrue(Question.objects.create(text="Après génération").pk)
+
+    def test_generate_synthetic_dataset_is_deterministic(self):
+        self.generate()
+        first = list(UserQuestionResponse.objects.order_by('id').values_list('question_id', 'is_correct'))
+        scores = list(ExamSession.objects.order_by('id').values_list('score', flat=True))
+        ExamSession.objects.all().delete()
+        self.generate(users=0)
+        second = list(UserQuestionResponse.objects.order_by('id').values_list('question_id', 'is_correct'))
+        self.assertEqual(first, second)
+        self.assertEqual(list(ExamSession.objects.order_by('id').values_list('score', flat=True)), scores)
+
+    def test_generate_synthetic_dataset_is_idempotent_for_users_and_questions(self):
+        self.generate()
+        self.generate(sessions=0)
+        self.assertEqual(User.objects.filter(username__startswith="synthetic_").count(), 5)
+        self.assertEqual(Question.objects.count(), 6)
+
+
+class CompetencyMasteryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='user6', email='user6@example.com', password='userpass')
+        self.certification = Certification.objects.create(name="Cert Maîtrise")
+        self.session = ExamSession.objects.create(user=self.user, certification=self.certification)
+        self.first = Competency.objects.create(name="Comp Maîtrise 1")
+        self.second = Competency.objects.create(name="Comp Maîtrise 2")
+        self.question = Question.objects.create(text="Question multi-compétences")
+        self.question.competencies.add(self.first, self.second)
+        self.good = Answer.objects.create(question=self.question, text="Oui", is_correct=True)
+        self.bad = Answer.objects.create(question=self.question, text="Non")
+
+    def answer(self, selected):
+        UserQuestionResponse.objects.create(
+            exam_session=self.session, question=self.question,
+            selected_answer=selected, correct_answer=self.good, is_correct=selected.is_correct,
+        )
+
+    def test_mastery_updated_incrementally_for_each_competency(self):
+        self.answer(self.good)
+        self.answer(self.bad)
+        for competency in (self.first, self.second):
+            mastery = CompetencyMastery.objects.get(user=self.user, competency=competency)
+            self.assertEqual((mastery.attempts, mastery.correct_answers), (2, 1))
+
+    def test_mastery_decremented_on_response_and_session_deletion(self):
+        self.answer(self.good)
+        self.answer(self.bad)
+        UserQuestionResponse.objects.filter(is_correct=False).delete()
+        mastery = CompetencyMastery.objects.get(user=self.user, competency=self.first)
+        self.assertEqual((mastery.attempts, mastery.correct_answers), (1, 1))
+        self.session.delete()
+        mastery.refresh_from_db()
+        self.assertEqual((mastery.attempts, mastery.correct_answers), (0, 0))
+
+    def test_retagged_question_response_deletion(self):
+        # Le crédit enregistré avec la réponse est retiré, pas celui des liens actuels de la question
+        third = Competency.objects.create(name="Comp Maîtrise 3")
+        self.answer(self.good)
+        self.question.competencies.set([third])
+        UserQuestionResponse.objects.all().delete()
+        for competency in (self.first, self.second):
+            mastery = CompetencyMastery.objects.get(user=self.user, competency=competency)
+            self.assertEqual((mastery.attempts, mastery.correct_answers), (0, 0))
+        self.assertFalse(CompetencyMastery.objects.filter(competency=third).exists())
+
+    def test_retagged_question_cascade_deletions(self):
+        third = Competency.objects.create(name="Comp Maîtrise 3")
+        self.answer(self.good)
+        self.question.competencies.set([third])
+        self.session.delete()
+        self.assertEqual(
+            list(CompetencyMastery.objects.values_list('attempts', 'correct_answers')), [(0, 0), (0, 0)]
+        )
+        self.session = ExamSession.objects.create(user=self.user, certification=self.certification)
+        self.answer(self.good)
+        self.question.competencies.set([self.first])
+        self.certification.delete()
+        self.user.delete()
+        self.assertFalse(CompetencyMastery.objects.exists())
+
+    def test_retagged_question_corrected_response(self):
+        self.answer(self.bad)
+        self.question.competencies.set([self.second])
+        response = UserQuestionResponse.objects.get()
+        response.selected_answer, response.is_correct = self.good, True
+        response.save()
+        first = CompetencyMastery.objects.get(user=self.user, competency=self.first)
+        second = CompetencyMastery.objects.get(user=self.user, competency=self.second)
+        self.assertEqual((first.attempts, first.correct_answers), (0, 0))
+        self.assertEqual((second.attempts, second.correct_answers), (1, 1))
+        self.assertEqual(UserQuestionResponse.objects.get().credited_competency_ids, [self.second.id])
+
+    def test_user_deletion_does_not_recreate_mastery(self):
+        self.answer(self.good)
+        self.user.delete()
+        self.assertFalse(CompetencyMastery.objects.exists())
+
+    def test_mastery_follows_corrected_response(self):
+        self.answer(self.bad)
+        response = UserQuestionResponse.objects.get()
+        response.selected_answer, response.is_correct = self.good, True
+        response.save()
+        for competency in (self.first, self.second):
+            mastery = CompetencyMastery.objects.get(user=self.user, competency=competency)
+            self.assertEqual((mastery.attempts, mastery.correct_answers), (1, 1))
+
+    def test_rebuild_competency_mastery_command(self):
+        self.answer(self.good)
+        self.answer(self.good)
+        CompetencyMastery.objects.all().delete()
+        call_command('rebuild_competency_mastery', stdout=StringIO())
+        mastery = CompetencyMastery.objects.get(user=self.user, competency=self.first)
+        self.assertEqual((mastery.attempts, mastery.correct_answers), (2, 2))
+        self.assertEqual(CompetencyMastery.objects.count(), 2)
+
+    def test_rebuild_competency_mastery_for_one_user(self):
+        self.answer(self.bad)
+        CompetencyMastery.objects.filter(competency=self.first).update(attempts=99)
+        call_command('rebuild_competency_mastery', '--user', str(self.user.id), stdout=StringIO())
+        self.assertEqual(CompetencyMastery.objects.get(user=self.user, competency=self.first).attempts, 1)
+
+
+class ExamStartAPITests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='user7', email='user7@example.com', password='userpass')
+        self.certification = Certification.objects.create(name="Cert Tirage")
+        self.competencies = [Competency.objects.create(name=f"Comp Tirage {i}") for i in range(2)]
+        self.question_ids = {}
+        for competency in self.competencies:
+            CertificationCompetency.objects.create(certification=self.certification, competency=competency)
+            for i in range(10):
+                question = Question.objects.create(text=f"{competency.name} - Question {i}")
+                question.competencies.add(competency)
+                Answer.objects.create(question=question, text="Bonne réponse", is_correct=True)
+                Answer.objects.create(question=question, text="Mauvaise réponse")
+                self.question_ids[question.id] = competency
+        self.url = f"/certifications/{self.certification.id}/sessions/"
+        self.client.force_authenticate(user=self.user)
+
+    def test_start_exam_samples_questions_across_competencies(self):
+        response = self.client.post(self.url, {"question_count": 6}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        questions = response.data["questions"]
+        self.assertEqual(len({question["id"] for question in questions}), 6)
+        per_competency = [self.question_ids[question["id"]] for question in questions]
+        self.assertEqual([per_competency.count(competency) for competency in self.competencies], [3, 3])
+        self.assertEqual(set(questions[0]["answers"][0]), {"id", "text"})
+        session = ExamSession.objects.get(pk=response.data["session_id"])
+        self.assertEqual((session.user, session.certification), (self.user, self.certification))
+
+    def test_start_exam_reads_only_sampled_questions(self):
+        self.client.post(self.url, {"question_count": 1}, format='json')  # Chargement des tableaux
+        # certification, savepoint, session, compétences, in_bulk, réponses, questions tirées, release
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, {"question_count": 4}, format='json')
+        self.assertEqual(len(queries), 8)
+        self.assertEqual(len(response.data["questions"]), 4)
+        self.assertFalse(any("RANDOM" in query["sql"].upper() for query in queries))
+
+    def test_sampling_is_seeded(self):
+        competency_ids = [competency.id for competency in self.competencies]
+        self.assertEqual(sample_question_ids(competency_ids, 8, seed=42), sample_question_ids(competency_ids, 8, seed=42))
+        self.assertEqual(sorted(sample_question_ids(competency_ids, 50, seed=1)), sorted(self.question_ids))
+
+    def test_shared_question_asked_once(self):
+        shared = Question.objects.get(pk=next(iter(self.question_ids)))
+        shared.competencies.add(self.competencies[1])
+        competency_ids = [competency.id for competency in self.competencies]
+        for seed in range(20):
+            sampled = sample_question_ids(competency_ids, 20, seed=seed)
+            self.assertEqual(len(sampled), len(set(sampled)))
+
+    def test_question_changes_refresh_pools(self):
+        competency_ids = [competency.id for competency in self.competencies]
+        sample_question_ids(competency_ids, 1)
+        question = Question.objects.create(text="Nouvelle question")
+        question.competencies.add(self.competencies[0])
+        self.assertIn(question.id, sample_question_ids(competency_ids, 50))
+        question.delete()
+        self.assertNotIn(question.id, sample_question_ids(competency_ids, 50))
+
+    def test_change_from_other_worker_seen_once_cached_version_expires(self):
+        competency_ids = [competency.id for competency in self.competencies]
+        sample_question_ids(competency_ids, 1)
+        # Autre worker : lien et version écrits en base, le cache de ce worker n'est pas touché
+        question = Question.objects.create(text="Question d'un autre worker")
+        Question.competencies.through.objects.create(question=question, competency=self.competencies[0])
+        QuestionBankVersion.bump()
+        self.assertNotIn(question.id, sample_question_ids(competency_ids, 50))
+        cache.delete(QUESTION_POOLS_VERSION_KEY)  # Expiration (QUESTION_POOLS_VERSION_TIMEOUT)
+        self.assertIn(question.id, sample_question_ids(competency_ids, 50))
+
+    def test_evicted_version_does_not_reload_pools(self):
+        competency_ids = [competency.id for competency in self.competencies]
+        sample_question_ids(competency_ids, 1)
+        cache.clear()
+        with self.assertNumQueries(1):  # Version relue, tableaux inchangés
+            sample_question_ids(competency_ids, 1)
+
+    def test_submission_must_answer_drawn_questions(self):
+        session_id = self.client.post(self.url, {"question_count": 4}, format='json').data["session_id"]
+        drawn = ExamSession.objects.get(pk=session_id).question_ids
+        self.assertEqual(len(drawn), 4)
+        answers = {
+            question_id: Answer.objects.get(question_id=question_id, is_correct=True).id for question_id in drawn
+        }
+        submit_url = f"/certifications/sessions/{session_id}/submit/"
+
+        partial = [{"question_id": drawn[0], "answer_id": answers[drawn[0]]}]
+        response = self.client.post(submit_url, {"answers": partial}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["missing_question_ids"], sorted(drawn[1:]))
+
+        other = next(question_id for question_id in self.question_ids if question_id not in drawn)
+        swapped = [{"question_id": question_id, "answer_id": answers[question_id]} for question_id in drawn[1:]]
+        swapped.append({"question_id": other, "answer_id": Answer.objects.get(question_id=other, is_correct=True).id})
+        response = self.client.post(submit_url, {"answers": swapped}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["unexpected_question_ids"], [other])
+
+        complete = [{"question_id": question_id, "answer_id": answer_id} for question_id, answer_id in answers.items()]
+        response = self.client.post(submit_url, {"answers": complete}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data["score"], response.data["total_questions"]), (100.0, 4))
+
+    def test_start_exam_unknown_certification_fail(self):
+        response = self.client.post("/certifications/999999/sessions/", {}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_start_exam_without_questions_fail(self):
+        certification = Certification.objects.create(name="Cert Sans Questions")
+        response = self.client.post(f"/certifications/{certification.id}/sessions/", {}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ExamSession.objects.filter(certification=certification).exists())
+
+    def test_start_exam_invalid_count_fail(self):
+        response = self.client.post(self.url, {"question_count": 0}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_start_exam_non_authenticated_fail(self):
+        self.client.force_authenticate(user=None)
+        response = self.client.post(self.url, {}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
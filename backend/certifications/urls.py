@@ -5,6 +5,9 @@ from .views import (
     CertificationCompetencyUpdateView,
     CompetencyListCreateView,
     CompetencyDetailView,
+    ExamSessionStartView,
+    ExamSessionSubmitView,
+    logo_variant,
 )
 
 urlpatterns = [
@@ -16,4 +19,11 @@ urlpatterns = [
     # Endpoints pour Compétences
     path('competencies/', CompetencyListCreateView.as_view(), name='competency-list-create'),
     path('competencies/<int:pk>/', CompetencyDetailView.as_view(), name='competency-detail'),
+
+    # Variantes des logos (cache HTTP d'un an)
+    path('logos/<str:name>', logo_variant, name='certification-logo-variant'),
+
+    # Endpoints pour les sessions d'examen
+    path('<int:certification_id>/sessions/', ExamSessionStartView.as_view(), name='exam-session-start'),
+    path('sessions/<int:session_id>/submit/', ExamSessionSubmitView.as_view(), name='exam-session-submit'),
 ]
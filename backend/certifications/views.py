@@ -1,18 +1,72 @@
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.http import FileResponse, HttpResponseNotAllowed, JsonResponse
+from django.utils import timezone
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import generics, permissions, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 
-from .models import Certification, Competency, CertificationCompetency
+from pagination import NameKeysetPagination
+from .catalog import catalog_validators, not_modified_response, with_validators
+from .logos import LOGO_DIRECTORY, VARIANT_FORMATS, VARIANT_NAME, ensure_variant, variant_path, variant_sizes
+from .models import (
+    Certification,
+    Competency,
+    CertificationCompetency,
+    Question,
+    Answer,
+    ExamSession,
+    UserQuestionResponse,
+    CompetencyMastery,
+)
 from .serializers import (
     CertificationSerializer,
     CompetencySerializer,
-    CertificationCompetencyUpdateSerializer
+    CertificationCompetencyUpdateSerializer,
+    ExamStartSerializer,
+    ExamStartResponseSerializer,
+    ExamSubmissionSerializer,
+    ExamSubmissionResponseSerializer,
 )
+from .sampling import sample_questions
+from .signals import bump_catalog_version, exam_session_completed
+from .snapshot import catalog_snapshot
+
+class CatalogConditionalGetMixin:
+    """
+    GET conditionnel sur la version du catalogue (voir certifications/catalog.py) :
+    un client à jour reçoit un 304 sans requête SQL ni sérialisation.
+    Les permissions sont vérifiées avant (APIView.initial).
+    Les réponses JSON sont servies depuis l'instantané du catalogue (certifications/snapshot.py).
+    """
+    snapshot_section = None  # Section de CatalogSnapshot correspondant à la vue
+
+    def get(self, request, *args, **kwargs):
+        etag, last_modified = catalog_validators()
+        not_modified = not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+        response = self.snapshot_response(request, etag, kwargs.get('pk'))
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        return with_validators(response, etag, last_modified)
+
+    def snapshot_response(self, request, etag, pk):
+        # L'API navigable (text/html) passe par les sérialiseurs
+        if self.snapshot_section is None or request.accepted_renderer.format != 'json':
+            return None
+        snapshot = catalog_snapshot(request, etag)
+        if snapshot is None:
+            return None
+        return getattr(snapshot, self.snapshot_section).response(request, pk)
 
-class CertificationListCreateView(generics.ListCreateAPIView):
-    queryset = Certification.objects.all()
+class CertificationListCreateView(CatalogConditionalGetMixin, generics.ListCreateAPIView):
+    queryset = Certification.objects.with_competencies()
     serializer_class = CertificationSerializer
+    snapshot_section = 'certifications'
+    pagination_class = NameKeysetPagination  # Les compétences ne sont préchargées que pour la page
 
     def get_permissions(self):
         # Seuls les admins peuvent créer, sinon l'utilisateur doit être authentifié.
@@ -20,9 +74,10 @@ class CertificationListCreateView(generics.ListCreateAPIView):
             return [permissions.IsAdminUser()]
         return [permissions.IsAuthenticated()]
 
-class CertificationDetailView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Certification.objects.all()
+class CertificationDetailView(CatalogConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
+    queryset = Certification.objects.with_competencies()
     serializer_class = CertificationSerializer
+    snapshot_section = 'certifications'
 
     def get_permissions(self):
         # La mise à jour et la suppression sont réservées aux admins, sinon authentification requise.
@@ -30,9 +85,11 @@ class CertificationDetailView(generics.RetrieveUpdateDestroyAPIView):
             return [permissions.IsAdminUser()]
         return [permissions.IsAuthenticated()]
 
-class CompetencyListCreateView(generics.ListCreateAPIView):
+class CompetencyListCreateView(CatalogConditionalGetMixin, generics.ListCreateAPIView):
     queryset = Competency.objects.all()
     serializer_class = CompetencySerializer
+    snapshot_section = 'competencies'
+    pagination_class = NameKeysetPagination
 
     def get_permissions(self):
         if self.request.method == 'POST':
@@ -43,9 +100,10 @@ class CompetencyListCreateView(generics.ListCreateAPIView):
     patch=extend_schema(operation_id="competency_partial_update"),
     put=extend_schema(operation_id="competency_update")
 )
-class CompetencyDetailView(generics.RetrieveUpdateDestroyAPIView):
+class CompetencyDetailView(CatalogConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Competency.objects.all()
     serializer_class = CompetencySerializer
+    snapshot_section = 'competencies'
 
     def get_permissions(self):
         if self.request.method in ['PUT', 'PATCH', 'DELETE']:
@@ -69,12 +127,221 @@ class CertificationCompetencyUpdateView(APIView):
             cert = Certification.objects.get(id=certification_id)
         except Certification.DoesNotExist:
             return Response({"error": "Certification introuvable."}, status=status.HTTP_404_NOT_FOUND)
-        # Supprime les associations existantes et recrée
-        CertificationCompetency.objects.filter(certification=cert).delete()
-        for comp_id in competency_ids:
-            try:
-                comp = Competency.objects.get(id=comp_id)
-                CertificationCompetency.objects.create(certification=cert, competency=comp)
-            except Competency.DoesNotExist:
-                continue
+
+        # Calcul du différentiel : seules les associations ajoutées ou retirées sont écrites,
+        # les autres conservent leur updated_at. Les IDs inconnus sont ignorés.
+        with transaction.atomic():
+            valid_ids = set(
+                Competency.objects.filter(id__in=set(competency_ids)).values_list('id', flat=True)
+            )
+            existing_ids = set(
+                CertificationCompetency.objects.filter(certification=cert).values_list('competency_id', flat=True)
+            )
+            removed_ids = existing_ids - valid_ids
+            added_ids = valid_ids - existing_ids
+            if removed_ids:
+                CertificationCompetency.objects.filter(certification=cert, competency_id__in=removed_ids).delete()
+            if added_ids:
+                # ignore_conflicts : une édition concurrente ayant déjà créé l'association ne fait pas échouer la requête
+                CertificationCompetency.objects.bulk_create(
+                    [CertificationCompetency(certification=cert, competency_id=comp_id) for comp_id in added_ids],
+                    ignore_conflicts=True,
+                )
+                bump_catalog_version(sender=CertificationCompetency)  # bulk_create n'émet pas post_save
         return Response({"message": "Associations mises à jour avec succès."}, status=status.HTTP_200_OK)
+
+
+@extend_schema(request=ExamStartSerializer, responses={201: ExamStartResponseSerializer})
+class ExamSessionStartView(APIView):
+    """
+    Démarre une session d'examen : questions tirées au hasard parmi les compétences de la
+    certification (certifications/sampling.py), sans ORDER BY RANDOM() sur la banque.
+    La graine du tirage est l'id de la session ; les questions tirées sont enregistrées sur la session.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = ExamStartSerializer
+
+    def post(self, request, certification_id):
+        serializer = ExamStartSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        count = serializer.validated_data.get("question_count", getattr(settings, 'EXAM_QUESTION_COUNT', 20))
+
+        if not Certification.objects.filter(id=certification_id).exists():
+            return Response({"error": "Certification introuvable."}, status=status.HTTP_404_NOT_FOUND)
+
+        with transaction.atomic():
+            session = ExamSession.objects.create(user=request.user, certification_id=certification_id)
+            questions = sample_questions(certification_id, count, seed=session.id)
+            if not questions:
+                transaction.set_rollback(True)
+                return Response(
+                    {"error": "Aucune question disponible pour cette certification."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            # Feuille de réponses attendue à la soumission
+            session.question_ids = [question.id for question in questions]
+            session.save(update_fields=['question_ids'])
+
+        return Response({
+            "session_id": session.id,
+            "started_at": session.started_at,
+            "questions": [
+                {
+                    "id": question.id,
+                    "text": question.text,
+                    "answers": [{"id": answer.id, "text": answer.text} for answer in question.answers.all()],
+                }
+                for question in questions
+            ],
+        }, status=status.HTTP_201_CREATED)
+
+@extend_schema(
+    request=ExamSubmissionSerializer,
+    responses={200: ExamSubmissionResponseSerializer}
+)
+class ExamSessionSubmitView(APIView):
+    """
+    Soumission de la feuille de réponses complète d'une session d'examen.
+    Toutes les réponses sont validées en une requête, insérées en bulk
+    et la session est notée dans la même transaction.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = ExamSubmissionSerializer
+
+    def post(self, request, session_id):
+        serializer = ExamSubmissionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        answer_sheet = {item["question_id"]: item["answer_id"] for item in serializer.validated_data["answers"]}
+
+        with transaction.atomic():
+            # Verrouille la session pour éviter une double soumission concurrente
+            session = (
+                ExamSession.objects
+                .select_for_update()
+                .filter(id=session_id, user=request.user)
+                .first()
+            )
+            if session is None:
+                return Response({"error": "Session d'examen introuvable."}, status=status.HTTP_404_NOT_FOUND)
+            if session.completed_at is not None:
+                return Response({"error": "Cette session d'examen est déjà terminée."}, status=status.HTTP_400_BAD_REQUEST)
+
+            if session.question_ids is not None:
+                # Session démarrée par ExamSessionStartView : exactement les questions tirées
+                drawn_question_ids = set(session.question_ids)
+                if set(answer_sheet) != drawn_question_ids:
+                    return Response(
+                        {
+                            "error": "Les réponses doivent porter sur toutes les questions tirées pour cette session, et seulement sur elles.",
+                            "missing_question_ids": sorted(drawn_question_ids - set(answer_sheet)),
+                            "unexpected_question_ids": sorted(set(answer_sheet) - drawn_question_ids),
+                        },
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+            else:
+                # Seules les questions des compétences de la certification comptent pour sa note
+                certification_question_ids = set(
+                    Question.competencies.through.objects.filter(
+                        question_id__in=answer_sheet.keys(),
+                        competency_id__in=CertificationCompetency.objects.filter(
+                            certification_id=session.certification_id
+                        ).values('competency_id'),
+                    ).values_list('question_id', flat=True)
+                )
+                foreign_question_ids = sorted(set(answer_sheet) - certification_question_ids)
+                if foreign_question_ids:
+                    return Response(
+                        {"error": "Questions hors de cette certification.", "question_ids": foreign_question_ids},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+
+            # Une seule requête : toutes les réponses possibles des questions soumises
+            question_answers = {}
+            correct_answer_ids = {}
+            for answer_id, question_id, is_correct in Answer.objects.filter(
+                question_id__in=answer_sheet.keys()
+            ).values_list('id', 'question_id', 'is_correct'):
+                question_answers.setdefault(question_id, {})[answer_id] = is_correct
+                if is_correct:
+                    correct_answer_ids.setdefault(question_id, answer_id)
+
+            invalid_question_ids = sorted(
+                question_id for question_id, answer_id in answer_sheet.items()
+                if answer_id not in question_answers.get(question_id, {})
+                or question_id not in correct_answer_ids
+            )
+            if invalid_question_ids:
+                return Response(
+                    {"error": "Réponses invalides pour certaines questions.", "question_ids": invalid_question_ids},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            responses = []
+            for question_id, answer_id in answer_sheet.items():
+                is_correct = question_answers[question_id][answer_id]
+                responses.append(UserQuestionResponse(
+                    exam_session=session,
+                    question_id=question_id,
+                    selected_answer_id=answer_id,
+                    correct_answer_id=correct_answer_ids[question_id],
+                    is_correct=is_correct,
+                    times_asked=1,
+                    correct_attempts=int(is_correct),
+                ))
+            # bulk_create contourne UserQuestionResponse.save() : compteurs mis à jour explicitement
+            UserQuestionResponse.credit_competencies(responses)
+            UserQuestionResponse.objects.bulk_create(responses)
+
+            correct_count = sum(response.is_correct for response in responses)
+            session.score = round(correct_count / len(responses) * 100, 2)
+            session.completed_at = timezone.now()
+            session.save(update_fields=['score', 'completed_at'])
+
+            Question.record_attempts(responses)
+            CompetencyMastery.record_responses(request.user.id, responses, session.completed_at)
+            exam_session_completed.send(sender=ExamSession, session=session, responses=responses)
+
+        return Response({
+            "session_id": session.id,
+            "score": session.score,
+            "correct_answers": correct_count,
+            "total_questions": len(responses),
+            "completed_at": session.completed_at,
+        }, status=status.HTTP_200_OK)
+
+
+# Un an : l'URL d'une variante change avec le logo
+LOGO_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+def logo_not_found():
+    # Réponse construite ici : CustomExceptionMiddleware changerait une exception Http404 en 500
+    return JsonResponse({"error": "Variante de logo introuvable."}, status=status.HTTP_404_NOT_FOUND)
+
+def logo_variant(request, name):
+    """
+    Variante d'un logo (voir certifications/logos.py), servie depuis le disque, régénérée
+    depuis l'original si elle manque. Vue Django publique : chargée par des balises <img>.
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return HttpResponseNotAllowed(['GET', 'HEAD'])
+    match = VARIANT_NAME.match(name)
+    if match is None or int(match['size']) not in variant_sizes():
+        return logo_not_found()
+    stem, size, fmt = match['stem'], int(match['size']), match['format']
+    path = variant_path(stem, size, fmt)
+    if not default_storage.exists(path):
+        logo_name = (
+            Certification.objects
+            .filter(logo__startswith=f"{LOGO_DIRECTORY}/{stem}.")
+            .values_list('logo', flat=True)
+            .first()
+        )
+        if logo_name is None:
+            return logo_not_found()
+        try:
+            ensure_variant(logo_name, size, fmt)
+        except OSError:  # Original absent ou illisible
+            return logo_not_found()
+    response = FileResponse(default_storage.open(path, 'rb'), content_type=VARIANT_FORMATS[fmt][1])
+    response['Cache-Control'] = LOGO_CACHE_CONTROL
+    return response
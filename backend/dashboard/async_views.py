@@ -0,0 +1,10 @@
+# backend/dashboard/async_views.py
+"""Dashboard pour ASGI (voir async_api) : même réponse que DashboardView"""
+
+from async_api import authenticated, json_response
+from .services import aget_dashboard_data
+
+
+@authenticated
+async def dashboard(request):
+    return json_response(await aget_dashboard_data(request.user))
@@ -0,0 +1,22 @@
+# backend/dashboard/checks.py
+
+from django.core import checks
+
+from shared_cache import is_shared_cache
+from .leaderboard import leaderboard_cache_alias, rank_index_class
+
+
+@checks.register(checks.Tags.caches)
+def check_rank_index_cache(app_configs, **kwargs):
+    index_class = rank_index_class()
+    alias = leaderboard_cache_alias()
+    if not getattr(index_class, 'requires_shared_cache', False) or is_shared_cache(alias):
+        return []
+    return [
+        checks.Warning(
+            f"{index_class.__name__} requiert un cache partagé entre les processus, or LEADERBOARD_CACHE "
+            f"('{alias}') est propre à chaque processus : DatabaseRankIndex est utilisé à la place.",
+            hint="Pointer LEADERBOARD_CACHE vers un cache partagé (Redis, memcached) ou utiliser DatabaseRankIndex.",
+            id='dashboard.W001',
+        )
+    ]
@@ -0,0 +1,226 @@
+# backend/dashboard/leaderboard.py
+"""
+Classements par certification sur le meilleur score (CertificationProgress.best_score).
+
+- Top K : lecture de l'index (certification, -best_score, user), sans tri des sessions.
+- Rang d'un utilisateur : 1 + nombre d'utilisateurs ayant un meilleur score strictement
+  supérieur, fourni par un index de rang interchangeable (setting LEADERBOARD_RANK_INDEX) :
+  - DatabaseRankIndex (défaut) : COUNT sur l'index, sans état à maintenir (coût proportionnel au rang) ;
+  - CacheRankIndex : arbre de Fenwick sur les scores stocké dans le cache, équivalent d'un
+    sorted set Redis (ZREVRANK) : O(log n) lectures groupées. Il n'est utilisé qu'avec un cache
+    partagé entre les workers (LEADERBOARD_CACHE) ; sinon DatabaseRankIndex le remplace.
+
+Les déplacements (`move`) sont déclarés dans la transaction qui modifie le meilleur score.
+"""
+
+import time
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Count
+from django.utils.module_loading import import_string
+
+from shared_cache import is_shared_cache
+from .models import CertificationProgress, LeaderboardVersion
+
+# Les scores sont des pourcentages arrondis au centième : 10 001 valeurs possibles
+SCORE_SCALE = 100
+SCORE_BUCKETS = 100 * SCORE_SCALE + 1
+
+
+def score_bucket(score):
+    return min(max(round(score * SCORE_SCALE), 0), SCORE_BUCKETS - 1)
+
+
+def leaderboard_cache_alias():
+    return getattr(settings, 'LEADERBOARD_CACHE', 'default')
+
+
+class DatabaseRankIndex:
+    """Rang calculé par la base à chaque lecture (aucun état, aucune mise à jour)"""
+
+    def __init__(self, certification_id):
+        self.certification_id = certification_id
+
+    def count_above(self, score):
+        return CertificationProgress.objects.filter(
+            certification_id=self.certification_id, best_score__gt=score
+        ).count()
+
+    def total(self):
+        return CertificationProgress.objects.filter(
+            certification_id=self.certification_id, best_score__isnull=False
+        ).count()
+
+    def move(self, previous_score, score):
+        pass
+
+    def reset(self):
+        pass
+
+
+class CacheRankIndex:
+    """
+    Arbre de Fenwick (somme de préfixes) sur les scores triés par ordre décroissant,
+    un nœud par clé de cache : une mise à jour incrémente O(log B) nœuds (cache.incr, atomique),
+    un rang lit O(log B) nœuds en un seul get_many (B = SCORE_BUCKETS, indépendant du nombre d'utilisateurs).
+
+    Chaque arbre porte la version du classement (LeaderboardVersion) qu'il reflète : une lecture
+    ne l'utilise que si elle correspond à la version en base, sinon il est reconstruit (une requête
+    GROUP BY). Un déplacement incrémente la version dans sa transaction et n'est appliqué après
+    commit qu'à un arbre de la version précédente ; un arbre reconstruit n'est publié que si
+    aucun déplacement n'a été commité pendant la lecture des scores. Un déplacement arrivé pendant
+    une reconstruction n'est donc jamais perdu : l'arbre qui l'ignore est rejeté à la lecture suivante.
+    """
+    requires_shared_cache = True
+
+    def __init__(self, certification_id):
+        self.certification_id = certification_id
+        self.cache = caches[leaderboard_cache_alias()]
+        self.timeout = getattr(settings, 'LEADERBOARD_CACHE_TIMEOUT', 86400)
+        self._version = None
+
+    def generation_key(self):
+        return f"leaderboard:{self.certification_id}:generation"
+
+    def version_key(self, generation):
+        return f"leaderboard:{self.certification_id}:{generation}:version"
+
+    def version(self):
+        """Version du classement en base, lue une fois par index (une requête HTTP)"""
+        if self._version is None:
+            self._version = LeaderboardVersion.current(self.certification_id)
+        return self._version
+
+    def node_key(self, generation, node):
+        return f"leaderboard:{self.certification_id}:{generation}:{node}"
+
+    @staticmethod
+    def position(score):
+        # Position 1-based, les meilleurs scores en premier
+        return SCORE_BUCKETS - score_bucket(score)
+
+    def count_above(self, score):
+        return self.prefix_sum(self.position(score) - 1)
+
+    def total(self):
+        return self.prefix_sum(SCORE_BUCKETS)
+
+    def prefix_sum(self, position):
+        version = self.version()
+        generation = self.cache.get(self.generation_key())
+        nodes = []
+        while position > 0:
+            nodes.append(position)
+            position -= position & -position
+        if generation is not None:
+            keys = [self.node_key(generation, node) for node in nodes]
+            values = self.cache.get_many([self.version_key(generation), *keys])
+            if values.pop(self.version_key(generation), None) == version and len(values) == len(nodes):
+                return sum(values.values())
+        tree = self.rebuild(version)
+        return sum(tree[node] for node in nodes)
+
+    def move(self, previous_score, score):
+        """
+        Déplace un utilisateur de `previous_score` vers `score` (None : absent du classement).
+        À appeler dans la transaction qui modifie le meilleur score : l'arbre est mis à jour après commit.
+        """
+        previous_version, version = LeaderboardVersion.bump(self.certification_id)
+        transaction.on_commit(partial(self.apply_move, previous_version, version, previous_score, score))
+
+    def apply_move(self, previous_version, version, previous_score, score):
+        generation = self.cache.get(self.generation_key())
+        if generation is None or self.cache.get(self.version_key(generation)) != previous_version:
+            return  # Arbre absent ou d'une autre version : reconstruit depuis la base à la prochaine lecture
+        try:
+            if previous_score is not None:
+                self._add(generation, self.position(previous_score), -1)
+            if score is not None:
+                self._add(generation, self.position(score), 1)
+        except ValueError:
+            # Nœud évincé du cache : l'arbre est incohérent, on force sa reconstruction
+            self.reset()
+            return
+        # Version avancée une fois tous les nœuds mis à jour : une lecture ne voit pas d'arbre à moitié déplacé
+        self.cache.set(self.version_key(generation), version, self.timeout)
+
+    def _add(self, generation, position, delta):
+        while position <= SCORE_BUCKETS:
+            self.cache.incr(self.node_key(generation, position), delta)
+            position += position & -position
+
+    def rebuild(self, version):
+        """Arbre construit depuis la base ; publié seulement si la version n'a pas changé pendant la lecture"""
+        tree = [0] * (SCORE_BUCKETS + 1)
+        for score, total in CertificationProgress.objects.filter(
+            certification_id=self.certification_id, best_score__isnull=False
+        ).values_list('best_score').annotate(total=Count('id')).order_by():
+            tree[self.position(score)] += total
+        # Construction en O(B) : chaque nœud propage sa somme à son parent
+        for position in range(1, SCORE_BUCKETS + 1):
+            parent = position + (position & -position)
+            if parent <= SCORE_BUCKETS:
+                tree[parent] += tree[position]
+
+        if LeaderboardVersion.current(self.certification_id) != version:
+            return tree  # Déplacement commité pendant la lecture : l'arbre sert cette lecture sans être publié
+        generation = time.time_ns()
+        nodes = {self.node_key(generation, position): tree[position] for position in range(1, SCORE_BUCKETS + 1)}
+        self.cache.set_many({**nodes, self.version_key(generation): version}, self.timeout)
+        self.cache.set(self.generation_key(), generation, self.timeout)
+        return tree
+
+    def reset(self):
+        self.cache.delete(self.generation_key())
+
+
+def rank_index_class():
+    return import_string(getattr(settings, 'LEADERBOARD_RANK_INDEX', 'dashboard.leaderboard.DatabaseRankIndex'))
+
+
+def get_rank_index(certification_id):
+    index_class = rank_index_class()
+    if getattr(index_class, 'requires_shared_cache', False) and not is_shared_cache(leaderboard_cache_alias()):
+        # Index propre au worker : il ignorerait les déplacements appliqués par les autres workers
+        index_class = DatabaseRankIndex
+    return index_class(certification_id)
+
+
+def reset_rank_indexes(*certification_ids):
+    for certification_id in certification_ids:
+        get_rank_index(certification_id).reset()
+
+
+def build_leaderboard(certification_id, user, limit):
+    """Top `limit` (rangs ex aequo partagés) et position de `user` dans le classement"""
+    top = []
+    entries = (
+        CertificationProgress.objects
+        .filter(certification_id=certification_id, best_score__isnull=False)
+        .select_related('user')
+        .order_by('-best_score', 'user_id')[:limit]
+    )
+    for position, entry in enumerate(entries, start=1):
+        rank = top[-1]["rank"] if top and top[-1]["best_score"] == entry.best_score else position
+        top.append({"rank": rank, "user_id": entry.user_id, "username": entry.user.username, "best_score": entry.best_score})
+
+    index = get_rank_index(certification_id)
+    me = None
+    best_score = (
+        CertificationProgress.objects
+        .filter(certification_id=certification_id, user=user, best_score__isnull=False)
+        .values_list('best_score', flat=True)
+        .first()
+    )
+    if best_score is not None:
+        me = {"rank": index.count_above(best_score) + 1, "best_score": best_score}
+
+    return {
+        "certification_id": certification_id,
+        "participants": index.total(),
+        "top": top,
+        "me": me,
+    }
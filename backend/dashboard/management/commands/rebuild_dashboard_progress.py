@@ -0,0 +1,62 @@
+# backend/dashboard/management/commands/rebuild_dashboard_progress.py
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from certifications.models import Certification, ExamSession
+from dashboard.leaderboard import reset_rank_indexes
+from dashboard.models import CertificationProgress, LeaderboardVersion
+from dashboard.services import invalidate_dashboard
+
+class Command(BaseCommand):
+    help = "Reconstruit la progression précalculée (CertificationProgress) à partir des sessions complétées"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, help="Limite la reconstruction à un utilisateur (id)")
+        parser.add_argument('--batch-size', type=int, default=5000, help="Nombre de lignes par lot d'insertion (défaut : 5000)")
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size doit être supérieur à 0.")
+        self.stdout.write("🔄 Reconstruction de la progression des utilisateurs...")
+
+        sessions = ExamSession.objects.filter(completed_at__isnull=False)
+        progress = CertificationProgress.objects.all()
+        if options['user'] is not None:
+            sessions = sessions.filter(user_id=options['user'])
+            progress = progress.filter(user_id=options['user'])
+
+        # Parcours en flux des sessions triées : une progression est complète dès que le couple change
+        rows = sessions.order_by('user_id', 'certification_id', 'completed_at', 'id').values_list(
+            'user_id', 'certification_id', 'score', 'completed_at'
+        )
+
+        created = 0
+        user_ids = set()
+        with transaction.atomic():
+            progress.delete()
+            batch = []
+            current = None
+            for user_id, certification_id, score, completed_at in rows.iterator(chunk_size=options['batch_size']):
+                if current is None or (current.user_id, current.certification_id) != (user_id, certification_id):
+                    current = CertificationProgress(user_id=user_id, certification_id=certification_id)
+                    batch.append(current)
+                    user_ids.add(user_id)
+                current.add_score(score, completed_at)
+                if len(batch) > options['batch_size']:
+                    # La dernière progression peut encore recevoir des sessions
+                    CertificationProgress.objects.bulk_create(batch[:-1])
+                    created += len(batch) - 1
+                    batch = batch[-1:]
+            CertificationProgress.objects.bulk_create(batch)
+            created += len(batch)
+            # Nouvelle version de chaque classement : un arbre lu avant la reconstruction ne peut plus être publié
+            for certification_id in Certification.objects.values_list('pk', flat=True):
+                LeaderboardVersion.bump(certification_id)
+
+        if options['user'] is not None:
+            invalidate_dashboard(options['user'])
+        else:
+            invalidate_dashboard(*user_ids)
+        # Les classements seront reconstruits depuis la nouvelle progression à la prochaine lecture
+        reset_rank_indexes(*Certification.objects.values_list('pk', flat=True))
+        self.stdout.write(f"✅ {created} progression(s) reconstruite(s) !")
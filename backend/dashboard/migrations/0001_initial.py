@@ -0,0 +1,61 @@
+# Generated by Django 5.1.6 on 2026-10-18 15:57
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("certifications", "0005_competency_mastery"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CertificationProgress",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("sessions_completed", models.PositiveIntegerField(default=0)),
+                ("best_score", models.FloatField(blank=True, null=True)),
+                ("last_score", models.FloatField(blank=True, null=True)),
+                ("last_completed_at", models.DateTimeField(blank=True, null=True)),
+                ("recent_scores", models.JSONField(default=list)),
+                (
+                    "certification",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="progress",
+                        to="certifications.certification",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="certification_progress",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "certification"),
+                        name="unique_user_certification_progress",
+                    )
+                ],
+            },
+        ),
+    ]
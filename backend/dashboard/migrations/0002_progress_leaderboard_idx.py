@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-18 16:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("certifications", "0006_examsession_date_indexes"),
+        ("dashboard", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="certificationprogress",
+            index=models.Index(
+                fields=["certification", "-best_score", "user"],
+                name="progress_leaderboard_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:40
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("certifications", "0009_question_bank_version"),
+        ("dashboard", "0002_progress_leaderboard_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LeaderboardVersion",
+            fields=[
+                (
+                    "certification",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="leaderboard_version",
+                        serialize=False,
+                        to="certifications.certification",
+                    ),
+                ),
+                ("version", models.PositiveBigIntegerField(default=0)),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+    ]
@@ -1,3 +1,123 @@
+from django.conf import settings
 from django.db import models
+from django.db.models import F
+from django.utils import timezone
 
-# Create your models here.
+from certifications.models import Certification, ExamSession
+
+# Nombre de scores conservés pour la tendance
+RECENT_SCORES_LENGTH = 10
+
+class CertificationProgress(models.Model):
+    """
+    Progression précalculée d'un utilisateur sur une certification, mise à jour
+    à chaque session complétée (reconstruite par `rebuild_dashboard_progress`).
+    """
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='certification_progress')
+    certification = models.ForeignKey(Certification, on_delete=models.CASCADE, related_name='progress')
+    sessions_completed = models.PositiveIntegerField(default=0)
+    best_score = models.FloatField(null=True, blank=True)
+    last_score = models.FloatField(null=True, blank=True)
+    last_completed_at = models.DateTimeField(null=True, blank=True)
+    recent_scores = models.JSONField(default=list)  # Du plus ancien au plus récent
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'certification'], name='unique_user_certification_progress'),
+        ]
+        indexes = [
+            # Classement : top K et rangs par certification sans tri à la lecture
+            models.Index(fields=['certification', '-best_score', 'user'], name='progress_leaderboard_idx'),
+        ]
+
+    @classmethod
+    def record_session(cls, session):
+        """
+        Intègre une session complétée (à appeler dans la transaction de soumission).
+        Retourne la progression et le meilleur score précédent (pour le classement).
+        """
+        lookup = {'user_id': session.user_id, 'certification_id': session.certification_id}
+        progress = cls.objects.select_for_update().filter(**lookup).first()
+        if progress is None:
+            # Première session sur cette certification : création protégée contre les doublons concurrents
+            progress, _ = cls.objects.select_for_update().get_or_create(**lookup)
+        previous_best_score = progress.best_score
+        progress.add_score(session.score, session.completed_at)
+        progress.save(update_fields=['sessions_completed', 'best_score', 'last_score', 'last_completed_at', 'recent_scores'])
+        return progress, previous_best_score
+
+    @classmethod
+    def recompute(cls, user_id, certification_id):
+        """
+        Recalcule la progression depuis les sessions complétées restantes (après la suppression
+        d'une session) ; supprimée s'il n'en reste aucune. Retourne le meilleur score précédent
+        et le nouveau (None : absent du classement), ou None sans progression enregistrée.
+        """
+        lookup = {'user_id': user_id, 'certification_id': certification_id}
+        progress = cls.objects.select_for_update().filter(**lookup).first()
+        if progress is None:
+            return None
+        previous_best_score = progress.best_score
+        recomputed = cls(pk=progress.pk, **lookup)
+        for score, completed_at in ExamSession.objects.filter(completed_at__isnull=False, **lookup).order_by(
+            'completed_at', 'id'
+        ).values_list('score', 'completed_at'):
+            recomputed.add_score(score, completed_at)
+        if not recomputed.sessions_completed:
+            cls.objects.filter(pk=progress.pk).delete()
+            return previous_best_score, None
+        recomputed.save(update_fields=['sessions_completed', 'best_score', 'last_score', 'last_completed_at', 'recent_scores'])
+        return previous_best_score, recomputed.best_score
+
+    def add_score(self, score, completed_at):
+        self.sessions_completed += 1
+        self.last_completed_at = completed_at
+        if score is None:
+            return
+        self.last_score = score
+        self.best_score = score if self.best_score is None else max(self.best_score, score)
+        self.recent_scores = (self.recent_scores + [score])[-RECENT_SCORES_LENGTH:]
+
+    def trend(self):
+        """Écart entre le dernier score et la moyenne des scores récents précédents"""
+        if len(self.recent_scores) < 2:
+            return None
+        previous = self.recent_scores[:-1]
+        return round(self.recent_scores[-1] - sum(previous) / len(previous), 2)
+
+    def __str__(self):
+        return f"{self.user_id} - {self.certification_id} ({self.sessions_completed} sessions)"
+
+
+class LeaderboardVersion(models.Model):
+    """
+    Version du classement d'une certification, incrémentée dans la transaction de chaque
+    changement de meilleur score : l'arbre de rang en cache (CacheRankIndex) porte la version
+    qu'il reflète et n'accepte que les déplacements qui partent de cette version.
+    """
+    certification = models.OneToOneField(
+        Certification, on_delete=models.CASCADE, primary_key=True, related_name='leaderboard_version'
+    )
+    version = models.PositiveBigIntegerField(default=0)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    @classmethod
+    def bump(cls, certification_id):
+        """Incrémente la version (dans la transaction courante) ; retourne (version précédente, nouvelle version)"""
+        versions = cls.objects.filter(pk=certification_id)
+        if not versions.update(version=F('version') + 1):
+            # Première version : l'insertion ignore celle d'une transaction concurrente, puis attend son verrou
+            cls.objects.bulk_create([cls(certification_id=certification_id)], ignore_conflicts=True)
+            versions.update(version=F('version') + 1)
+        version, created_at = versions.values_list('version', 'created_at').get()
+        # Version 1 : la ligne vient d'être créée, l'état précédent est celui d'une ligne absente (current)
+        previous = (version - 1, created_at) if version > 1 else (0, None)
+        return previous, (version, created_at)
+
+    @classmethod
+    def current(cls, certification_id):
+        """(version, date de création) ; la date distingue deux bases dont les compteurs se recouvrent"""
+        return cls.objects.filter(pk=certification_id).values_list('version', 'created_at').first() or (0, None)
+
+    def __str__(self):
+        return f"Classement {self.certification_id} v{self.version}"
@@ -1,4 +1,40 @@
 from rest_framework import serializers
 
+class CompetencyProgressSerializer(serializers.Serializer):
+    competency_id = serializers.IntegerField()
+    name = serializers.CharField()
+    attempts = serializers.IntegerField()
+    correct_answers = serializers.IntegerField()
+    success_rate = serializers.FloatField(allow_null=True)
+    last_seen_at = serializers.DateTimeField(allow_null=True)
+
+class CertificationProgressSerializer(serializers.Serializer):
+    certification_id = serializers.IntegerField()
+    certification_name = serializers.CharField()
+    sessions_completed = serializers.IntegerField()
+    best_score = serializers.FloatField(allow_null=True)
+    last_score = serializers.FloatField(allow_null=True)
+    last_completed_at = serializers.DateTimeField(allow_null=True)
+    recent_scores = serializers.ListField(child=serializers.FloatField())
+    trend = serializers.FloatField(allow_null=True, help_text="Dernier score moins la moyenne des scores récents précédents")
+    competencies = CompetencyProgressSerializer(many=True)
+
 class DashboardSerializer(serializers.Serializer):
     message = serializers.CharField()
+    certifications = CertificationProgressSerializer(many=True)
+
+class LeaderboardEntrySerializer(serializers.Serializer):
+    rank = serializers.IntegerField()
+    user_id = serializers.IntegerField()
+    username = serializers.CharField()
+    best_score = serializers.FloatField()
+
+class LeaderboardPositionSerializer(serializers.Serializer):
+    rank = serializers.IntegerField()
+    best_score = serializers.FloatField()
+
+class LeaderboardSerializer(serializers.Serializer):
+    certification_id = serializers.IntegerField()
+    participants = serializers.IntegerField()
+    top = LeaderboardEntrySerializer(many=True)
+    me = LeaderboardPositionSerializer(allow_null=True, help_text="Rang de l'utilisateur connecté (null sans session complétée)")
@@ -0,0 +1,119 @@
+# backend/dashboard/services.py
+"""
+Construction et cache des données du dashboard à partir des agrégats précalculés
+(CertificationProgress, CompetencyMastery) : coût constant quel que soit l'historique.
+
+Le cache par utilisateur est invalidé par suppression (session complétée, réponses corrigées ou
+supprimées) : il n'est utilisé que si le cache par défaut est partagé entre les workers. Chaque
+entrée garde l'ETag du catalogue avec lequel elle a été construite : une modification des
+compétences d'une certification la rend périmée sans invalidation explicite.
+"""
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache
+
+from certifications.catalog import acatalog_validators, catalog_validators
+from certifications.models import CertificationCompetency, CompetencyMastery
+from shared_cache import is_shared_cache
+from .models import CertificationProgress
+
+
+def dashboard_cache_key(user_id):
+    return f"dashboard:progress:{user_id}"
+
+
+def dashboard_cache_timeout():
+    return getattr(settings, 'DASHBOARD_CACHE_TIMEOUT', 3600)
+
+
+def invalidate_dashboard(*user_ids):
+    cache.delete_many([dashboard_cache_key(user_id) for user_id in user_ids])
+
+
+def get_dashboard_data(user):
+    if not is_shared_cache(DEFAULT_CACHE_ALIAS):
+        # Cache propre au worker : il ne verrait pas les invalidations faites par les autres
+        return build_dashboard_data(user)
+    etag, _ = catalog_validators()
+    key = dashboard_cache_key(user.id)
+    cached = cache.get(key)
+    if cached is not None and cached[0] == etag:
+        return cached[1]
+    data = build_dashboard_data(user)
+    cache.set(key, (etag, data), dashboard_cache_timeout())
+    return data
+
+
+async def aget_dashboard_data(user):
+    """Variante async de get_dashboard_data (vues ASGI) : mêmes requêtes, même cache"""
+    if not is_shared_cache(DEFAULT_CACHE_ALIAS):
+        return await abuild_dashboard_data(user)
+    etag, _ = await acatalog_validators()
+    key = dashboard_cache_key(user.id)
+    cached = await cache.aget(key)
+    if cached is not None and cached[0] == etag:
+        return cached[1]
+    data = await abuild_dashboard_data(user)
+    await cache.aset(key, (etag, data), dashboard_cache_timeout())
+    return data
+
+
+def progress_queryset(user):
+    return CertificationProgress.objects.filter(user=user).select_related('certification').order_by('certification__name')
+
+
+def links_queryset(certification_ids):
+    return CertificationCompetency.objects.filter(
+        certification_id__in=certification_ids
+    ).select_related('competency').order_by('competency__name')
+
+
+def masteries_queryset(user, links):
+    return CompetencyMastery.objects.filter(user=user, competency_id__in={link.competency_id for link in links})
+
+
+def build_dashboard_data(user):
+    """Trois requêtes indexées : progressions, compétences des certifications, maîtrises"""
+    progress_list = list(progress_queryset(user))
+    links = list(links_queryset([progress.certification_id for progress in progress_list]))
+    return assemble_dashboard_data(progress_list, links, list(masteries_queryset(user, links)))
+
+
+async def abuild_dashboard_data(user):
+    progress_list = [progress async for progress in progress_queryset(user)]
+    links = [link async for link in links_queryset([progress.certification_id for progress in progress_list])]
+    masteries = [mastery async for mastery in masteries_queryset(user, links)]
+    return assemble_dashboard_data(progress_list, links, masteries)
+
+
+def assemble_dashboard_data(progress_list, links, masteries):
+    competencies_by_certification = {}
+    for link in links:
+        competencies_by_certification.setdefault(link.certification_id, []).append(link.competency)
+    masteries = {mastery.competency_id: mastery for mastery in masteries}
+
+    certifications = []
+    for progress in progress_list:
+        competencies = []
+        for competency in competencies_by_certification.get(progress.certification_id, []):
+            mastery = masteries.get(competency.id)
+            competencies.append({
+                "competency_id": competency.id,
+                "name": competency.name,
+                "attempts": mastery.attempts if mastery else 0,
+                "correct_answers": mastery.correct_answers if mastery else 0,
+                "success_rate": round(mastery.success_rate(), 2) if mastery and mastery.attempts else None,
+                "last_seen_at": mastery.last_seen_at if mastery else None,
+            })
+        certifications.append({
+            "certification_id": progress.certification_id,
+            "certification_name": progress.certification.name,
+            "sessions_completed": progress.sessions_completed,
+            "best_score": progress.best_score,
+            "last_score": progress.last_score,
+            "last_completed_at": progress.last_completed_at,
+            "recent_scores": progress.recent_scores,
+            "trend": progress.trend(),
+            "competencies": competencies,
+        })
+    return {"message": "Bienvenue sur le Dashboard", "certifications": certifications}
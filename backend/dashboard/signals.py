@@ -0,0 +1,57 @@
+# backend/dashboard/signals.py
+
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, pre_delete
+from django.dispatch import receiver
+
+from certifications.models import Certification, ExamSession
+from certifications.signals import exam_session_completed, responses_changed
+from .leaderboard import get_rank_index, reset_rank_indexes
+from .models import CertificationProgress
+from .services import invalidate_dashboard
+
+
+@receiver(exam_session_completed, dispatch_uid='dashboard_record_session')
+def record_completed_session(sender, session, **kwargs):
+    progress, previous_best_score = CertificationProgress.record_session(session)
+    # Invalidation après commit : une lecture concurrente ne peut pas remettre en cache l'ancien état
+    transaction.on_commit(partial(invalidate_dashboard, session.user_id))
+    if progress.best_score != previous_best_score:
+        get_rank_index(session.certification_id).move(previous_best_score, progress.best_score)
+
+
+@receiver(responses_changed, dispatch_uid='dashboard_responses_changed')
+def invalidate_changed_masteries(sender, user_id, **kwargs):
+    transaction.on_commit(partial(invalidate_dashboard, user_id))
+
+
+@receiver(post_delete, sender=ExamSession, dispatch_uid='dashboard_progress_session_delete')
+def forget_deleted_session(sender, instance, origin=None, **kwargs):
+    """
+    Session complétée supprimée : progression recalculée depuis les sessions restantes, et
+    l'utilisateur déplacé dans le classement si son meilleur score change. Supprimée en cascade
+    de son utilisateur ou de sa certification, la progression disparaît avec elle.
+    """
+    origin_model = getattr(origin, 'model', type(origin))  # Instance ou QuerySet à l'origine de la suppression
+    if instance.completed_at is None or not issubclass(origin_model, ExamSession):
+        return
+    scores = CertificationProgress.recompute(instance.user_id, instance.certification_id)
+    transaction.on_commit(partial(invalidate_dashboard, instance.user_id))
+    if scores is not None and scores[0] != scores[1]:
+        get_rank_index(instance.certification_id).move(*scores)
+
+
+@receiver(pre_delete, sender=settings.AUTH_USER_MODEL, dispatch_uid='dashboard_leaderboard_user_delete')
+def remove_deleted_user_from_leaderboards(sender, instance, **kwargs):
+    for certification_id, best_score in CertificationProgress.objects.filter(
+        user=instance, best_score__isnull=False
+    ).values_list('certification_id', 'best_score'):
+        get_rank_index(certification_id).move(best_score, None)
+
+
+@receiver(post_delete, sender=Certification, dispatch_uid='dashboard_leaderboard_certification_delete')
+def reset_deleted_certification_leaderboard(sender, instance, **kwargs):
+    transaction.on_commit(partial(reset_rank_indexes, instance.pk))
@@ -1,3 +1,313 @@
-from django.test import TestCase
+from io import StringIO
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from rest_framework import status
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from certifications.models import (
+    Answer,
+    Certification,
+    CertificationCompetency,
+    Competency,
+    ExamSession,
+    Question,
+    UserQuestionResponse,
+)
+from dashboard.checks import check_rank_index_cache
+from dashboard.leaderboard import CacheRankIndex, DatabaseRankIndex, get_rank_index
+from dashboard.models import CertificationProgress, LeaderboardVersion
+from shared_cache import is_shared_cache
+
+User = get_user_model()
+
+class DashboardAPITests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="user", email="user@example.com", password="userpass")
+        self.certification = Certification.objects.create(name="Cert Dashboard")
+        self.competency = Competency.objects.create(name="Comp Dashboard")
+        self.other_competency = Competency.objects.create(name="Comp Jamais Vue")
+        CertificationCompetency.objects.create(certification=self.certification, competency=self.competency)
+        CertificationCompetency.objects.create(certification=self.certification, competency=self.other_competency)
+        self.questions = []
+        for i in range(4):
+            question = Question.objects.create(text=f"Question dashboard {i}")
+            question.competencies.add(self.competency)
+            good = Answer.objects.create(question=question, text="Oui", is_correct=True)
+            bad = Answer.objects.create(question=question, text="Non")
+            self.questions.append((question, good, bad))
+        self.url = "/dashboard/"
+        self.client.force_authenticate(user=self.user)
+
+    def complete_session(self, correct_count):
+        session = ExamSession.objects.create(user=self.user, certification=self.certification)
+        answers = [
+            {"question_id": question.id, "answer_id": (good if i < correct_count else bad).id}
+            for i, (question, good, bad) in enumerate(self.questions)
+        ]
+        # Exécute les callbacks on_commit (invalidation du cache) malgré la transaction de test
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f"/certifications/sessions/{session.id}/submit/", {"answers": answers}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_dashboard_without_history(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["message"], "Bienvenue sur le Dashboard")
+        self.assertEqual(response.data["certifications"], [])
+
+    def test_dashboard_progress_after_sessions(self):
+        self.complete_session(2)
+        self.complete_session(4)
+        response = self.client.get(self.url)
+        progress = response.data["certifications"][0]
+        self.assertEqual(progress["sessions_completed"], 2)
+        self.assertEqual(progress["best_score"], 100.0)
+        self.assertEqual(progress["last_score"], 100.0)
+        self.assertEqual(progress["recent_scores"], [50.0, 100.0])
+        self.assertEqual(progress["trend"], 50.0)
+        competencies = {comp["name"]: comp for comp in progress["competencies"]}
+        self.assertEqual(competencies["Comp Dashboard"]["success_rate"], 75.0)
+        self.assertEqual(competencies["Comp Jamais Vue"]["attempts"], 0)
+        self.assertIsNone(competencies["Comp Jamais Vue"]["success_rate"])
+
+    def use_shared_cache(self):
+        # Cache fichier : partagé entre processus, comme Redis ou memcached en production
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        self.enterContext(override_settings(CACHES={
+            **settings.CACHES, 'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': directory},
+        }))
+
+    def test_dashboard_served_from_cache(self):
+        self.use_shared_cache()
+        self.complete_session(3)
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data["certifications"][0]["last_score"], 75.0)
+
+    def test_local_cache_not_trusted(self):
+        # Cache propre au worker : une progression écrite par un autre worker est lue en base
+        self.complete_session(3)
+        self.client.get(self.url)
+        CertificationProgress.objects.filter(user=self.user).update(last_score=10.0)
+        self.assertEqual(self.client.get(self.url).data["certifications"][0]["last_score"], 10.0)
+
+    def test_dashboard_cache_follows_catalog_changes(self):
+        self.use_shared_cache()
+        self.complete_session(3)
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            CertificationCompetency.objects.filter(competency=self.other_competency).delete()
+        competencies = self.client.get(self.url).data["certifications"][0]["competencies"]
+        self.assertEqual([competency["name"] for competency in competencies], ["Comp Dashboard"])
+
+    def test_dashboard_cache_invalidated_on_response_deletion(self):
+        self.use_shared_cache()
+        self.complete_session(3)
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            UserQuestionResponse.objects.filter(exam_session__user=self.user, is_correct=False).delete()
+        competency = self.client.get(self.url).data["certifications"][0]["competencies"][0]
+        self.assertEqual((competency["attempts"], competency["correct_answers"]), (3, 3))
+
+    def test_dashboard_cache_invalidated_on_session_completion(self):
+        self.use_shared_cache()
+        self.complete_session(1)
+        self.assertEqual(self.client.get(self.url).data["certifications"][0]["last_score"], 25.0)
+        self.complete_session(4)
+        self.assertEqual(self.client.get(self.url).data["certifications"][0]["last_score"], 100.0)
+
+    def test_progress_recomputed_on_session_deletion(self):
+        self.use_shared_cache()
+        self.complete_session(2)
+        self.complete_session(4)
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            ExamSession.objects.filter(score=100.0).delete()
+        progress = self.client.get(self.url).data["certifications"][0]
+        self.assertEqual(progress["sessions_completed"], 1)
+        self.assertEqual((progress["best_score"], progress["last_score"]), (50.0, 50.0))
+        self.assertEqual(progress["recent_scores"], [50.0])
+        self.assertEqual(progress["competencies"][0]["attempts"], 4)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ExamSession.objects.get().delete()
+        self.assertEqual(self.client.get(self.url).data["certifications"], [])
+        self.assertFalse(CertificationProgress.objects.exists())
+
+    def test_user_deletion_with_sessions(self):
+        self.complete_session(3)
+        self.user.delete()
+        self.assertFalse(CertificationProgress.objects.exists())
+
+    def test_rebuild_dashboard_progress_command(self):
+        self.complete_session(2)
+        self.complete_session(3)
+        CertificationProgress.objects.all().delete()
+        call_command('rebuild_dashboard_progress', stdout=StringIO())
+        progress = CertificationProgress.objects.get(user=self.user, certification=self.certification)
+        self.assertEqual(progress.sessions_completed, 2)
+        self.assertEqual(progress.recent_scores, [50.0, 75.0])
+        self.assertEqual(progress.best_score, 75.0)
+
+    def test_dashboard_non_authenticated_fail(self):
+        self.client.force_authenticate(user=None)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class LeaderboardAPITests(APITestCase):
+    def setUp(self):
+        caches['leaderboard'].clear()
+        self.certification = Certification.objects.create(name="Cert Classement")
+        self.url = f"/dashboard/leaderboards/{self.certification.id}/"
+        self.users = {}
+        for username, best_score in [("alice", 95.0), ("bob", 80.0), ("carol", 80.0), ("dave", 42.5)]:
+            user = User.objects.create_user(username=username, email=f"{username}@example.com", password="userpass")
+            CertificationProgress.objects.create(
+                user=user, certification=self.certification, sessions_completed=1, best_score=best_score
+            )
+            self.users[username] = user
+        self.client.force_authenticate(user=self.users["dave"])
+
+    def test_leaderboard_top_and_own_rank(self):
+        response = self.client.get(self.url, {"limit": 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["participants"], 4)
+        self.assertEqual(
+            [(entry["rank"], entry["username"]) for entry in response.data["top"]],
+            [(1, "alice"), (2, "bob"), (2, "carol")],
+        )
+        self.assertEqual(response.data["me"], {"rank": 4, "best_score": 42.5})
+
+    def submit_perfect_session(self, user):
+        if not hasattr(self, 'question'):
+            competency = Competency.objects.create(name="Comp Classement")
+            CertificationCompetency.objects.create(certification=self.certification, competency=competency)
+            self.question = Question.objects.create(text="Question classement")
+            self.question.competencies.add(competency)
+            self.good = Answer.objects.create(question=self.question, text="Oui", is_correct=True)
+        session = ExamSession.objects.create(user=user, certification=self.certification)
+        self.client.force_authenticate(user=user)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                f"/certifications/sessions/{session.id}/submit/",
+                {"answers": [{"question_id": self.question.id, "answer_id": self.good.id}]},
+                format='json',
+            )
+        self.client.force_authenticate(user=self.users["dave"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_leaderboard_follows_session_completion(self):
+        self.client.get(self.url)
+        self.submit_perfect_session(self.users["dave"])
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["me"], {"rank": 1, "best_score": 100.0})
+        self.assertEqual(response.data["participants"], 4)
+
+    def test_leaderboard_follows_session_deletion(self):
+        self.client.get(self.url)
+        self.submit_perfect_session(self.users["dave"])
+        self.assertEqual(self.client.get(self.url).data["me"]["rank"], 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            ExamSession.objects.filter(user=self.users["dave"]).delete()
+        # Plus aucune session complétée : dave quitte le classement
+        response = self.client.get(self.url)
+        self.assertIsNone(response.data["me"])
+        self.assertEqual(response.data["participants"], 3)
+
+    def test_leaderboard_rank_restored_to_remaining_sessions(self):
+        self.submit_perfect_session(self.users["dave"])
+        self.submit_perfect_session(self.users["dave"])
+        ExamSession.objects.filter(user=self.users["dave"]).update(score=42.5)
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            ExamSession.objects.filter(user=self.users["dave"]).first().delete()
+        self.assertEqual(self.client.get(self.url).data["me"], {"rank": 4, "best_score": 42.5})
+
+    def test_deleted_user_leaves_leaderboard(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.users["alice"].delete()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["participants"], 3)
+        self.assertEqual(response.data["me"]["rank"], 3)
+
+    def test_leaderboard_invalid_limit(self):
+        response = self.client.get(self.url, {"limit": 0})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_leaderboard_unknown_certification(self):
+        response = self.client.get("/dashboard/leaderboards/9999/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class CacheRankIndexTests(LeaderboardAPITests):
+    """Mêmes classements servis par l'arbre de rang, dans un cache partagé entre les workers"""
+
+    def setUp(self):
+        # L'arbre occupe ~10 000 clés : l'alias LocMem des tests tient lieu de Redis, partagé par tous les workers
+        self.enterContext(override_settings(LEADERBOARD_RANK_INDEX='dashboard.leaderboard.CacheRankIndex'))
+        self.enterContext(mock.patch('dashboard.leaderboard.is_shared_cache', return_value=True))
+        super().setUp()
+
+    def test_leaderboard_updated_incrementally_on_session_completion(self):
+        self.client.get(self.url)  # Construit l'index de rang
+        self.submit_perfect_session(self.users["dave"])
+
+        # Existence de la certification, top K, meilleur score, version du classement : pas de reconstruction
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data["me"], {"rank": 1, "best_score": 100.0})
+        self.assertEqual(response.data["participants"], 4)
+
+    def test_cache_rank_index_matches_database(self):
+        index = CacheRankIndex(self.certification.id)
+        for score in (100.0, 95.0, 80.0, 79.99, 42.5, 0.0):
+            expected = CertificationProgress.objects.filter(
+                certification=self.certification, best_score__gt=score
+            ).count()
+            self.assertEqual(index.count_above(score), expected)
+
+    def test_move_committed_during_rebuild_is_not_lost(self):
+        current = LeaderboardVersion.current
+        calls = []
+
+        def submit_during_rebuild(certification_id):
+            # Seconde lecture de la version, après celle des scores : la soumission est commitée entre les deux
+            calls.append(certification_id)
+            if len(calls) == 2:
+                self.submit_perfect_session(self.users["dave"])
+            return current(certification_id)
+
+        with mock.patch.object(LeaderboardVersion, 'current', side_effect=submit_during_rebuild):
+            self.assertEqual(CacheRankIndex(self.certification.id).count_above(42.5), 3)
+        self.assertEqual(len(calls), 2)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["me"], {"rank": 1, "best_score": 100.0})
+
+    def test_move_from_another_version_forces_rebuild(self):
+        self.client.get(self.url)
+        CertificationProgress.objects.filter(user=self.users["dave"]).update(best_score=99.0)
+        LeaderboardVersion.bump(self.certification.id)  # Déplacement commité dont l'arbre n'a pas été informé
+        self.submit_perfect_session(self.users["carol"])
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["me"], {"rank": 2, "best_score": 99.0})
+
+    def test_requires_shared_cache(self):
+        with mock.patch('dashboard.leaderboard.is_shared_cache', is_shared_cache):
+            self.assertIsInstance(get_rank_index(self.certification.id), DatabaseRankIndex)
+            response = self.client.get(self.url)
+        self.assertEqual(response.data["me"]["rank"], 4)
+        self.assertEqual([warning.id for warning in check_rank_index_cache(None)], ['dashboard.W001'])
+        with override_settings(LEADERBOARD_RANK_INDEX='dashboard.leaderboard.DatabaseRankIndex'):
+            self.assertEqual(check_rank_index_cache(None), [])
@@ -1,6 +1,7 @@
 from django.urls import path
-from .views import DashboardView
+from .views import DashboardView, LeaderboardView
 
 urlpatterns = [
     path('', DashboardView.as_view(), name='dashboard'),  # 🔹 Endpoint API `/dashboard/`
+    path('leaderboards/<int:certification_id>/', LeaderboardView.as_view(), name='dashboard-leaderboard'),
 ]
@@ -1,14 +1,44 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
-from drf_spectacular.utils import extend_schema
-from .serializers import DashboardSerializer  # 🔹 Import du serializer
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from certifications.models import Certification
+from .serializers import DashboardSerializer, LeaderboardSerializer  # 🔹 Import des serializers
+from .services import get_dashboard_data
+from .leaderboard import build_leaderboard
+
+# Taille du top K renvoyé par défaut et au maximum
+LEADERBOARD_DEFAULT_LIMIT = 10
+LEADERBOARD_MAX_LIMIT = 100
 
 @extend_schema(responses=DashboardSerializer)  # 🔹 Ajout du schema pour DRF Spectacular
 class DashboardView(APIView):
-    """Vue du Dashboard (nécessite une authentification)"""
+    """Progression de l'utilisateur par certification, servie depuis les agrégats précalculés (nécessite une authentification)"""
 
     permission_classes = [IsAuthenticated]
 
     def get(self, request, *args, **kwargs):
-        return Response({"message": "Bienvenue sur le Dashboard"}, status=200)
+        return Response(get_dashboard_data(request.user), status=200)
+
+@extend_schema(
+    parameters=[OpenApiParameter('limit', int, description=f"Taille du top (défaut : {LEADERBOARD_DEFAULT_LIMIT}, max : {LEADERBOARD_MAX_LIMIT})")],
+    responses=LeaderboardSerializer,
+)
+class LeaderboardView(APIView):
+    """Classement d'une certification sur le meilleur score : top K et rang de l'utilisateur connecté"""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, certification_id, *args, **kwargs):
+        try:
+            limit = int(request.query_params.get('limit', LEADERBOARD_DEFAULT_LIMIT))
+        except ValueError:
+            return Response({"error": "Le paramètre limit doit être un entier."}, status=status.HTTP_400_BAD_REQUEST)
+        if not 1 <= limit <= LEADERBOARD_MAX_LIMIT:
+            return Response({"error": f"Le paramètre limit doit être compris entre 1 et {LEADERBOARD_MAX_LIMIT}."}, status=status.HTTP_400_BAD_REQUEST)
+        if not Certification.objects.filter(pk=certification_id).exists():
+            return Response({"error": "Certification introuvable."}, status=status.HTTP_404_NOT_FOUND)
+
+        data = build_leaderboard(certification_id, request.user, limit)
+        return Response(LeaderboardSerializer(data).data, status=status.HTTP_200_OK)
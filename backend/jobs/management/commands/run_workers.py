@@ -0,0 +1,110 @@
+# backend/jobs/management/commands/run_workers.py
+
+import logging
+import os
+import socket
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connections
+from jobs.queue import claim, requeue_stale, run_job
+
+logger = logging.getLogger('jobs')
+
+class Command(BaseCommand):
+    help = "Exécute les tâches de la file (table jobs_job) avec N workers, jusqu'à interruption"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=1, help="Nombre de workers (threads)")
+        parser.add_argument(
+            '--poll-interval', type=float, default=1.0, help="Attente quand la file est vide (secondes)"
+        )
+        parser.add_argument('--burst', action='store_true', help="S'arrête dès que la file est vide")
+
+    def handle(self, *args, **options):
+        if options['concurrency'] <= 0:
+            raise CommandError("--concurrency doit être strictement positif.")
+        if options['poll_interval'] <= 0:
+            raise CommandError("--poll-interval doit être strictement positif.")
+
+        requeued = requeue_stale()
+        if requeued:
+            self.stdout.write(f"♻️ {requeued} tâche(s) abandonnée(s) remise(s) en file.")
+        self.next_requeue = time.monotonic() + getattr(settings, 'JOBS_LOCK_TIMEOUT', 600)
+
+        self.stop = threading.Event()
+        self.processed = 0
+        self.failed = 0
+        self.counter_lock = threading.Lock()
+        prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self.stdout.write(f"🚀 {options['concurrency']} worker(s) démarré(s) ({prefix}).")
+
+        if options['concurrency'] == 1:
+            # Un seul worker : exécution dans le thread principal, sur sa connexion
+            self.work(f"{prefix}:0", options['poll_interval'], options['burst'])
+        else:
+            threads = [
+                threading.Thread(
+                    target=self.work_in_thread,
+                    args=(f"{prefix}:{index}", options['poll_interval'], options['burst']),
+                    name=f"job-worker-{index}",
+                )
+                for index in range(options['concurrency'])
+            ]
+            for thread in threads:
+                thread.start()
+            try:
+                for thread in threads:
+                    while thread.is_alive():
+                        thread.join(0.5)
+            except KeyboardInterrupt:
+                self.stdout.write("⏹️ Arrêt demandé, fin des tâches en cours...")
+                self.stop.set()
+                for thread in threads:
+                    thread.join()
+
+        self.stdout.write(f"✅ {self.processed} tâche(s) exécutée(s), dont {self.failed} en échec.")
+
+    def requeue_if_due(self):
+        # File vide : un seul worker à la fois récupère les tâches d'un worker disparu
+        with self.counter_lock:
+            if time.monotonic() < self.next_requeue:
+                return
+            self.next_requeue = time.monotonic() + getattr(settings, 'JOBS_LOCK_TIMEOUT', 600)
+        try:
+            requeue_stale()
+        except DatabaseError:
+            logger.warning("Remise en file des tâches abandonnées impossible", exc_info=True)
+
+    def work_in_thread(self, worker, poll_interval, burst):
+        try:
+            self.work(worker, poll_interval, burst)
+        finally:
+            connections.close_all()  # Connexions propres à ce thread
+
+    def work(self, worker, poll_interval, burst):
+        try:
+            while not self.stop.is_set():
+                try:
+                    job = claim(worker)
+                    if job is not None:
+                        succeeded = run_job(job)
+                except DatabaseError:
+                    # Base momentanément verrouillée (SQLite) : une tâche réservée non soldée
+                    # sera remise en file par requeue_stale
+                    logger.warning("Erreur de base de données dans le worker %s", worker, exc_info=True)
+                    self.stop.wait(poll_interval)
+                    continue
+                if job is None:
+                    if burst:
+                        return
+                    self.requeue_if_due()
+                    self.stop.wait(poll_interval)
+                    continue
+                with self.counter_lock:
+                    self.processed += 1
+                    self.failed += not succeeded
+        except KeyboardInterrupt:
+            self.stdout.write("⏹️ Arrêt demandé.")
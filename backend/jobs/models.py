@@ -0,0 +1,33 @@
+from django.db import models
+from django.utils import timezone
+
+class Job(models.Model):
+    """Tâche en attente d'exécution par `run_workers` ; supprimée une fois exécutée avec succès"""
+    PENDING = 'pending'
+    RUNNING = 'running'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, 'En attente'),
+        (RUNNING, 'En cours'),
+        (FAILED, 'En échec'),
+    ]
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    run_at = models.DateTimeField(default=timezone.now)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # Prochaines tâches prêtes, dans l'ordre d'exécution
+            models.Index(fields=['status', 'run_at', 'id'], name='job_ready_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
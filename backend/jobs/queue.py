@@ -0,0 +1,113 @@
+# backend/jobs/queue.py
+"""
+File de tâches durable, stockée dans la base de l'application (aucun broker externe).
+
+- Déclaration : `@job('app.nom')` dans le module `jobs.py` d'une app (découvert au démarrage).
+- Mise en file : `enqueue('app.nom', {...})`, dans la transaction de la requête (outbox) :
+  la tâche n'existe que si les écritures qui l'ont motivée sont validées.
+- Exécution : `python manage.py run_workers`. Une tâche est réservée par un UPDATE
+  conditionnel (status = pending), sans verrou de ligne : portable SQLite / PostgreSQL,
+  et deux workers ne peuvent pas réserver la même tâche.
+- Échec : nouvel essai avec délai exponentiel (JOBS_RETRY_DELAY × 2^(essai - 1)) jusqu'à
+  `max_attempts`, puis statut `failed` conservé pour inspection (last_error).
+- Une tâche réservée par un worker arrêté brutalement est remise en file après JOBS_LOCK_TIMEOUT.
+  L'exécution est donc « au moins une fois » : les tâches doivent tolérer une seconde exécution.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger('jobs')
+
+# Tâches prêtes examinées par tentative de réservation (les premières peuvent être prises par un autre worker)
+CLAIM_CANDIDATES = 10
+
+_registry = {}
+
+
+def job(name):
+    """Décorateur : enregistre `func(**payload)` comme exécutant des tâches `name`"""
+    def register(func):
+        _registry[name] = func
+        return func
+    return register
+
+
+def enqueue(name, payload=None, run_at=None, max_attempts=None):
+    """Crée une tâche `name` ; à appeler dans la transaction des écritures associées"""
+    if name not in _registry:
+        raise ValueError(f"Tâche inconnue : {name}")
+    return Job.objects.create(
+        name=name,
+        payload=payload or {},
+        run_at=run_at or timezone.now(),
+        max_attempts=max_attempts or getattr(settings, 'JOBS_MAX_ATTEMPTS', 5),
+    )
+
+
+def requeue_stale(now=None):
+    """Remet en file les tâches réservées depuis plus de JOBS_LOCK_TIMEOUT secondes (worker disparu)"""
+    now = now or timezone.now()
+    stale_before = now - timedelta(seconds=getattr(settings, 'JOBS_LOCK_TIMEOUT', 600))
+    return Job.objects.filter(status=Job.RUNNING, locked_at__lt=stale_before).update(
+        status=Job.PENDING, locked_by='', locked_at=None
+    )
+
+
+def claim(worker, now=None):
+    """Réserve la prochaine tâche prête pour `worker`, ou retourne None"""
+    now = now or timezone.now()
+    candidates = list(
+        Job.objects
+        .filter(status=Job.PENDING, run_at__lte=now)
+        .order_by('run_at', 'id')
+        .values_list('id', flat=True)[:CLAIM_CANDIDATES]
+    )
+    for job_id in candidates:
+        claimed = Job.objects.filter(pk=job_id, status=Job.PENDING).update(
+            status=Job.RUNNING, locked_by=worker, locked_at=now, attempts=F('attempts') + 1
+        )
+        if claimed:
+            return Job.objects.get(pk=job_id)
+    return None
+
+
+def run_job(job):
+    """Exécute une tâche réservée : supprimée si elle réussit, replanifiée ou en échec sinon"""
+    try:
+        handler = _registry.get(job.name)
+        if handler is None:
+            raise LookupError(f"Tâche inconnue : {job.name}")
+        handler(**job.payload)
+    except Exception as exc:
+        logger.exception("Échec de la tâche %s #%s (essai %s/%s)", job.name, job.pk, job.attempts, job.max_attempts)
+        retry = job.attempts < job.max_attempts
+        delay = getattr(settings, 'JOBS_RETRY_DELAY', 30) * 2 ** (job.attempts - 1)
+        Job.objects.filter(pk=job.pk).update(
+            status=Job.PENDING if retry else Job.FAILED,
+            run_at=timezone.now() + timedelta(seconds=delay) if retry else job.run_at,
+            locked_by='',
+            locked_at=None,
+            last_error=f"{type(exc).__name__}: {exc}",
+        )
+        return False
+    Job.objects.filter(pk=job.pk).delete()
+    return True
+
+
+def run_pending(worker, limit=None):
+    """Exécute les tâches prêtes jusqu'à vider la file (ou `limit` tâches) ; retourne le nombre exécuté"""
+    done = 0
+    while limit is None or done < limit:
+        job = claim(worker)
+        if job is None:
+            break
+        run_job(job)
+        done += 1
+    return done
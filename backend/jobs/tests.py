@@ -0,0 +1,85 @@
+import threading
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.queue import claim, enqueue, job, requeue_stale, run_pending
+
+executed = []
+executed_lock = threading.Lock()
+
+
+@job('tests.record')
+def record(value):
+    with executed_lock:
+        executed.append(value)
+
+
+@job('tests.fail')
+def fail():
+    raise RuntimeError("relais SMTP indisponible")
+
+
+class JobQueueTests(TestCase):
+    def setUp(self):
+        executed.clear()
+
+    def test_enqueue_unknown_job(self):
+        with self.assertRaises(ValueError):
+            enqueue('tests.unknown')
+
+    def test_run_pending_executes_in_order_and_deletes(self):
+        enqueue('tests.record', {"value": 1})
+        enqueue('tests.record', {"value": 2})
+        self.assertEqual(run_pending("worker"), 2)
+        self.assertEqual(executed, [1, 2])
+        self.assertFalse(Job.objects.exists())
+
+    def test_scheduled_job_waits_for_run_at(self):
+        enqueue('tests.record', {"value": 1}, run_at=timezone.now() + timedelta(minutes=5))
+        self.assertIsNone(claim("worker"))
+        self.assertEqual(executed, [])
+
+    def test_claimed_job_cannot_be_claimed_twice(self):
+        queued = enqueue('tests.record', {"value": 1})
+        claimed = claim("worker-a")
+        self.assertEqual(claimed.pk, queued.pk)
+        self.assertEqual((claimed.status, claimed.locked_by, claimed.attempts), (Job.RUNNING, "worker-a", 1))
+        self.assertIsNone(claim("worker-b"))
+
+    @override_settings(JOBS_RETRY_DELAY=10)
+    def test_failure_is_retried_with_backoff_then_marked_failed(self):
+        queued = enqueue('tests.fail', max_attempts=2)
+        with self.assertLogs('jobs', level='ERROR'):
+            run_pending("worker")
+        queued.refresh_from_db()
+        self.assertEqual((queued.status, queued.attempts), (Job.PENDING, 1))
+        self.assertGreater(queued.run_at, timezone.now() + timedelta(seconds=5))
+        self.assertEqual(queued.last_error, "RuntimeError: relais SMTP indisponible")
+
+        Job.objects.filter(pk=queued.pk).update(run_at=timezone.now())
+        with self.assertLogs('jobs', level='ERROR'):
+            run_pending("worker")
+        queued.refresh_from_db()
+        self.assertEqual((queued.status, queued.attempts), (Job.FAILED, 2))
+        self.assertIsNone(claim("worker"))
+
+    @override_settings(JOBS_LOCK_TIMEOUT=60)
+    def test_requeue_stale_releases_abandoned_jobs(self):
+        enqueue('tests.record', {"value": 1})
+        claimed = claim("worker-a")
+        self.assertEqual(requeue_stale(), 0)
+        self.assertEqual(requeue_stale(now=timezone.now() + timedelta(minutes=2)), 1)
+        self.assertEqual(claim("worker-b").pk, claimed.pk)
+
+    def test_run_workers_burst(self):
+        enqueue('tests.record', {"value": 1})
+        out = StringIO()
+        call_command('run_workers', '--burst', stdout=out)
+        self.assertEqual(executed, [1])
+        self.assertIn("1 tâche(s) exécutée(s), dont 0 en échec", out.getvalue())
+
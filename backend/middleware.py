@@ -1,7 +1,17 @@
+import json
+import logging
+import time
+from contextvars import ContextVar
+
 from django.conf import settings
+from django.db import connections
 from django.http import JsonResponse
 from django.utils.deprecation import MiddlewareMixin
 
+timing_logger = logging.getLogger('request_timing')
+
+_current_timing = ContextVar('request_timing', default=None)
+
 class CustomExceptionMiddleware(MiddlewareMixin):
     def process_exception(self, request, exception):
         response_data = {"error": "Une erreur interne est survenue."}
@@ -10,3 +20,118 @@ class CustomExceptionMiddleware(MiddlewareMixin):
             response_data["details"] = str(exception)
 
         return JsonResponse(response_data, status=500)
+
+
+class RequestTiming:
+    """Mesures d'une requête : requêtes SQL (nombre, durée), sérialisation DRF et durée totale"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.db_queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.serializer_depth = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        # Utilisé comme connection.execute_wrapper
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.db_queries += 1
+
+    def metrics(self):
+        return {
+            "db_queries": self.db_queries,
+            "db_ms": round(self.db_time * 1000, 2),
+            "serializer_ms": round(self.serializer_time * 1000, 2),
+            "total_ms": round((time.perf_counter() - self.start) * 1000, 2),
+        }
+
+
+def _install_serializer_timing():
+    """
+    Chronomètre `serializer.data` (seul point d'entrée de la sérialisation DRF)
+    lorsqu'une requête est instrumentée. Les sérialiseurs imbriqués ne sont comptés qu'une fois.
+    """
+    from rest_framework.serializers import BaseSerializer
+
+    original = BaseSerializer.data.fget
+    if getattr(original, 'is_timed', False):
+        return
+
+    def timed_data(serializer):
+        timing = _current_timing.get()
+        if timing is None or timing.serializer_depth:
+            return original(serializer)
+        timing.serializer_depth += 1
+        start = time.perf_counter()
+        try:
+            return original(serializer)
+        finally:
+            timing.serializer_time += time.perf_counter() - start
+            timing.serializer_depth -= 1
+
+    timed_data.is_timed = True
+    BaseSerializer.data = property(timed_data)
+
+
+class RequestTimingMiddleware(MiddlewareMixin):
+    """
+    Instrumente chaque requête et expose les mesures :
+    - dans l'en-tête `Server-Timing` (selon SERVER_TIMING : 'all', 'staff' ou 'off') ;
+    - dans une ligne de log JSON sur le logger `request_timing` (niveau INFO).
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        _install_serializer_timing()
+
+    def process_request(self, request):
+        timing = RequestTiming()
+        request._timing = timing
+        _current_timing.set(timing)
+        for connection in connections.all():
+            connection.execute_wrappers.append(timing)
+
+    def process_response(self, request, response):
+        timing = getattr(request, '_timing', None)
+        if timing is None:
+            return response
+        for connection in connections.all():
+            if timing in connection.execute_wrappers:
+                connection.execute_wrappers.remove(timing)
+        _current_timing.set(None)
+
+        metrics = timing.metrics()
+        resolver_match = getattr(request, 'resolver_match', None)
+        timing_logger.info(json.dumps({
+            "method": request.method,
+            "path": request.path,
+            "view": resolver_match.view_name if resolver_match else None,
+            "status": response.status_code,
+            **metrics,
+        }))
+
+        if self.header_allowed(request):
+            response['Server-Timing'] = (
+                f'db;dur={metrics["db_ms"]};desc="SQL ({metrics["db_queries"]} queries)", '
+                f'serialize;dur={metrics["serializer_ms"]};desc="Serialization", '
+                f'total;dur={metrics["total_ms"]};desc="Total"'
+            )
+            origin = request.headers.get('Origin')
+            if origin and origin in getattr(settings, 'CORS_ALLOWED_ORIGINS', []):
+                # Rend l'en-tête lisible par les devtools du frontend (requêtes cross-origin)
+                response['Timing-Allow-Origin'] = origin
+        return response
+
+    def header_allowed(self, request):
+        mode = getattr(settings, 'SERVER_TIMING', 'staff')
+        if mode == 'all':
+            return True
+        if mode == 'staff':
+            # DRF répercute l'utilisateur authentifié (JWT) sur la requête Django
+            user = getattr(request, 'user', None)
+            return bool(user and user.is_staff)
+        return False
@@ -0,0 +1,68 @@
+"""
+Schéma OpenAPI servi depuis un fichier pré-généré (OPENAPI_SCHEMA_FILE, backend/schema.yml).
+
+Générer le schéma parcourt toutes les vues et tous les sérialiseurs à chaque requête : il est
+produit au build (`python manage.py spectacular --file schema.yml`), puis lu une fois par
+worker et gardé en mémoire, rendu dans chaque format demandé (YAML / JSON).
+Si le fichier manque, le schéma n'est généré à la volée qu'en DEBUG ; sinon 503.
+"""
+
+import os
+
+import yaml
+from django.conf import settings
+from django.http import HttpResponse
+from drf_spectacular.utils import extend_schema
+from drf_spectacular.views import SCHEMA_KWARGS, SpectacularAPIView
+from rest_framework import status
+from rest_framework.response import Response
+
+_rendered = (None, {})  # ((fichier, date de modification), {(format, media type): octets})
+
+
+def schema_file():
+    return str(getattr(settings, 'OPENAPI_SCHEMA_FILE', settings.BASE_DIR / 'schema.yml'))
+
+
+def static_schema(path, renderer, media_type):
+    """Schéma du fichier rendu par `renderer` ; FileNotFoundError si le fichier n'existe pas"""
+    global _rendered
+    version = (path, os.stat(path).st_mtime_ns)
+    if _rendered[0] != version:
+        _rendered = (version, {})  # Fichier régénéré : les rendus précédents sont abandonnés
+    bodies = _rendered[1]
+    body = bodies.get((renderer.format, media_type))
+    if body is None:
+        with open(path, 'rb') as fp:
+            content = fp.read()
+        if renderer.format in ('openapi', 'yaml'):
+            body = content  # Déjà au format produit par OpenApiYamlRenderer
+        else:
+            body = renderer.render(yaml.safe_load(content), media_type, {})
+        bodies[(renderer.format, media_type)] = body
+    return body
+
+
+class StaticSchemaView(SpectacularAPIView):
+    """Schéma OpenAPI pré-généré ; mêmes formats (négociation de contenu) que SpectacularAPIView"""
+
+    @extend_schema(**SCHEMA_KWARGS)  # Exclue du schéma comme la vue d'origine (SERVE_INCLUDE_SCHEMA)
+    def get(self, request, *args, **kwargs):
+        renderer = request.accepted_renderer
+        try:
+            body = static_schema(schema_file(), renderer, request.accepted_media_type)
+        except FileNotFoundError:
+            if settings.DEBUG:
+                return super().get(request, *args, **kwargs)
+            return Response(
+                {"error": "Schéma OpenAPI non généré (python manage.py spectacular --file schema.yml)."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+        content_type = request.accepted_media_type
+        if renderer.charset:
+            content_type = f"{content_type}; charset={renderer.charset}"
+        return HttpResponse(
+            body,
+            content_type=content_type,
+            headers={"Content-Disposition": f'inline; filename="{self._get_filename(request, None)}"'},
+        )
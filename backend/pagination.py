@@ -0,0 +1,100 @@
+from rest_framework.pagination import CursorPagination, _reverse_ordering
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Pagination par curseur (keyset) : chaque page filtre `champ > dernière valeur vue`
+    sur un index, sans OFFSET ni COUNT, donc une page profonde coûte autant que la première.
+    Le champ d'ordre doit être unique et indexé pour un ordre stable.
+    """
+
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+    ordering = 'id'
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        Variante pour les vues async : reprend CursorPagination.paginate_queryset (mêmes curseurs,
+        liens interchangeables avec la vue synchrone), la page étant lue par l'ORM async.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        offset, reverse, current_position = self.cursor or (0, False, None)
+
+        queryset = queryset.order_by(*(_reverse_ordering(self.ordering) if reverse else self.ordering))
+        if current_position is not None:
+            order = self.ordering[0]
+            lookup = 'lt' if self.cursor.reverse != order.startswith('-') else 'gt'
+            queryset = queryset.filter(**{f"{order.lstrip('-')}__{lookup}": current_position})
+
+        # Un élément de plus que la page : indique s'il existe une page suivante
+        results = [obj async for obj in queryset[offset:offset + self.page_size + 1]]
+        return self.paginate_results(results, offset, reverse, current_position)
+
+    def paginate_sequence(self, items, positions, request):
+        """
+        Variante pour une liste en mémoire déjà triée selon `ordering` (croissant), mêmes curseurs
+        que paginate_queryset. `positions` : {valeur du champ d'ordre: index dans items}.
+        Lève KeyError si le curseur désigne une valeur absente de la liste.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, None, None)
+        assert not self.ordering[0].startswith('-'), "paginate_sequence ne gère que l'ordre croissant."
+        self.cursor = self.decode_cursor(request)
+        offset, reverse, current_position = self.cursor or (0, False, None)
+
+        if reverse:
+            end = (len(items) if current_position is None else positions[current_position]) - offset
+            results = items[max(end - self.page_size - 1, 0):max(end, 0)][::-1]
+        else:
+            start = (0 if current_position is None else positions[current_position] + 1) + offset
+            results = items[start:start + self.page_size + 1]
+        return self.paginate_results(results, offset, reverse, current_position)
+
+    def paginate_results(self, results, offset, reverse, current_position):
+        """Page et liens à partir des `page_size + 1` premiers éléments suivant le curseur"""
+        self.page = results[:self.page_size]
+        has_following_position = len(results) > len(self.page)
+        following_position = (
+            self._get_position_from_instance(results[-1], self.ordering) if has_following_position else None
+        )
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = current_position is not None or offset > 0
+            self.has_previous = has_following_position
+            if self.has_next:
+                self.next_position = current_position
+            if self.has_previous:
+                self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = current_position is not None or offset > 0
+            if self.has_next:
+                self.next_position = following_position
+            if self.has_previous:
+                self.previous_position = current_position
+        return self.page
+
+    def get_paginated_data(self, data):
+        return {"next": self.get_next_link(), "previous": self.get_previous_link(), "results": data}
+
+
+class UsernameKeysetPagination(KeysetPagination):
+    ordering = 'username'  # Unique : index de la contrainte d'unicité
+
+
+class NameKeysetPagination(KeysetPagination):
+    ordering = 'name'  # Unique : index de la contrainte d'unicité
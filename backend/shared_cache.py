@@ -0,0 +1,18 @@
+"""
+Caches partagés entre les workers (processus).
+
+Un cache propre à chaque processus (LocMemCache, ou DummyCache qui ne garde rien) ne voit pas
+les écritures des autres workers : un état qui doit être le même pour tous (révocation des
+refresh tokens, index de classement) ne s'y fie pas.
+"""
+
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+PROCESS_LOCAL_BACKENDS = (LocMemCache, DummyCache)
+
+
+def is_shared_cache(alias):
+    """Vrai si le cache `alias` est vu par tous les workers (Redis, memcached, base, fichiers…)"""
+    return not isinstance(caches[alias], PROCESS_LOCAL_BACKENDS)
@@ -0,0 +1,103 @@
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from authentication.authentication import CachedJWTAuthentication, token_user_cache
+from certifications.models import Certification, CertificationCompetency, Competency
+from dashboard.models import CertificationProgress
+from dashboard.services import invalidate_dashboard
+
+User = get_user_model()
+
+@override_settings(ROOT_URLCONF='backend.asgi_urls')
+class AsyncReadViewsTests(TestCase):
+    """Les vues async (ASGI) répondent exactement comme les vues DRF synchrones"""
+
+    def setUp(self):
+        cache.clear()
+        token_user_cache.clear()
+        self.admin = User.objects.create_superuser(username="admin", email="admin@example.com", password="adminpass")
+        self.user = User.objects.create_user(username="user", email="user@example.com", password="userpass")
+        competencies = [Competency.objects.create(name=f"Comp {index}") for index in range(3)]
+        for index in range(3):
+            certification = Certification.objects.create(name=f"Cert {index}", description="Description")
+            for competency in competencies[:index + 1]:
+                CertificationCompetency.objects.create(certification=certification, competency=competency)
+        CertificationProgress.objects.create(
+            user=self.user, certification=certification, sessions_completed=1,
+            best_score=80.0, last_score=80.0, recent_scores=[80.0],
+        )
+        invalidate_dashboard(self.user.id)
+        self.headers = {"Authorization": f"Bearer {RefreshToken.for_user(self.user).access_token}"}
+        self.admin_headers = {"Authorization": f"Bearer {RefreshToken.for_user(self.admin).access_token}"}
+
+    def sync_get(self, path):
+        with override_settings(ROOT_URLCONF='backend.urls'):
+            return self.client.get(path, headers=self.headers)
+
+    async def test_responses_match_sync_views(self):
+        for path in ["/", "/certifications/", "/certifications/competencies/", "/dashboard/",
+                     "/certifications/?page_size=1"]:
+            with self.subTest(path=path):
+                response = await self.async_client.get(path, headers=self.headers)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response["Content-Type"], "application/json")
+                expected = await sync_to_async(self.sync_get)(path)
+                self.assertEqual(response.json(), expected.json())
+
+    async def test_cursor_links_follow_the_keyset(self):
+        names = []
+        path = "/certifications/?page_size=2"
+        while path:
+            data = (await self.async_client.get(path, headers=self.headers)).json()
+            names += [certification["name"] for certification in data["results"]]
+            path = data["next"]
+        self.assertEqual(names, ["Cert 0", "Cert 1", "Cert 2"])
+        previous = (await self.async_client.get(data["previous"], headers=self.headers)).json()
+        self.assertEqual([certification["name"] for certification in previous["results"]], ["Cert 0", "Cert 1"])
+
+    async def test_cached_token_served_in_event_loop(self):
+        await self.async_client.get("/", headers=self.headers)
+        # Jeton en cache : ni vérification ni chargement de l'utilisateur (qui passeraient par un thread)
+        with mock.patch.object(CachedJWTAuthentication, "authenticate_token", side_effect=AssertionError):
+            response = await self.async_client.get("/", headers=self.headers)
+        self.assertEqual(response.json()["user"], "user")
+
+    async def test_authentication_required(self):
+        response = await self.async_client.get("/certifications/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn("Bearer", response["WWW-Authenticate"])
+        response = await self.async_client.get("/dashboard/", headers={"Authorization": "Bearer invalide"})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.json()["code"], "token_not_valid")
+
+    async def test_writes_are_delegated_to_sync_views(self):
+        response = await self.async_client.post(
+            "/certifications/", {"name": "Cert ASGI"}, content_type="application/json", headers=self.admin_headers
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response = await self.async_client.post(
+            "/certifications/", {"name": "Cert refusée"}, content_type="application/json", headers=self.headers
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(SERVER_TIMING='staff')
+    async def test_server_timing_for_staff_on_async_view(self):
+        response = await self.async_client.get("/certifications/", headers=self.admin_headers)
+        # Authentification (jeton pas encore en cache) + version du catalogue + compilation
+        # de l'instantané (certifications, compétences préchargées, compétences)
+        self.assertIn('desc="SQL (5 queries)"', response.headers["Server-Timing"])
+
+    async def test_conditional_get_matches_sync_views(self):
+        response = await self.async_client.get("/certifications/", headers=self.headers)
+        expected = await sync_to_async(self.sync_get)("/certifications/")
+        self.assertEqual(response["ETag"], expected["ETag"])
+        not_modified = await self.async_client.get(
+            "/certifications/", headers={**self.headers, "If-None-Match": response["ETag"]}
+        )
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
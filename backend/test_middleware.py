@@ -0,0 +1,77 @@
+import io
+import logging
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from certifications.models import Certification
+
+User = get_user_model()
+
+class RequestTimingMiddlewareTests(APITestCase):
+    def setUp(self):
+        cache.clear()  # Validateurs du catalogue relus : nombre de requêtes indépendant de l'ordre des tests
+        self.admin = User.objects.create_superuser(username="admin", email="admin@example.com", password="adminpass")
+        self.user = User.objects.create_user(username="user", email="user@example.com", password="userpass")
+        Certification.objects.create(name="Cert Timing")
+        self.url = "/certifications/"
+
+    def authenticate(self, user):
+        # Vrai jeton JWT : l'utilisateur n'est connu qu'après l'authentification DRF
+        token = RefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_server_timing_header_for_staff(self):
+        self.authenticate(self.admin)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        header = response.headers["Server-Timing"]
+        self.assertIn('db;dur=', header)
+        self.assertIn('serialize;dur=', header)
+        self.assertIn('total;dur=', header)
+        # Authentification + version du catalogue + compilation de l'instantané
+        # (certifications, compétences préchargées, compétences)
+        self.assertIn('desc="SQL (5 queries)"', header)
+
+    def test_server_timing_header_hidden_for_non_staff(self):
+        self.authenticate(self.user)
+        response = self.client.get(self.url)
+        self.assertNotIn("Server-Timing", response.headers)
+
+    @override_settings(SERVER_TIMING='all')
+    def test_server_timing_header_for_everyone_when_enabled(self):
+        self.authenticate(self.user)
+        response = self.client.get(self.url, HTTP_ORIGIN="http://localhost:3000")
+        self.assertIn("Server-Timing", response.headers)
+        self.assertEqual(response.headers["Timing-Allow-Origin"], "http://localhost:3000")
+
+    @override_settings(SERVER_TIMING='off')
+    def test_server_timing_header_disabled(self):
+        self.authenticate(self.admin)
+        response = self.client.get(self.url)
+        self.assertNotIn("Server-Timing", response.headers)
+
+    def test_structured_log_line(self):
+        self.authenticate(self.admin)
+        with self.assertLogs('request_timing', level='INFO') as logs:
+            self.client.get(self.url)
+        self.assertIn('"view": "certification-list-create"', logs.output[0])
+        self.assertIn('"db_queries": 5', logs.output[0])
+
+    def test_structured_log_line_reaches_configured_handler(self):
+        # Le handler déclaré dans settings.LOGGING écrit bien la ligne une fois le logger activé (REQUEST_TIMING_LOG=True)
+        logger = logging.getLogger('request_timing')
+        handler = next(h for h in logger.handlers if h.name == 'request_timing')
+        stream = io.StringIO()
+        self.authenticate(self.admin)
+        previous_level = logger.level
+        logger.setLevel(logging.INFO)  # setLevel vide le cache isEnabledFor du logger
+        self.addCleanup(logger.setLevel, previous_level)
+        with patch.object(handler, 'stream', stream):
+            self.client.get(self.url)
+        self.assertIn('"view": "certification-list-create"', stream.getvalue())
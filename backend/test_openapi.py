@@ -0,0 +1,70 @@
+import json
+import os
+import tempfile
+
+from django.conf import settings
+from django.test import override_settings
+from drf_spectacular.generators import SchemaGenerator
+from drf_spectacular.renderers import OpenApiYamlRenderer
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+import openapi
+
+
+class StaticSchemaTests(APITestCase):
+    url = "/api/schema/"
+
+    def setUp(self):
+        self.directory = self.enterContext(tempfile.TemporaryDirectory())
+        self.path = os.path.join(self.directory, 'schema.yml')
+        with open(self.path, 'w', encoding='utf-8') as fp:
+            fp.write("openapi: 3.0.3\ninfo:\n  title: Schéma pré-généré\n  version: 1.0.0\npaths: {}\n")
+        self.enterContext(override_settings(OPENAPI_SCHEMA_FILE=self.path))
+
+    def test_serves_pregenerated_yaml(self):
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/vnd.oai.openapi; charset=utf-8")
+        with open(self.path, 'rb') as fp:
+            self.assertEqual(response.content, fp.read())
+
+    def test_json_rendered_from_file(self):
+        response = self.client.get(self.url, {"format": "json"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].endswith("json"))
+        self.assertEqual(json.loads(response.content)["info"]["title"], "Schéma pré-généré")
+
+    def test_regenerated_file_is_reloaded(self):
+        self.client.get(self.url)
+        with open(self.path, 'w', encoding='utf-8') as fp:
+            fp.write("openapi: 3.0.3\ninfo:\n  title: Nouvelle version\n  version: 1.0.1\npaths: {}\n")
+        os.utime(self.path, ns=(0, os.stat(self.path).st_mtime_ns + 1))
+        response = self.client.get(self.url)
+        self.assertIn(b"Nouvelle version", response.content)
+
+    def test_missing_file_is_unavailable_outside_debug(self):
+        os.remove(self.path)
+        response = self.client.get(self.url, {"format": "json"})
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertIn("error", response.json())
+
+    @override_settings(DEBUG=True)
+    def test_missing_file_generated_live_in_debug(self):
+        os.remove(self.path)
+        response = self.client.get(self.url, {"format": "json"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["info"]["title"], settings.SPECTACULAR_SETTINGS['TITLE'])
+
+
+class SchemaArtifactTests(APITestCase):
+    def test_committed_schema_is_up_to_date(self):
+        schema = SchemaGenerator().get_schema(request=None, public=True)
+        with open(openapi.schema_file(), 'rb') as fp:
+            committed = fp.read()
+        self.assertEqual(
+            committed,
+            OpenApiYamlRenderer().render(schema, renderer_context={}),
+            "schema.yml obsolète : python manage.py spectacular --file schema.yml",
+        )
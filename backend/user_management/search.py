@@ -0,0 +1,65 @@
+# backend/user_management/search.py
+"""
+Recherche admin des utilisateurs par username / email (insensible à la casse).
+
+Chaque étape est une requête indexée bornée par `limit` :
+1. préfixe sur username, puis préfixe sur email (ordre de l'index, arrêt au LIMIT) ;
+2. sous-chaîne sur username ou email, seulement si le préfixe ne remplit pas la page
+   et que la saisie fait au moins SUBSTRING_MIN_LENGTH caractères.
+
+PostgreSQL : LIKE 'q%' sur lower(champ) text_pattern_ops et LIKE '%q%' sur les index
+trigrammes (pg_trgm, migration authentication 0002).
+SQLite (repli) : le préfixe est une plage [q, q + U+10FFFF[ sur les index lower(champ) ;
+la sous-chaîne n'a pas d'index et parcourt la table (coût linéaire, acceptable en
+développement uniquement). LOWER() de SQLite ne replie que l'ASCII.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Q
+from django.db.models.functions import Lower
+
+User = get_user_model()
+
+SUBSTRING_MIN_LENGTH = 3
+
+# Rang de pertinence, du plus au moins pertinent
+MATCH_RANKS = {'exact': 0, 'username_prefix': 1, 'email_prefix': 2, 'substring': 3}
+
+
+def prefix_filter(queryset, field, query):
+    alias = f'{field}_lower'
+    queryset = queryset.alias(**{alias: Lower(field)})
+    if connection.vendor == 'postgresql':
+        queryset = queryset.filter(**{f'{alias}__startswith': query})
+    else:
+        queryset = queryset.filter(**{f'{alias}__gte': query, f'{alias}__lt': query + '\U0010ffff'})
+    return queryset.order_by(alias)
+
+
+def search_users(query, limit):
+    """Retourne au plus `limit` utilisateurs classés : exact, préfixe username, préfixe email, sous-chaîne"""
+    query = query.strip().lower()
+    base = User.objects.only('id', 'username', 'email')
+    matches = {}
+
+    for field, match in (('username', 'username_prefix'), ('email', 'email_prefix')):
+        for user in prefix_filter(base, field, query)[:limit]:
+            matches.setdefault(user.pk, (user, match))
+
+    if len(matches) < limit and len(query) >= SUBSTRING_MIN_LENGTH:
+        substring = (
+            base.alias(username_lower=Lower('username'), email_lower=Lower('email'))
+            .filter(Q(username_lower__contains=query) | Q(email_lower__contains=query))
+            .exclude(pk__in=list(matches))
+        )
+        for user in substring[:limit - len(matches)]:
+            matches.setdefault(user.pk, (user, 'substring'))
+
+    results = []
+    for user, match in matches.values():
+        if query in (user.username.lower(), user.email.lower()):
+            match = 'exact'
+        results.append({"id": user.pk, "username": user.username, "email": user.email, "match": match})
+    results.sort(key=lambda row: (MATCH_RANKS[row["match"]], len(row["username"]), row["username"].lower()))
+    return results[:limit]
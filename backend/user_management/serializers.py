@@ -22,6 +22,15 @@ class UserListSerializer(serializers.ModelSerializer):
         model = User
         fields = ['id', 'username']
 
+class UserSearchResultSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    username = serializers.CharField()
+    email = serializers.EmailField()
+    match = serializers.ChoiceField(
+        choices=['exact', 'username_prefix', 'email_prefix', 'substring'],
+        help_text="Type de correspondance, du plus au moins pertinent"
+    )
+
 class UserDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
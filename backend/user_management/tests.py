@@ -44,7 +44,7 @@ class UserListTests(APITestCase):
         self.client.force_authenticate(user=self.admin)
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        usernames = [user['username'] for user in response.data]
+        usernames = [user['username'] for user in response.data['results']]
         self.assertIn("user1", usernames)
         self.assertIn("user2", usernames)
 
@@ -52,14 +52,86 @@ class UserListTests(APITestCase):
         self.client.force_authenticate(user=self.admin)
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        usernames = [user['username'] for user in response.data]
+        usernames = [user['username'] for user in response.data['results']]
         self.assertEqual(usernames, sorted(usernames))
 
+    def test_list_users_paginated_by_cursor(self):
+        for i in range(5):
+            User.objects.create_user(username=f"page{i}", email=f"page{i}@example.com", password="pass123")
+        self.client.force_authenticate(user=self.admin)
+        usernames = []
+        url = f"{self.url}?page_size=3"
+        while url:
+            # Une requête par page, sans COUNT ni OFFSET : coût constant quelle que soit la profondeur
+            with self.assertNumQueries(1):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data['results']), 3)
+            usernames += [user['username'] for user in response.data['results']]
+            url = response.data['next']
+        self.assertEqual(usernames, list(User.objects.order_by('username').values_list('username', flat=True)))
+
+    def test_list_users_invalid_cursor(self):
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(self.url, {"cursor": "invalide"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_list_users_failure_non_admin(self):
         self.client.force_authenticate(user=self.user1)
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
+# ----------------------------
+# Tests pour l'opération "Recherche d'utilisateurs" (admin seulement)
+# ----------------------------
+class UserSearchTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(username="admin", email="admin@example.com", password="adminpass")
+        for username, email in [
+            ("Martin", "martin@example.com"),
+            ("martine", "m.dupont@example.com"),
+            ("jdoe", "john.martinez@example.org"),
+            ("alice", "alice@example.com"),
+        ]:
+            User.objects.create_user(username=username, email=email, password="pass123")
+        self.url = reverse('user-search')
+        self.client.force_authenticate(user=self.admin)
+
+    def test_search_ranks_exact_prefix_then_substring(self):
+        response = self.client.get(self.url, {"q": "MARTIN"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(user["username"], user["match"]) for user in response.data],
+            [("Martin", "exact"), ("martine", "username_prefix"), ("jdoe", "substring")],
+        )
+
+    def test_search_by_email_prefix(self):
+        response = self.client.get(self.url, {"q": "m.dup"})
+        self.assertEqual([(user["username"], user["match"]) for user in response.data], [("martine", "email_prefix")])
+
+    def test_search_short_query_skips_substring(self):
+        response = self.client.get(self.url, {"q": "li"})
+        self.assertEqual(response.data, [])
+
+    def test_search_results_are_capped(self):
+        response = self.client.get(self.url, {"q": "example", "limit": 2})
+        self.assertEqual(len(response.data), 2)
+
+    def test_search_invalid_limit(self):
+        for limit in ("abc", 0, 51):
+            response = self.client.get(self.url, {"q": "example", "limit": limit})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("error", response.data)
+
+    def test_search_without_query(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_search_non_admin_forbidden(self):
+        self.client.force_authenticate(user=User.objects.get(username="alice"))
+        response = self.client.get(self.url, {"q": "mar"})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
 # ----------------------------
 # Tests pour l'opération "Détail d'un utilisateur" (admin seulement)
 # ----------------------------
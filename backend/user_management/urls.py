@@ -2,6 +2,7 @@ from django.urls import path
 from .views import (
     UserRegisterView,
     UserListView,
+    UserSearchView,
     UserDetailView,
     UserSelfUpdateView,
     UserAdminUpdateView,
@@ -11,6 +12,7 @@ from .views import (
 urlpatterns = [
     path('register/', UserRegisterView.as_view(), name='user-register'),
     path('users/', UserListView.as_view(), name='user-list'),
+    path('users/search/', UserSearchView.as_view(), name='user-search'),
     path('users/self/', UserSelfUpdateView.as_view(), name='user-self-update'),
     path('users/<int:pk>/', UserDetailView.as_view(), name='user-detail'),
     path('users/<int:pk>/update/', UserAdminUpdateView.as_view(), name='user-admin-update'),
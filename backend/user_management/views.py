@@ -3,9 +3,13 @@ from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 from django.contrib.auth import get_user_model
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from pagination import UsernameKeysetPagination
+from .search import search_users
 from .serializers import (
     UserCreateSerializer,
     UserListSerializer,
+    UserSearchResultSerializer,
     UserDetailSerializer,
     UserSelfUpdateSerializer,
     UserAdminUpdateSerializer,
@@ -24,12 +28,43 @@ class UserRegisterView(generics.CreateAPIView):
 
 class UserListView(generics.ListAPIView):
     """
-    Endpoint pour lister tous les utilisateurs, triés par username.
+    Endpoint pour lister tous les utilisateurs, triés par username et paginés par curseur.
     Accessible uniquement aux administrateurs.
     """
     queryset = User.objects.all().order_by('username')
     serializer_class = UserListSerializer
     permission_classes = [permissions.IsAdminUser]
+    pagination_class = UsernameKeysetPagination
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter('q', str, required=True, description="Début ou partie du username / de l'email"),
+        OpenApiParameter('limit', int, description="Nombre maximal de résultats (défaut : 20, max : 50)"),
+    ],
+    responses=UserSearchResultSerializer(many=True),
+)
+class UserSearchView(APIView):
+    """
+    Endpoint de recherche d'utilisateurs par préfixe ou sous-chaîne du username / de l'email,
+    résultats classés par pertinence et plafonnés (limit hors de [1, 50] : 400).
+    Accessible uniquement aux administrateurs.
+    """
+    permission_classes = [permissions.IsAdminUser]
+    default_limit = 20
+    max_limit = 50
+
+    def get(self, request, *args, **kwargs):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({"error": "Le paramètre q est requis."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            limit = int(request.query_params.get('limit', self.default_limit))
+        except ValueError:
+            return Response({"error": "Le paramètre limit doit être un entier."}, status=status.HTTP_400_BAD_REQUEST)
+        if not 1 <= limit <= self.max_limit:
+            return Response({"error": f"Le paramètre limit doit être compris entre 1 et {self.max_limit}."}, status=status.HTTP_400_BAD_REQUEST)
+        results = search_users(query, limit)
+        return Response(UserSearchResultSerializer(results, many=True).data, status=status.HTTP_200_OK)
 
 class UserDetailView(generics.RetrieveAPIView):
     """